@@ -0,0 +1,60 @@
+"""Benchmark the row-dict and columnar paths of filter_courses.
+
+Loads every topic under ``udemy_data/courses`` once, then times the same
+filter queries against plain course dictionaries (the legacy path, which
+re-parses fields per row) and against the columnar CourseStore (the
+vectorized boolean-mask path).
+
+Usage:
+    python -m benchmarks.bench_filter_courses [--repeat N]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from udemy_gpt.data import get_index, load_all_courses
+from udemy_gpt.services import filter_courses
+
+# Representative filter combinations seen from intent classification
+QUERIES: List[Dict[str, Any]] = [
+    {"min_rating": 4.5},
+    {"max_price": 20},
+    {"is_free": True},
+    {"level": "beginner"},
+    {"min_rating": 4.5, "max_duration": 5},
+    {"min_rating": 4.0, "max_price": 50, "level": "beginner", "min_duration": 2, "max_duration": 20},
+]
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall-clock time of ``repeat`` runs in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query (best is reported)")
+    args = parser.parse_args()
+
+    store = load_all_courses(get_index())
+    rows = [dict(course) for course in store]
+    print(f"Corpus: {len(store)} courses\n")
+
+    print(f"{'filters':<78} {'dict ms':>9} {'store ms':>9} {'speedup':>8}")
+    print("-" * 107)
+    for query in QUERIES:
+        dict_ms = _time(lambda: filter_courses(rows, **query), args.repeat)
+        store_ms = _time(lambda: filter_courses(store, **query), args.repeat)
+        label = ", ".join(f"{k}={v}" for k, v in query.items())
+        print(f"{label:<78} {dict_ms:>9.3f} {store_ms:>9.3f} {dict_ms / store_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
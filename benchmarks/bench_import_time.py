@@ -0,0 +1,102 @@
+"""Measure package import time and guard against eager heavy imports.
+
+Imports each package in a fresh interpreter under ``python -X importtime``
+and parses the report: the package's cumulative import time, its
+slowest dependencies, and whether any module that should load lazily
+(LangChain, LangSmith, LangGraph, OpenAI, Playwright) was imported.
+Exits with status 1 if a lazy module was imported or a package exceeds
+``--budget-ms``, so it can run as a regression check.
+
+Usage:
+    python -m benchmarks.bench_import_time [--repeat N] [--top N] [--budget-ms MS]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PACKAGES: List[str] = ["udemy_gpt", "udemy_agent", "udemy_scraper"]
+
+# Top-level modules that must only load on first LLM call / browser fetch
+LAZY_MODULES: Tuple[str, ...] = (
+    "langchain_openai",
+    "langchain_core",
+    "langgraph",
+    "langsmith",
+    "openai",
+    "playwright",
+    "playwright_stealth",
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _import_profile(package: str) -> Dict[str, Tuple[int, int]]:
+    """Import a package in a fresh interpreter and parse -X importtime.
+
+    Args:
+        package: Package to import
+
+    Returns:
+        Mapping of module name to (self, cumulative) import time in microseconds
+    """
+    env = dict(os.environ, PYTHONPATH=str(_ROOT))
+    # Tracing must be off to see the default import path
+    for name in ("LANGSMITH_TRACING", "LANGCHAIN_TRACING_V2", "LANGCHAIN_TRACING"):
+        env.pop(name, None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {package}"],
+        cwd=_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    profile: Dict[str, Tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            profile[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return profile
+
+
+def main() -> None:
+    """Run the measurement, print a report, and fail on regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Imports per package (best is reported)")
+    parser.add_argument("--top", type=int, default=5, help="Slowest dependencies to list")
+    parser.add_argument("--budget-ms", type=float, default=0, help="Fail above this import time (0 = off)")
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    for package in PACKAGES:
+        profiles = [_import_profile(package) for _ in range(args.repeat)]
+        best = min(profiles, key=lambda p: p.get(package, (0, 0))[1])
+        total_ms = best.get(package, (0, 0))[1] / 1000
+
+        print(f"{package}: {total_ms:.0f} ms")
+        slowest = sorted(
+            ((name, times[0]) for name, times in best.items() if name != package),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:args.top]
+        for name, self_us in slowest:
+            print(f"  {self_us / 1000:>7.1f} ms  {name}")
+
+        eager = sorted({name.split(".")[0] for name in best} & set(LAZY_MODULES))
+        if eager:
+            failures.append(f"{package} imports {', '.join(eager)} eagerly")
+        if args.budget_ms and total_ms > args.budget_ms:
+            failures.append(f"{package} import takes {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+        print()
+
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1)
+    print("OK: no lazy dependency imported at package import")
+
+
+if __name__ == "__main__":
+    main()
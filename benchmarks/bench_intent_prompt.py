@@ -0,0 +1,74 @@
+"""Measure intent-classification prompt size with and without topic shortlisting.
+
+Builds the intent system prompt for a fixed set of user queries twice:
+once with the full topic catalog (the previous behavior) and once with
+the per-message topic shortlist, and reports prompt token counts. Tokens
+are counted with ``tiktoken`` when its encoding is available (it is
+downloaded on first use), otherwise estimated as characters / 4.
+
+Usage:
+    python -m benchmarks.bench_intent_prompt [--limit N]
+"""
+
+import argparse
+from typing import Callable, List
+
+from udemy_gpt.data import TOPIC_SHORTLIST_SIZE, get_topic_list_for_llm, shortlist_topics
+from udemy_gpt.prompts import get_intent_prompt
+
+# Fixed query set covering each intent the classifier handles
+QUERIES: List[str] = [
+    "Find Python courses for beginners",
+    "Top 10 AI courses with rating 4.5+ under 5 hours",
+    "Best free Python courses for beginners",
+    "Machine learning courses under $50",
+    "Compare Python vs JavaScript",
+    "How to become an AI engineer",
+    "Learning path for data science",
+    "What are the top-rated web development courses?",
+    "I want to get better at public speaking and confidence",
+    "Courses on excel and power bi for financial analysis",
+    "Most valuable courses",
+    "Tell me about The Complete Python Bootcamp",
+]
+
+
+def _token_counter() -> Callable[[str], int]:
+    """Get a token counting function (tiktoken if available)."""
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        print(f"tiktoken unavailable ({type(e).__name__}); estimating tokens as chars / 4\n")
+        return lambda text: len(text) // 4
+    return lambda text: len(encoding.encode(text))
+
+
+def main() -> None:
+    """Run the measurement and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--limit", type=int, default=TOPIC_SHORTLIST_SIZE, help="Topics per shortlist"
+    )
+    args = parser.parse_args()
+
+    count_tokens = _token_counter()
+    template = get_intent_prompt()
+    full_tokens = count_tokens(template.format(topic_list=get_topic_list_for_llm()))
+
+    print(f"{'query':<58} {'full':>7} {'short':>7} {'ratio':>7}")
+    print("-" * 82)
+    total_full = total_short = 0
+    for query in QUERIES:
+        topics = shortlist_topics(query, limit=args.limit)
+        short_tokens = count_tokens(template.format(topic_list=get_topic_list_for_llm(topics)))
+        total_full += full_tokens
+        total_short += short_tokens
+        print(f"{query[:58]:<58} {full_tokens:>7} {short_tokens:>7} {full_tokens / short_tokens:>6.1f}x")
+
+    print("-" * 82)
+    print(f"{'total':<58} {total_full:>7} {total_short:>7} {total_full / total_short:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from udemy_agent.config.settings import (
     settings,
     get_paths,
     get_browser_settings,
+    get_detail_cache_settings,
     get_llm_settings,
 )
 
@@ -13,5 +14,6 @@ __all__ = [
     "settings",
     "get_paths",
     "get_browser_settings",
+    "get_detail_cache_settings",
     "get_llm_settings",
 ]
@@ -7,7 +7,17 @@ Environment Variables:
     GROQ_API_KEY: API key for Groq LLM service (required)
     OPENAI_API_KEY: API key for OpenAI (optional)
     LLM_MODEL: Active model name (default: openai-gpt-oss-20b)
+    LLM_MAX_RETRIES: Max attempts for retryable LLM errors (429, 5xx, timeouts)
+    LLM_REQUEST_TIMEOUT: Seconds before an LLM request times out
+    LLM_CIRCUIT_FAILURE_THRESHOLD: Consecutive failures that stop LLM calls (0 = never)
+    LLM_REQUESTS_PER_MINUTE: Request budget per model, shared process-wide
+    LLM_TOKENS_PER_MINUTE: Token budget per model, shared process-wide
+    LLM_RATE_LIMIT_QUEUE: Maximum calls waiting for the rate limiter
     BROWSER_HEADLESS: Run browser in headless mode
+    DETAIL_CACHE_ENABLED: Cache fetched course details (true/false)
+    DETAIL_CACHE_TTL: Seconds cached course details stay fresh (0 = no expiry)
+    DETAIL_CACHE_MAX_STALE: Seconds past the TTL stale details are served while refreshing
+    DETAIL_CACHE_DB_PATH: SQLite file for cached details (default: ./cache/course_details.sqlite3)
     LOG_LEVEL: Logging level
     LANGCHAIN_TRACING_V2: Enable LangSmith tracing
     LANGCHAIN_API_KEY: LangSmith API key
@@ -78,6 +88,15 @@ class LLMSettings(BaseSettings):
     active_model: str = Field(default="openai-gpt-oss-20b")
     default_temperature: float = Field(default=0.1, ge=0.0, le=2.0)
     max_retries: int = Field(default=3, ge=1, le=10)
+    retry_delay: float = Field(default=1.0, ge=0.1)
+    retry_max_delay: float = Field(default=20.0, ge=0.1)
+    request_timeout: float = Field(default=60.0, ge=1.0)
+    circuit_failure_threshold: int = Field(default=5, ge=0)
+    circuit_reset_timeout: float = Field(default=30.0, ge=1.0)
+    requests_per_minute: int = Field(default=30, ge=0)
+    tokens_per_minute: int = Field(default=8000, ge=0)
+    rate_limit_queue: int = Field(default=64, ge=0)
+    completion_token_reserve: int = Field(default=1024, ge=0)
 
     class Config:
         env_prefix = "LLM_"
@@ -115,11 +134,28 @@ class BrowserSettings(BaseSettings):
     timezone: str = Field(default="America/New_York")
     cloudflare_max_wait: int = Field(default=30, ge=5, le=120)
     page_timeout: int = Field(default=30000, ge=5000, le=120000)
+    block_resources: bool = Field(default=True)
+    blocked_resource_types: str = Field(default="image,media,font")
+    allowed_hosts: str = Field(default="udemy.com,udemycdn.com,cloudflare.com")
 
     class Config:
         env_prefix = "BROWSER_"
 
 
+class DetailCacheSettings(BaseSettings):
+    """Live course detail cache settings."""
+
+    enabled: bool = Field(default=True)
+    ttl: float = Field(default=86400.0, ge=0.0)
+    max_stale: float = Field(default=604800.0, ge=0.0)
+    max_entries: int = Field(default=256, ge=1)
+    persist: bool = Field(default=True)
+    db_path: Optional[Path] = Field(default=None)
+
+    class Config:
+        env_prefix = "DETAIL_CACHE_"
+
+
 class TracingSettings(BaseSettings):
     """LangSmith tracing configuration."""
 
@@ -157,6 +193,7 @@ class Settings(BaseSettings):
     paths: PathSettings = Field(default_factory=PathSettings)
     llm: LLMSettings = Field(default_factory=LLMSettings)
     browser: BrowserSettings = Field(default_factory=BrowserSettings)
+    detail_cache: DetailCacheSettings = Field(default_factory=DetailCacheSettings)
     tracing: TracingSettings = Field(default_factory=TracingSettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
 
@@ -179,3 +216,8 @@ def get_llm_settings() -> LLMSettings:
 def get_browser_settings() -> BrowserSettings:
     """Get browser settings."""
     return settings.browser
+
+
+def get_detail_cache_settings() -> DetailCacheSettings:
+    """Get live course detail cache settings."""
+    return settings.detail_cache
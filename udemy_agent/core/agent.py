@@ -3,11 +3,10 @@
 import logging
 from typing import Any, Dict, List, Optional
 
-from langsmith import traceable
-
 from udemy_agent.core.workflows import build_chat_workflow
 from udemy_agent.models import UdemyChatState
 from udemy_agent.services.browser_service import get_browser_service
+from udemy_common import traceable
 
 logger = logging.getLogger("udemy_agent")
 
@@ -28,10 +27,17 @@ class UdemyAgent:
 
     def __init__(self):
         """Initialize the agent."""
-        self.chat_workflow = build_chat_workflow().compile()
+        self._chat_workflow = None
         self.conversation_history: List[Dict[str, str]] = []
         self.last_search_results: Optional[List[Dict[str, Any]]] = None
 
+    @property
+    def chat_workflow(self) -> Any:
+        """Compiled chat workflow, built on first use (imports LangGraph)."""
+        if self._chat_workflow is None:
+            self._chat_workflow = build_chat_workflow().compile()
+        return self._chat_workflow
+
     @traceable(name="udemy_agent_chat", run_type="chain")
     async def chat(self, user_message: str) -> str:
         """Process a user message and return a response.
@@ -4,16 +4,17 @@ import asyncio
 import json
 import logging
 import random
-from typing import Any, Dict, List
-
-from langgraph.graph import END, StateGraph
-from langsmith import traceable
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from udemy_agent.data import BROWSING_PATTERNS, get_action_for_intent
 from udemy_agent.models import UdemyBrowserState
 from udemy_agent.prompts import PROCESS_TEXT_SYSTEM_PROMPT, PROCESS_TEXT_USER_PROMPT
 from udemy_agent.services import get_llm_service
-from udemy_agent.services.browser_service import get_browser_service, STEALTH_AVAILABLE
+from udemy_agent.services.browser_service import get_browser_service, get_detail_cache, STEALTH_AVAILABLE
+from udemy_common import traceable
+
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
 
 logger = logging.getLogger("udemy_agent.workflow.browser")
 
@@ -186,6 +187,11 @@ async def process_text_node(state: UdemyBrowserState) -> dict:
                             course["url"] = url_info["url"]
                             break
 
+        # Listing prices reveal stale cached course details
+        detail_cache = get_detail_cache()
+        if detail_cache is not None and courses:
+            detail_cache.invalidate_changed_prices(courses)
+
         logger.info(f"Extracted {len(courses)} courses")
         return {"extracted_courses": courses, "status": "done"}
 
@@ -214,8 +220,10 @@ def _parse_courses(response_text: str) -> List[Dict[str, Any]]:
         return []
 
 
-def build_browser_workflow() -> StateGraph:
+def build_browser_workflow() -> "StateGraph":
     """Build the Browser Agent workflow."""
+    from langgraph.graph import END, StateGraph
+
     workflow = StateGraph(UdemyBrowserState)
     workflow.add_node("navigate_and_extract", navigate_and_extract_node)
     workflow.add_node("process_text", process_text_node)
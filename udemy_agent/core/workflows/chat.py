@@ -3,10 +3,7 @@
 import json
 import logging
 import re
-from typing import Any, Dict, List, Literal
-
-from langgraph.graph import END, StateGraph
-from langsmith import traceable
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 
 from udemy_agent.data import UDEMY_KNOWLEDGE
 from udemy_agent.models import BrowserFilters, UdemyBrowserState, UdemyChatState
@@ -23,9 +20,13 @@ from udemy_agent.prompts import (
     SYNTHESIZE_SYSTEM_PROMPT,
     SYNTHESIZE_USER_PROMPT,
 )
-from udemy_agent.services import get_llm_service
+from udemy_agent.services import get_detail_cache, get_llm_service
 from udemy_agent.core.workflows.browser import build_browser_workflow
 from udemy_agent.core.workflows.detail import build_course_detail_workflow
+from udemy_common import traceable
+
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
 
 logger = logging.getLogger("udemy_agent.workflow.chat")
 
@@ -274,17 +275,24 @@ async def invoke_browser_node(state: UdemyChatState) -> dict:
         return {"browser_result": {"error": str(e), "status": "error", "courses": []}, "status": "synthesizing"}
 
 
-async def _handle_course_details(state: UdemyChatState) -> dict:
-    """Handle course details request."""
-    course_url = state.target_course_url
-    if not course_url:
-        return {"browser_result": {"error": "No course URL available"}, "status": "synthesizing"}
+async def _fetch_course_details(url: str, objective: str) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Get a course's details, from the detail cache or the detail workflow.
 
-    try:
+    Args:
+        url: Course URL
+        objective: Objective for the detail workflow
+
+    Returns:
+        Tuple of (course details or None, page text; empty when served from cache)
+    """
+    page_text = ""
+
+    async def fetch() -> Optional[Dict[str, Any]]:
+        nonlocal page_text
         browser_state = UdemyBrowserState(
-            objective="Get course details",
+            objective=objective,
             task_type="course_details",
-            course_detail_url=course_url,
+            course_detail_url=url,
         )
 
         detail_graph = get_course_detail_graph()
@@ -299,8 +307,25 @@ async def _handle_course_details(state: UdemyChatState) -> dict:
                         else:
                             final_state.update(node_output)
 
-        course_details = final_state.get("course_details") if final_state else None
-        page_content = final_state.get("page_text", "") if final_state else ""
+        page_text = final_state.get("page_text", "") if final_state else ""
+        details = final_state.get("course_details") if final_state else None
+        # Never cache a record without a title
+        return details if details and details.get("title") else None
+
+    detail_cache = get_detail_cache()
+    if detail_cache is None:
+        return await fetch(), page_text
+    return await detail_cache.get_or_fetch(url, fetch), page_text
+
+
+async def _handle_course_details(state: UdemyChatState) -> dict:
+    """Handle course details request."""
+    course_url = state.target_course_url
+    if not course_url:
+        return {"browser_result": {"error": "No course URL available"}, "status": "synthesizing"}
+
+    try:
+        course_details, page_content = await _fetch_course_details(course_url, "Get course details")
 
         if course_details:
             result = {"status": "done", "course_details": course_details, "current_url": course_url}
@@ -332,25 +357,7 @@ async def _handle_course_comparison(state: UdemyChatState) -> dict:
         course_idx = course_indices[i] if course_indices and i < len(course_indices) else i + 1
 
         try:
-            browser_state = UdemyBrowserState(
-                objective=f"Get details for course {course_idx}",
-                task_type="course_details",
-                course_detail_url=url,
-            )
-
-            detail_graph = get_course_detail_graph()
-            final_state = None
-
-            async for event in detail_graph.astream(browser_state):
-                if isinstance(event, dict):
-                    for node_name, node_output in event.items():
-                        if isinstance(node_output, dict):
-                            if final_state is None:
-                                final_state = node_output
-                            else:
-                                final_state.update(node_output)
-
-            course_details = final_state.get("course_details") if final_state else None
+            course_details, _ = await _fetch_course_details(url, f"Get details for course {course_idx}")
             if course_details:
                 course_details["course_index"] = course_idx
                 course_details["url"] = url
@@ -635,8 +642,10 @@ def route_after_classify(state: UdemyChatState) -> Literal["invoke_browser", "re
     return "respond"
 
 
-def build_chat_workflow() -> StateGraph:
+def build_chat_workflow() -> "StateGraph":
     """Build the Chat Agent (Supervisor) workflow."""
+    from langgraph.graph import END, StateGraph
+
     workflow = StateGraph(UdemyChatState)
     workflow.add_node("classify", classify_node)
     workflow.add_node("invoke_browser", invoke_browser_node)
@@ -4,15 +4,21 @@ import asyncio
 import json
 import logging
 import random
-from typing import Any, Dict, Optional
-
-from langgraph.graph import END, StateGraph
-from langsmith import traceable
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from udemy_agent.models import UdemyBrowserState
-from udemy_agent.prompts import COURSE_DETAIL_SYSTEM_PROMPT, COURSE_DETAIL_USER_PROMPT
+from udemy_agent.prompts import (
+    COURSE_DETAIL_MISSING_FIELDS,
+    COURSE_DETAIL_SYSTEM_PROMPT,
+    COURSE_DETAIL_USER_PROMPT,
+)
 from udemy_agent.services import get_llm_service
 from udemy_agent.services.browser_service import get_browser_service, STEALTH_AVAILABLE
+from udemy_common import traceable
+from udemy_common.course_page import extract_course_page, merge_course_fields, missing_course_fields
+
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
 
 logger = logging.getLogger("udemy_agent.workflow.detail")
 
@@ -56,6 +62,7 @@ async def navigate_and_extract_course_detail(state: UdemyBrowserState) -> dict:
         await page.wait_for_timeout(1000)
 
         page_text = await browser.extract_page_text(page)
+        extracted_details = await extract_course_page(page, page_text)
         current_url = page.url
 
         await page.close()
@@ -63,6 +70,7 @@ async def navigate_and_extract_course_detail(state: UdemyBrowserState) -> dict:
         return {
             "current_url": current_url,
             "page_text": page_text[:80000],
+            "extracted_details": extracted_details,
             "page_type": "course_detail",
             "status": "continue",
         }
@@ -79,9 +87,15 @@ async def navigate_and_extract_course_detail(state: UdemyBrowserState) -> dict:
 
 @traceable(name="process_course_detail", run_type="chain")
 async def process_course_detail_node(state: UdemyBrowserState) -> dict:
-    """Use LLM to extract detailed course information."""
+    """Build course details, using the LLM only for fields extraction missed."""
     logger.info("Processing course detail page...")
 
+    extracted = state.extracted_details or {}
+    missing = missing_course_fields(extracted)
+    if not missing:
+        logger.info("Structured extraction complete, skipping LLM")
+        return {"course_details": {**extracted, "url": state.current_url}, "status": "done"}
+
     llm = get_llm_service()
 
     try:
@@ -90,16 +104,24 @@ async def process_course_detail_node(state: UdemyBrowserState) -> dict:
             url=state.current_url,
             page_text=page_text
         )
+        if extracted:
+            user_prompt += COURSE_DETAIL_MISSING_FIELDS.format(fields=", ".join(missing))
 
         response = await llm.call(COURSE_DETAIL_SYSTEM_PROMPT, user_prompt)
-        details = _parse_course_details(response)
+        details = merge_course_fields(extracted, _parse_course_details(response) or {})
 
-        if details:
-            details["url"] = state.current_url
+        # Without a title this is not a course page (e.g. a challenge or 404)
+        if not details.get("title"):
+            logger.error("Could not extract course details")
+            return {"course_details": None, "status": "done"}
 
+        details["url"] = state.current_url
         return {"course_details": details, "status": "done"}
 
     except Exception as e:
+        if extracted.get("title"):
+            logger.warning(f"LLM extraction failed, keeping structured fields: {e}")
+            return {"course_details": {**extracted, "url": state.current_url}, "status": "done"}
         logger.error(f"Course detail processing error: {e}", exc_info=True)
         return {"course_details": None, "status": "error", "error_message": str(e)}
 
@@ -124,8 +146,10 @@ def _parse_course_details(response_text: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def build_course_detail_workflow() -> StateGraph:
+def build_course_detail_workflow() -> "StateGraph":
     """Build the Course Detail extraction workflow."""
+    from langgraph.graph import END, StateGraph
+
     workflow = StateGraph(UdemyBrowserState)
     workflow.add_node("navigate_course_detail", navigate_and_extract_course_detail)
     workflow.add_node("process_course_detail", process_course_detail_node)
@@ -175,6 +175,10 @@ class UdemyBrowserState(BaseModel):
         default=None,
         description="Detailed course information"
     )
+    extracted_details: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Course fields read from the page structure"
+    )
 
     # Status
     status: BrowserStatus = Field(
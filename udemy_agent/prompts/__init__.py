@@ -10,6 +10,7 @@ from udemy_agent.prompts.templates import (
     # Course details
     COURSE_DETAIL_SYNTHESIZE_PROMPT,
     COURSE_DETAIL_SYNTHESIZE_USER,
+    COURSE_DETAIL_MISSING_FIELDS,
     COURSE_DETAIL_SYSTEM_PROMPT,
     COURSE_DETAIL_USER_PROMPT,
     # Comparison
@@ -32,6 +33,7 @@ __all__ = [
     "SYNTHESIZE_USER_PROMPT",
     "COURSE_DETAIL_SYNTHESIZE_PROMPT",
     "COURSE_DETAIL_SYNTHESIZE_USER",
+    "COURSE_DETAIL_MISSING_FIELDS",
     "COURSE_DETAIL_SYSTEM_PROMPT",
     "COURSE_DETAIL_USER_PROMPT",
     "COMPARISON_SYSTEM_PROMPT",
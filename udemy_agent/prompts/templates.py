@@ -192,6 +192,11 @@ Page Text:
 
 Return a JSON object with all course details."""
 
+COURSE_DETAIL_MISSING_FIELDS = """
+
+These fields could not be read from the page structure: {fields}
+Focus on them; the other fields are already known."""
+
 # Course comparison prompts
 COMPARISON_SYSTEM_PROMPT = """You are a helpful Udemy course comparison assistant.
 The user wants to compare multiple courses side by side.
@@ -1,10 +1,11 @@
 """Services for Udemy Agent."""
 
 from udemy_agent.services.llm_service import LLMService, get_llm_service
-from udemy_agent.services.browser_service import BrowserService
+from udemy_agent.services.browser_service import BrowserService, get_detail_cache
 
 __all__ = [
     "LLMService",
     "get_llm_service",
     "BrowserService",
+    "get_detail_cache",
 ]
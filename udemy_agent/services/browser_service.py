@@ -1,32 +1,23 @@
-"""Browser automation service for Udemy Agent."""
+"""Browser automation service for Udemy Agent.
+
+Playwright is imported when the browser is first started, not at
+import time.
+"""
 
 import asyncio
 import logging
 import random
 import time
-from typing import Dict, List, Optional
-
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from udemy_agent.config import get_browser_settings
+from udemy_agent.config import get_browser_settings, get_detail_cache_settings, get_paths
 from udemy_agent.data import BROWSING_PATTERNS, FILTER_SELECTORS
 from udemy_agent.exceptions import BrowserError, CloudflareBlockedError, PageLoadError
+from udemy_common.browser import STEALTH_AVAILABLE, ResourceBlocker, apply_stealth
+from udemy_common.detail_cache import CourseDetailCache
 
-# Stealth mode detection (v2.0 API with fallback to v1.x)
-_stealth_instance = None
-stealth_async = None
-STEALTH_AVAILABLE = False
-
-try:
-    from playwright_stealth import Stealth
-    _stealth_instance = Stealth()
-    STEALTH_AVAILABLE = True
-except ImportError:
-    try:
-        from playwright_stealth import stealth_async
-        STEALTH_AVAILABLE = True
-    except ImportError:
-        pass
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
 
 logger = logging.getLogger("udemy_agent.browser")
 
@@ -36,20 +27,23 @@ class BrowserService:
 
     def __init__(self):
         self._playwright = None
-        self._browser: Optional[Browser] = None
-        self._context: Optional[BrowserContext] = None
+        self._browser: Optional["Browser"] = None
+        self._context: Optional["BrowserContext"] = None
         self._settings = get_browser_settings()
+        self._blocker = ResourceBlocker.from_settings(self._settings)
 
     @property
     def stealth_available(self) -> bool:
         """Check if stealth mode is available."""
         return STEALTH_AVAILABLE
 
-    async def start(self) -> BrowserContext:
+    async def start(self) -> "BrowserContext":
         """Start browser and create context."""
         if self._browser is not None and self._browser.is_connected():
             return self._context
 
+        from playwright.async_api import async_playwright
+
         self._playwright = await async_playwright().start()
         self._browser = await self._playwright.chromium.launch(
             headless=self._settings.headless,
@@ -94,34 +88,30 @@ class BrowserService:
             await self._playwright.stop()
             self._playwright = None
 
-    async def get_context(self) -> BrowserContext:
+    async def get_context(self) -> "BrowserContext":
         """Get browser context, starting browser if needed."""
         await self.start()
         return self._context
 
-    async def new_page(self) -> Page:
-        """Create a new page with stealth mode applied."""
+    @property
+    def resource_blocker(self) -> Optional[ResourceBlocker]:
+        """Request blocking policy applied to new pages (None if disabled)."""
+        return self._blocker
+
+    async def new_page(self) -> "Page":
+        """Create a new page with stealth mode and request blocking applied."""
         context = await self.get_context()
         page = await context.new_page()
-
-        if STEALTH_AVAILABLE:
-            try:
-                if _stealth_instance:
-                    # v2.0 API
-                    await _stealth_instance.apply_stealth_async(page)
-                elif stealth_async:
-                    # v1.x fallback
-                    await stealth_async(page)
-            except Exception:
-                pass
-
+        await apply_stealth(page)
+        if self._blocker is not None:
+            await self._blocker.attach(page)
         return page
 
     async def human_like_delay(self, min_sec: float = 1.0, max_sec: float = 3.0):
         """Add random delay to simulate human behavior."""
         await asyncio.sleep(random.uniform(min_sec, max_sec))
 
-    async def scroll_page_naturally(self, page: Page):
+    async def scroll_page_naturally(self, page: "Page"):
         """Scroll page like a human would."""
         try:
             for _ in range(2):
@@ -131,7 +121,7 @@ class BrowserService:
         except Exception:
             pass
 
-    async def handle_cloudflare(self, page: Page, max_wait: Optional[int] = None) -> bool:
+    async def handle_cloudflare(self, page: "Page", max_wait: Optional[int] = None) -> bool:
         """Handle Cloudflare challenge page.
 
         Args:
@@ -169,7 +159,7 @@ class BrowserService:
 
     async def safe_goto(
         self,
-        page: Page,
+        page: "Page",
         url: str,
         timeout: Optional[int] = None,
         retries: int = 3
@@ -218,7 +208,7 @@ class BrowserService:
 
         return False
 
-    async def extract_page_text(self, page: Page) -> str:
+    async def extract_page_text(self, page: "Page") -> str:
         """Extract all visible text from page.
 
         Args:
@@ -250,7 +240,7 @@ class BrowserService:
             }
         """)
 
-    async def extract_course_urls(self, page: Page) -> List[Dict[str, str]]:
+    async def extract_course_urls(self, page: "Page") -> List[Dict[str, str]]:
         """Extract course URLs and titles from a Udemy listing page.
 
         Args:
@@ -293,7 +283,7 @@ class BrowserService:
             }
         """)
 
-    async def apply_filter(self, page: Page, filter_type: str, filter_value: str) -> bool:
+    async def apply_filter(self, page: "Page", filter_type: str, filter_value: str) -> bool:
         """Apply a specific filter on the Udemy page.
 
         Args:
@@ -340,7 +330,7 @@ class BrowserService:
             logger.warning(f"Error applying {filter_type} filter: {e}")
             return False
 
-    async def change_sort_option(self, page: Page, target_sort: str) -> bool:
+    async def change_sort_option(self, page: "Page", target_sort: str) -> bool:
         """Change the sort dropdown on Udemy to the specified option.
 
         Args:
@@ -390,7 +380,7 @@ class BrowserService:
             logger.warning(f"Error changing sort: {e}")
             return False
 
-    async def load_more_courses(self, page: Page, target_count: int, current_count: int) -> int:
+    async def load_more_courses(self, page: "Page", target_count: int, current_count: int) -> int:
         """Click Show more button to load additional courses.
 
         Args:
@@ -430,7 +420,7 @@ class BrowserService:
 
     async def click_expand_buttons(
         self,
-        page: Page,
+        page: "Page",
         selectors: List[str],
         max_clicks: int = 5
     ) -> int:
@@ -471,6 +461,7 @@ class BrowserService:
 
 # Global service instance
 _browser_service: Optional[BrowserService] = None
+_detail_cache: Optional[CourseDetailCache] = None
 
 
 def get_browser_service() -> BrowserService:
@@ -479,3 +470,29 @@ def get_browser_service() -> BrowserService:
     if _browser_service is None:
         _browser_service = BrowserService()
     return _browser_service
+
+
+def get_detail_cache() -> Optional[CourseDetailCache]:
+    """Get the course detail cache.
+
+    Returns:
+        Shared CourseDetailCache, or None if detail caching is disabled
+    """
+    global _detail_cache
+
+    cache_settings = get_detail_cache_settings()
+    if not cache_settings.enabled:
+        return None
+
+    if _detail_cache is None:
+        db_path = None
+        if cache_settings.persist:
+            db_path = cache_settings.db_path or get_paths().base_dir / "cache" / "course_details.sqlite3"
+        _detail_cache = CourseDetailCache(
+            ttl=cache_settings.ttl,
+            max_stale=cache_settings.max_stale,
+            max_entries=cache_settings.max_entries,
+            db_path=db_path,
+            namespace="udemy_agent",
+        )
+    return _detail_cache
@@ -1,14 +1,31 @@
-"""LLM service for Udemy Agent."""
+"""LLM service for Udemy Agent.
 
-import logging
-from typing import Dict, Optional
+``langchain_openai`` is imported when the first client is created, not
+at import time.
+"""
 
-from langchain_openai import ChatOpenAI
-from langsmith import traceable
+import logging
+from typing import TYPE_CHECKING, Dict, Optional
 
 from udemy_agent.config import get_llm_settings
+from udemy_common import (
+    AsyncRateLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimitQueueFull,
+    RetryPolicy,
+    estimate_message_tokens,
+    get_circuit_breaker,
+    get_rate_limiter,
+    limiter_key,
+    traceable,
+    usage_tokens,
+)
 from udemy_agent.exceptions import LLMError
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 logger = logging.getLogger("udemy_agent.llm")
 
 
@@ -16,10 +33,48 @@ class LLMService:
     """Manages LLM clients and calls."""
 
     def __init__(self):
-        self._clients: Dict[str, ChatOpenAI] = {}
+        self._clients: Dict[str, "ChatOpenAI"] = {}
         self._settings = get_llm_settings()
+        self._retry = RetryPolicy(
+            max_attempts=self._settings.max_retries,
+            base_delay=self._settings.retry_delay,
+            max_delay=self._settings.retry_max_delay,
+        )
+
+    def get_rate_limiter(self, model_name: Optional[str] = None) -> AsyncRateLimiter:
+        """Get the process-wide rate limiter for the specified model.
+
+        Args:
+            model_name: Model name (uses active model if not specified)
+
+        Returns:
+            Rate limiter shared by every caller of the model's endpoint
+        """
+        config = self._settings.get_model_config(model_name)
+        return get_rate_limiter(
+            limiter_key(config["base_url"], config["model"]),
+            requests_per_minute=self._settings.requests_per_minute,
+            tokens_per_minute=self._settings.tokens_per_minute,
+            max_queue=self._settings.rate_limit_queue,
+        )
+
+    def get_circuit_breaker(self, model_name: Optional[str] = None) -> CircuitBreaker:
+        """Get the process-wide circuit breaker for the specified model.
 
-    def get_client(self, model_name: Optional[str] = None) -> ChatOpenAI:
+        Args:
+            model_name: Model name (uses active model if not specified)
+
+        Returns:
+            Circuit breaker shared by every caller of the model's endpoint
+        """
+        config = self._settings.get_model_config(model_name)
+        return get_circuit_breaker(
+            limiter_key(config["base_url"], config["model"]),
+            failure_threshold=self._settings.circuit_failure_threshold,
+            reset_timeout=self._settings.circuit_reset_timeout,
+        )
+
+    def get_client(self, model_name: Optional[str] = None) -> "ChatOpenAI":
         """Get or create a ChatOpenAI client for the specified model.
 
         Args:
@@ -37,10 +92,15 @@ class LLMService:
             config = self._settings.get_model_config(model_name)
             api_key = self._settings.get_api_key(model_name)
 
+            from langchain_openai import ChatOpenAI
+
             client = ChatOpenAI(
                 base_url=config["base_url"],
                 api_key=api_key,
                 model=config["model"],
+                timeout=self._settings.request_timeout,
+                # Retries are handled by LLMService's retry policy
+                max_retries=0,
             )
 
             self._clients[model_name] = client
@@ -68,6 +128,10 @@ class LLMService:
 
         Returns:
             LLM response content
+
+        Raises:
+            LLMError: If the call fails after retries, is not retryable,
+                or the circuit is open
         """
         temperature = temperature if temperature is not None else self._settings.default_temperature
         client = self.get_client(model_name)
@@ -77,9 +141,25 @@ class LLMService:
             {"role": "user", "content": user_prompt},
         ]
 
-        try:
+        limiter = self.get_rate_limiter(model_name)
+        tokens = estimate_message_tokens(messages) + self._settings.completion_token_reserve
+
+        async def attempt() -> str:
+            try:
+                permit = await limiter.acquire(tokens)
+            except RateLimitQueueFull as e:
+                raise LLMError(f"LLM call rejected: {e}")
             response = await client.ainvoke(messages, temperature=temperature)
+            permit.settle(usage_tokens(response))
             return response.content
+
+        try:
+            return await self._retry.call(attempt, self.get_circuit_breaker(model_name))
+        except CircuitOpenError as e:
+            logger.warning(f"LLM call skipped: {e}")
+            raise LLMError(f"LLM unavailable: {e}")
+        except LLMError:
+            raise
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
             raise LLMError(f"LLM call failed: {e}")
@@ -0,0 +1,83 @@
+"""Shared infrastructure for the Udemy packages.
+
+Code used by more than one of ``udemy_gpt``, ``udemy_agent`` and
+``udemy_scraper`` that must behave identically (and share state) across
+them, such as the process-wide LLM rate limiter and circuit breakers,
+the lazily loaded tracing decorator, browser request blocking,
+structured course page extraction, and the course detail cache.
+"""
+
+from udemy_common.browser import BlockStats, ResourceBlocker
+from udemy_common.course_page import (
+    ESSENTIAL_COURSE_FIELDS,
+    extract_course_page,
+    merge_course_fields,
+    missing_course_fields,
+    parse_course_page,
+)
+from udemy_common.detail_cache import CourseDetailCache, normalize_course_url, parse_price
+from udemy_common.rate_limiter import (
+    AsyncRateLimiter,
+    RateLimitQueueFull,
+    RatePermit,
+    TokenBucket,
+    estimate_message_tokens,
+    get_rate_limiter,
+    get_rate_limiter_stats,
+    limiter_key,
+    reset_rate_limiters,
+    usage_tokens,
+)
+from udemy_common.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ErrorKind,
+    RetryPolicy,
+    classify_error,
+    get_circuit_breaker,
+    get_circuit_breaker_stats,
+    reset_circuit_breakers,
+    retry_after,
+)
+from udemy_common.tracing import current_run_tree, traceable, tracing_enabled
+
+__all__ = [
+    # Browser
+    "BlockStats",
+    "ResourceBlocker",
+    # Course page extraction
+    "ESSENTIAL_COURSE_FIELDS",
+    "extract_course_page",
+    "merge_course_fields",
+    "missing_course_fields",
+    "parse_course_page",
+    # Course detail cache
+    "CourseDetailCache",
+    "normalize_course_url",
+    "parse_price",
+    # Rate limiting
+    "AsyncRateLimiter",
+    "RateLimitQueueFull",
+    "RatePermit",
+    "TokenBucket",
+    "estimate_message_tokens",
+    "get_rate_limiter",
+    "get_rate_limiter_stats",
+    "limiter_key",
+    "reset_rate_limiters",
+    "usage_tokens",
+    # Resilience
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ErrorKind",
+    "RetryPolicy",
+    "classify_error",
+    "get_circuit_breaker",
+    "get_circuit_breaker_stats",
+    "reset_circuit_breakers",
+    "retry_after",
+    # Tracing
+    "current_run_tree",
+    "traceable",
+    "tracing_enabled",
+]
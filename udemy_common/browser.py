@@ -0,0 +1,245 @@
+"""Browser helpers shared by the Playwright-based packages.
+
+``playwright_stealth`` imports Playwright itself, so it is only loaded
+when the first page is made stealthy; checking whether it is installed
+does not import it.
+
+``ResourceBlocker`` aborts requests the packages never read (images,
+media, fonts, and anything from hosts outside an allowlist, such as
+analytics and ad scripts), since they only use page text and DOM.
+"""
+
+import importlib.util
+import logging
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+STEALTH_AVAILABLE = importlib.util.find_spec("playwright_stealth") is not None
+
+# Stealth applier, resolved on first use (v2.0 API with fallback to v1.x)
+_stealth: Optional[Any] = None
+
+
+def _get_stealth() -> Optional[Any]:
+    """Get an async callable that applies stealth mode to a page."""
+    global _stealth
+
+    if _stealth is None and STEALTH_AVAILABLE:
+        try:
+            from playwright_stealth import Stealth
+            _stealth = Stealth().apply_stealth_async
+        except ImportError:
+            try:
+                from playwright_stealth import stealth_async
+                _stealth = stealth_async
+            except ImportError:
+                logger.debug("playwright_stealth has no supported API")
+    return _stealth
+
+
+async def apply_stealth(page: Any) -> bool:
+    """Apply stealth mode to a page if playwright_stealth is installed.
+
+    Args:
+        page: Playwright page
+
+    Returns:
+        True if stealth mode was applied
+    """
+    stealth = _get_stealth()
+    if stealth is None:
+        return False
+    try:
+        await stealth(page)
+        return True
+    except Exception as e:
+        logger.debug(f"Stealth application failed: {e}")
+        return False
+
+
+# =============================================================================
+# Resource Blocking
+# =============================================================================
+
+# Typical transfer size per resource type, used to estimate bytes saved
+# (a blocked request never reports its size)
+_ESTIMATED_BYTES: Dict[str, int] = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 30_000,
+    "script": 60_000,
+    "stylesheet": 20_000,
+    "document": 50_000,
+}
+_DEFAULT_ESTIMATED_BYTES = 5_000
+
+
+def _split_csv(value: Any) -> FrozenSet[str]:
+    """Parse a comma-separated setting (or an iterable) into a set."""
+    items = value.split(",") if isinstance(value, str) else (value or ())
+    return frozenset(item.strip().lower() for item in items if item.strip())
+
+
+@dataclass
+class BlockStats:
+    """Requests blocked during one navigation (or in total)."""
+
+    requests: int = 0
+    bytes_saved: int = 0
+    by_type: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, resource_type: str) -> None:
+        """Record one blocked request."""
+        self.requests += 1
+        self.bytes_saved += _ESTIMATED_BYTES.get(resource_type, _DEFAULT_ESTIMATED_BYTES)
+        self.by_type[resource_type] = self.by_type.get(resource_type, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary."""
+        return {"requests": self.requests, "bytes_saved": self.bytes_saved, "by_type": dict(self.by_type)}
+
+
+class ResourceBlocker:
+    """Aborts page requests by resource type and host allowlist.
+
+    Blocked requests are counted per page and reported (logged) each time
+    the page's main frame navigates or the page closes, so every
+    navigation gets its own count. Bytes saved are estimated from
+    typical sizes per resource type.
+
+    Example:
+        ```python
+        blocker = ResourceBlocker(["image", "font"], ["udemy.com"])
+        page = await context.new_page()
+        await blocker.attach(page)
+        ```
+    """
+
+    def __init__(self, blocked_types: Iterable[str], allowed_hosts: Iterable[str] = ()):
+        """Initialize the policy.
+
+        Args:
+            blocked_types: Playwright resource types to abort
+                (e.g. "image", "media", "font")
+            allowed_hosts: Domains whose requests may load; subdomains
+                match. Requests to any other host are aborted. Empty
+                allows every host.
+        """
+        self.blocked_types = _split_csv(blocked_types)
+        self.allowed_hosts = _split_csv(allowed_hosts)
+        self.total = BlockStats()
+        self.navigations = 0
+        self._current: "weakref.WeakKeyDictionary[Any, BlockStats]" = weakref.WeakKeyDictionary()
+        self._urls: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def from_settings(cls, browser_settings: Any) -> Optional["ResourceBlocker"]:
+        """Build a blocker from a package's browser settings.
+
+        Args:
+            browser_settings: Settings with ``block_resources``,
+                ``blocked_resource_types`` and ``allowed_hosts``
+
+        Returns:
+            ResourceBlocker, or None if blocking is disabled
+        """
+        if not browser_settings.block_resources:
+            return None
+        return cls(browser_settings.blocked_resource_types, browser_settings.allowed_hosts)
+
+    def host_allowed(self, url: str) -> bool:
+        """Check whether a URL's host is on the allowlist.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            True if the host may load (or the URL has no host, e.g. data:)
+        """
+        if not self.allowed_hosts:
+            return True
+        host = (urlsplit(url).hostname or "").lower()
+        if not host:
+            return True
+        return any(host == allowed or host.endswith("." + allowed) for allowed in self.allowed_hosts)
+
+    def should_block(self, resource_type: str, url: str, main_navigation: bool = False) -> bool:
+        """Decide whether to abort a request.
+
+        Args:
+            resource_type: Playwright resource type
+            url: Request URL
+            main_navigation: Whether this is the page's own document
+
+        Returns:
+            True if the request should be aborted
+        """
+        if main_navigation:
+            return False
+        return resource_type in self.blocked_types or not self.host_allowed(url)
+
+    async def attach(self, page: Any) -> None:
+        """Install request interception and navigation reporting on a page.
+
+        Args:
+            page: Playwright page
+        """
+        self._current[page] = BlockStats()
+
+        async def handle(route: Any) -> None:
+            request = route.request
+            try:
+                main_navigation = request.is_navigation_request() and request.frame.parent_frame is None
+            except Exception:
+                main_navigation = False
+            if self.should_block(request.resource_type, request.url, main_navigation):
+                stats = self._current.get(page)
+                if stats is not None:
+                    stats.add(request.resource_type)
+                self.total.add(request.resource_type)
+                await route.abort("blockedbyclient")
+            else:
+                await route.continue_()
+
+        def on_navigated(frame: Any) -> None:
+            if frame.parent_frame is None:
+                self.report(page)
+                self._urls[page] = frame.url
+
+        await page.route("**/*", handle)
+        page.on("framenavigated", on_navigated)
+        page.on("close", lambda _page: self.report(page))
+
+    def report(self, page: Any) -> BlockStats:
+        """Log and reset the blocked-request count of a page's current navigation.
+
+        Args:
+            page: Playwright page passed to ``attach``
+
+        Returns:
+            Requests blocked since the page's last navigation
+        """
+        stats = self._current.get(page) or BlockStats()
+        if page in self._current:
+            self._current[page] = BlockStats()
+        if stats.requests:
+            self.navigations += 1
+            url = self._urls.get(page, "page")
+            logger.info(
+                f"Blocked {stats.requests} requests (~{stats.bytes_saved / 1024:.0f} KB) "
+                f"loading {url}: {stats.by_type}"
+            )
+        return stats
+
+    def stats(self) -> Dict[str, Any]:
+        """Get totals across all pages.
+
+        Returns:
+            Dictionary with blocked requests, estimated bytes saved, counts
+            per resource type, and navigations that blocked anything
+        """
+        return {**self.total.to_dict(), "navigations": self.navigations}
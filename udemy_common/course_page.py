@@ -0,0 +1,407 @@
+"""Deterministic extraction of Udemy course landing pages.
+
+Reads a course page's structure instead of asking an LLM to rebuild it
+from visible text. Sources are tried in order, and each fills only the
+fields the previous ones left empty:
+
+1. ``data-purpose`` elements (displayed header, price and instructor values)
+2. Section headings with list items ("What you'll learn", "Requirements", ...)
+3. Bootstrapped JSON state in ``data-module-args`` attributes
+4. Embedded JSON-LD (``schema.org/Course``)
+5. Patterns in the visible page text ("23 sections", "4.6 Instructor Rating", ...)
+
+Values are formatted the way the page shows them (e.g. "4.6",
+"555,792 ratings") and keyed by the ``CourseDetails`` field names of
+``udemy_gpt``. Callers ask an LLM only for ``missing_course_fields``.
+"""
+
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Fields a detail answer needs; fields a course may legitimately lack
+# (original price, coding exercises, reviews, ...) are not required
+ESSENTIAL_COURSE_FIELDS: Sequence[str] = (
+    "title", "rating", "ratings_count", "students", "created_by", "last_updated",
+    "language", "level", "price", "objectives", "duration", "sections_count",
+    "lectures_count", "total_length", "curriculum", "requirements", "description",
+    "target_audience", "instructor_name",
+)
+
+_LIST_FIELDS = ("objectives", "curriculum", "requirements", "target_audience", "reviews")
+_DICT_FIELDS = ("rating_breakdown",)
+_TEXT_FIELDS = (
+    "title", "subtitle", "rating", "ratings_count", "students", "created_by", "last_updated",
+    "language", "level", "price", "original_price", "duration", "articles", "resources",
+    "coding_exercises", "certificate", "sections_count", "lectures_count", "total_length",
+    "description", "instructor_name", "instructor_title", "instructor_rating",
+    "instructor_reviews", "instructor_students", "instructor_courses", "instructor_bio",
+    "course_rating",
+)
+
+# Collects the page's structured sources in one round trip
+COURSE_PAGE_SCRIPT = """
+    () => {
+        const text = (el) => (el ? (el.innerText || el.textContent || '') : '').replace(/\\s+/g, ' ').trim();
+        const parse = (value) => { try { return JSON.parse(value); } catch (e) { return null; } };
+
+        const jsonLd = Array.from(document.querySelectorAll('script[type="application/ld+json"]'))
+            .map((s) => parse(s.textContent)).filter(Boolean);
+        const state = Array.from(document.querySelectorAll('[data-module-args]'))
+            .map((el) => parse(el.getAttribute('data-module-args'))).filter(Boolean);
+
+        const purpose = {};
+        for (const el of document.querySelectorAll('[data-purpose]')) {
+            const key = el.getAttribute('data-purpose');
+            if (!(key in purpose)) purpose[key] = text(el).slice(0, 20000);
+        }
+
+        const lists = {};
+        for (const heading of document.querySelectorAll('h2, h3')) {
+            const title = text(heading);
+            if (!title || title in lists) continue;
+            let box = heading.parentElement;
+            for (let i = 0; i < 3 && box && !box.querySelector('li'); i++) box = box.parentElement;
+            if (box) lists[title] = Array.from(box.querySelectorAll('li')).map(text).filter(Boolean).slice(0, 200);
+        }
+
+        const curriculum = Array.from(document.querySelectorAll(
+            '[data-purpose="section-panel"], [class*="section--panel"]'
+        )).map((panel) => ({
+            title: text(panel.querySelector('[data-purpose="section-title"], [class*="section--section-title"]')),
+            stats: text(panel.querySelector('[data-purpose="section-content"], [class*="section--section-content"]')),
+        })).filter((section) => section.title);
+
+        return {json_ld: jsonLd, state: state, purpose: purpose, lists: lists, curriculum: curriculum};
+    }
+"""
+
+# data-purpose attribute -> (field, label prefix to strip)
+_PURPOSE_FIELDS = (
+    ("lead-title", "title", ""),
+    ("lead-headline", "subtitle", ""),
+    ("rating-number", "rating", ""),
+    ("enrollment", "students", ""),
+    ("instructor-name-top", "created_by", "Created by"),
+    ("last-update-date", "last_updated", "Last updated"),
+    ("lead-course-locale", "language", ""),
+    ("course-price-text", "price", "Current price:?"),
+    ("original-price-container", "original_price", "Original Price:?"),
+    ("course-old-price-text", "original_price", "Original Price:?"),
+    ("safely-set-inner-html:description:description", "description", ""),
+    ("course-description", "description", ""),
+    ("instructor-name", "instructor_name", ""),
+    ("instructor-bio", "instructor_bio", ""),
+)
+
+# Section heading prefix -> list field
+_HEADING_LISTS = (
+    ("What you'll learn", "objectives"),
+    ("Requirements", "requirements"),
+    ("Who this course is for", "target_audience"),
+)
+
+# Patterns in visible text: field -> (regex, format of the match)
+_TEXT_PATTERNS = (
+    ("rating", r"Rating: ([0-5](?:\.\d)?) out of 5", "{0}"),
+    ("ratings_count", r"\(?([\d.,]+[KM]?) ratings\b", "{0} ratings"),
+    ("students", r"([\d,]+) students\b", "{0} students"),
+    ("created_by", r"Created by (.{2,200}?) Last updated", "{0}"),
+    ("last_updated", r"Last updated (\d{1,2}/\d{4})", "{0}"),
+    ("level", r"Skill level:? (All Levels|Beginner|Intermediate|Expert)", "{0}"),
+    ("price", r"Current price:? ?(\$[\d.,]+|Free)", "{0}"),
+    ("original_price", r"Original Price:? ?(\$[\d.,]+)", "{0}"),
+    ("duration", r"([\d.]+ (?:total )?hours? on-demand video)", "{0}"),
+    ("articles", r"\b(\d+ articles?)\b", "{0}"),
+    ("resources", r"\b(\d+ downloadable resources?)\b", "{0}"),
+    ("coding_exercises", r"\b(\d+ coding exercises?|Coding exercises)\b", "{0}"),
+    ("certificate", r"\b(Certificate of completion)\b", "{0}"),
+    ("sections_count", r"\b(\d+) sections\b", "{0} sections"),
+    ("lectures_count", r"\b(\d+) lectures\b", "{0} lectures"),
+    ("total_length", r"((?:\d+h )?\d+m) total length", "{0} total length"),
+    ("course_rating", r"([0-5]\.\d) course rating", "{0} course rating"),
+    ("instructor_rating", r"([0-5]\.\d) Instructor Rating", "{0} Instructor Rating"),
+)
+
+# Instructor stats follow "Instructor Rating" in the instructor section
+_INSTRUCTOR_PATTERNS = (
+    ("instructor_reviews", r"([\d,]+) Reviews", "{0} Reviews"),
+    ("instructor_students", r"([\d,]+) Students", "{0} Students"),
+    ("instructor_courses", r"([\d,]+) Courses", "{0} Courses"),
+)
+
+_LEVELS = {
+    "all levels": "All Levels", "beginner": "Beginner", "intermediate": "Intermediate",
+    "expert": "Expert", "advanced": "Advanced",
+}
+
+
+def empty_course_fields() -> Dict[str, Any]:
+    """Get a course detail dict with every field empty."""
+    details: Dict[str, Any] = {name: "" for name in _TEXT_FIELDS}
+    details.update({name: [] for name in _LIST_FIELDS})
+    details.update({name: {} for name in _DICT_FIELDS})
+    return details
+
+
+def missing_course_fields(
+    details: Dict[str, Any],
+    fields: Iterable[str] = ESSENTIAL_COURSE_FIELDS,
+) -> List[str]:
+    """List the fields still empty.
+
+    Args:
+        details: Course detail dict
+        fields: Fields to check
+
+    Returns:
+        Names of empty fields, in the order given
+    """
+    return [name for name in fields if not details.get(name)]
+
+
+def merge_course_fields(primary: Dict[str, Any], fallback: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill a detail dict's empty fields from another.
+
+    Args:
+        primary: Details whose non-empty values win (e.g. extracted)
+        fallback: Details filling the gaps (e.g. from the LLM)
+
+    Returns:
+        Merged details
+    """
+    merged = {name: value for name, value in fallback.items() if value is not None}
+    merged.update({name: value for name, value in primary.items() if value})
+    for name, value in primary.items():
+        merged.setdefault(name, value)
+    return merged
+
+
+async def extract_course_page(page: Any, page_text: str = "") -> Dict[str, Any]:
+    """Extract course details from a loaded course page.
+
+    Args:
+        page: Playwright page showing a course landing page
+        page_text: The page's visible text, if already read
+
+    Returns:
+        Course detail dict (empty fields where nothing was found)
+    """
+    try:
+        raw = await page.evaluate(COURSE_PAGE_SCRIPT)
+    except Exception as e:
+        logger.warning(f"Structured course extraction failed: {e}")
+        raw = {}
+    return parse_course_page(raw or {}, page_text)
+
+
+def parse_course_page(raw: Dict[str, Any], page_text: str = "") -> Dict[str, Any]:
+    """Map collected page sources to course detail fields.
+
+    Args:
+        raw: Output of ``COURSE_PAGE_SCRIPT``
+        page_text: The page's visible text
+
+    Returns:
+        Course detail dict (empty fields where nothing was found)
+    """
+    details = empty_course_fields()
+    _from_purpose(details, raw.get("purpose") or {})
+    _from_lists(details, raw.get("lists") or {}, raw.get("curriculum") or [])
+    _from_state(details, raw.get("state") or [])
+    _from_json_ld(details, raw.get("json_ld") or [])
+    _from_text(details, " ".join(page_text.split()))
+
+    found = len(details) - len(missing_course_fields(details, details))
+    logger.debug(f"Structured extraction filled {found}/{len(details)} fields")
+    return details
+
+
+# =============================================================================
+# Sources
+# =============================================================================
+
+def _fill(details: Dict[str, Any], name: str, value: Any) -> None:
+    """Set a field if it is still empty and the value is not."""
+    if details.get(name) or value in (None, "", [], {}):
+        return
+    details[name] = value.strip() if isinstance(value, str) else value
+
+
+def _from_purpose(details: Dict[str, Any], purpose: Dict[str, str]) -> None:
+    """Fill fields from data-purpose elements."""
+    for key, name, prefix in _PURPOSE_FIELDS:
+        value = purpose.get(key, "")
+        if prefix:
+            value = re.sub(rf"^\s*{prefix}\s*", "", value, flags=re.IGNORECASE)
+        _fill(details, name, value)
+
+    # Descriptions may use another data-purpose variant
+    if not details["description"]:
+        for key, value in purpose.items():
+            if "description:description" in key:
+                _fill(details, "description", value)
+                break
+
+
+def _from_lists(details: Dict[str, Any], lists: Dict[str, List[str]], curriculum: List[Dict[str, str]]) -> None:
+    """Fill list fields from section headings and curriculum panels."""
+    for heading, items in lists.items():
+        for prefix, name in _HEADING_LISTS:
+            if heading.lower().startswith(prefix.lower()):
+                _fill(details, name, [item for item in items if item])
+
+    sections = []
+    for section in curriculum:
+        stats = section.get("stats", "")
+        lectures = re.search(r"(\d+) lectures?", stats)
+        duration = re.search(r"(\d+\s*hr?s?\s*\d*\s*min|\d+\s*min|\d+h\s*\d*m?)", stats)
+        sections.append({
+            "title": section.get("title", ""),
+            "lectures": f"{lectures.group(1)} lectures" if lectures else "",
+            "duration": duration.group(1) if duration else "",
+        })
+    _fill(details, "curriculum", sections)
+
+
+def _find_key(value: Any, key: str, depth: int = 0) -> Any:
+    """Find the first non-empty value of a key in nested JSON."""
+    if depth > 12:
+        return None
+    if isinstance(value, dict):
+        found = value.get(key)
+        if found not in (None, "", [], {}):
+            return found
+        children = value.values()
+    elif isinstance(value, list):
+        children = value
+    else:
+        return None
+    for child in children:
+        found = _find_key(child, key, depth + 1)
+        if found is not None:
+            return found
+    return None
+
+
+def _format_count(value: Any, unit: str) -> str:
+    """Format a count like the page does ("2,127,487 students")."""
+    try:
+        return f"{int(value):,} {unit}"
+    except (TypeError, ValueError):
+        return ""
+
+
+def _format_rating(value: Any) -> str:
+    """Format a rating to one decimal place."""
+    try:
+        return f"{float(value):.1f}"
+    except (TypeError, ValueError):
+        return ""
+
+
+def _format_update_date(value: Any) -> str:
+    """Format an ISO date as the page's "M/YYYY"."""
+    try:
+        date = datetime.fromisoformat(str(value)[:10])
+    except ValueError:
+        return ""
+    return f"{date.month}/{date.year}"
+
+
+def _from_state(details: Dict[str, Any], state: List[Any]) -> None:
+    """Fill fields from bootstrapped page state (Udemy API field names)."""
+    if not state:
+        return
+    _fill(details, "subtitle", _find_key(state, "headline"))
+    _fill(details, "students", _format_count(_find_key(state, "num_subscribers"), "students"))
+    _fill(details, "ratings_count", _format_count(_find_key(state, "num_reviews"), "ratings"))
+    _fill(details, "rating", _format_rating(_find_key(state, "avg_rating_recent") or _find_key(state, "avg_rating")))
+    _fill(details, "lectures_count", _format_count(_find_key(state, "num_lectures"), "lectures"))
+    _fill(details, "duration", _find_key(state, "content_info"))
+    _fill(details, "last_updated", _format_update_date(_find_key(state, "last_update_date")))
+
+    level = _find_key(state, "instructional_level_simple") or _find_key(state, "instructional_level")
+    if isinstance(level, str):
+        _fill(details, "level", _LEVELS.get(level.lower(), level))
+
+    locale = _find_key(state, "locale")
+    if isinstance(locale, dict):
+        _fill(details, "language", locale.get("simple_english_title") or locale.get("title"))
+
+    instructors = _find_key(state, "visible_instructors")
+    if isinstance(instructors, list) and instructors and isinstance(instructors[0], dict):
+        names = [i.get("display_name") or i.get("title", "") for i in instructors if isinstance(i, dict)]
+        _fill(details, "created_by", ", ".join(name for name in names if name))
+        _fill(details, "instructor_name", names[0] if names else "")
+        _fill(details, "instructor_title", instructors[0].get("job_title"))
+
+
+def _course_nodes(value: Any) -> Iterable[Dict[str, Any]]:
+    """Yield schema.org Course objects from JSON-LD (lists and @graph included)."""
+    if isinstance(value, list):
+        for item in value:
+            yield from _course_nodes(item)
+    elif isinstance(value, dict):
+        kind = value.get("@type")
+        if kind == "Course" or (isinstance(kind, list) and "Course" in kind):
+            yield value
+        yield from _course_nodes(value.get("@graph", []))
+
+
+def _from_json_ld(details: Dict[str, Any], json_ld: List[Any]) -> None:
+    """Fill fields from a schema.org Course object."""
+    course = next(iter(_course_nodes(json_ld)), None)
+    if course is None:
+        return
+    _fill(details, "title", course.get("name"))
+    _fill(details, "description", course.get("description"))
+
+    language = course.get("inLanguage")
+    if isinstance(language, str):
+        _fill(details, "language", language)
+
+    rating = course.get("aggregateRating")
+    if isinstance(rating, dict):
+        _fill(details, "rating", _format_rating(rating.get("ratingValue")))
+        _fill(details, "ratings_count", _format_count(rating.get("ratingCount"), "ratings"))
+
+    creators = course.get("creator") or course.get("author") or []
+    if isinstance(creators, dict):
+        creators = [creators]
+    names = [c.get("name", "") for c in creators if isinstance(c, dict)]
+    _fill(details, "created_by", ", ".join(name for name in names if name))
+    _fill(details, "instructor_name", names[0] if names else "")
+
+    offers = course.get("offers")
+    offer = offers[0] if isinstance(offers, list) and offers else offers
+    if isinstance(offer, dict) and offer.get("price") not in (None, ""):
+        price = offer["price"]
+        if str(price) in ("0", "0.0", "0.00"):
+            _fill(details, "price", "Free")
+        elif offer.get("priceCurrency", "USD") == "USD":
+            _fill(details, "price", f"${price}")
+        else:
+            _fill(details, "price", f"{price} {offer['priceCurrency']}")
+
+
+def _from_text(details: Dict[str, Any], text: str) -> None:
+    """Fill fields from patterns in the visible page text."""
+    if not text:
+        return
+    for name, pattern, template in _TEXT_PATTERNS:
+        if not details.get(name):
+            match = re.search(pattern, text)
+            if match:
+                _fill(details, name, template.format(match.group(1)))
+
+    anchor = text.find("Instructor Rating")
+    if anchor >= 0:
+        section = text[anchor:anchor + 300]
+        for name, pattern, template in _INSTRUCTOR_PATTERNS:
+            match = re.search(pattern, section)
+            if match:
+                _fill(details, name, template.format(match.group(1)))
@@ -0,0 +1,356 @@
+"""Cache of fetched course details with stale-while-revalidate.
+
+A live course fetch (browser navigation plus extraction) takes seconds;
+a cached one takes milliseconds. Entries are keyed by the normalized
+course URL and kept in an in-memory LRU plus an optional SQLite file, so
+they survive restarts and are shared between processes.
+
+Entries younger than ``ttl`` are fresh and returned as is. Older entries,
+up to ``max_stale`` seconds past the TTL, are returned immediately while
+one background task per URL refreshes them. Listing scrapes can report a
+course's current price; if it differs from the cached one, the entry is
+dropped so the next request fetches live.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DetailFetcher = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def normalize_course_url(url: str) -> str:
+    """Normalize a course URL to its canonical form.
+
+    Drops the query string and fragment, lower-cases the host, and
+    reduces course paths to ``/course/<slug>/``.
+
+    Args:
+        url: Course URL
+
+    Returns:
+        URL like "https://www.udemy.com/course/<slug>/"
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "www.udemy.com").lower()
+    path = parts.path.rstrip("/") + "/"
+    match = re.search(r"/course/[^/]+/", path)
+    if match:
+        path = match.group(0)
+    return f"https://{host}{path}"
+
+
+def parse_price(price: Any) -> Optional[float]:
+    """Parse a displayed price ("$84.99", "Free", 84.99) into a number.
+
+    Args:
+        price: Price as shown on a listing or course page
+
+    Returns:
+        Price value, or None if it cannot be read
+    """
+    if isinstance(price, (int, float)):
+        return float(price)
+    text = str(price or "").strip()
+    if not text:
+        return None
+    if text.lower() == "free":
+        return 0.0
+    match = re.search(r"\d[\d,]*(?:\.\d+)?", text)
+    if match is None:
+        return None
+    return float(match.group(0).replace(",", ""))
+
+
+class CourseDetailCache:
+    """URL-keyed course detail cache with TTL, stale serving and background refresh."""
+
+    def __init__(
+        self,
+        ttl: float = 86400.0,
+        max_stale: float = 604800.0,
+        max_entries: int = 256,
+        db_path: Optional[Path] = None,
+        namespace: str = "details",
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is fresh
+            max_stale: Seconds past the TTL a stale entry may still be
+                served while it refreshes (0 = never serve stale)
+            max_entries: Maximum entries kept in memory
+            db_path: Optional SQLite file for the persistent tier
+            namespace: Key prefix separating callers that store
+                different detail schemas in one file
+        """
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self.namespace = namespace
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, "asyncio.Task[Optional[Dict[str, Any]]]"] = {}
+        self._background: Set["asyncio.Task[Any]"] = set()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.invalidations = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            try:
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS course_details "
+                    "(key TEXT PRIMARY KEY, created REAL NOT NULL, details TEXT NOT NULL)"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Course detail cache disk tier disabled ({db_path}): {e}")
+                self._db = None
+
+    def _key(self, url: str) -> str:
+        """Build the cache key for a course URL."""
+        return f"{self.namespace}:{normalize_course_url(url)}"
+
+    # =========================================================================
+    # Storage
+    # =========================================================================
+
+    def _load(self, key: str) -> Optional[Tuple[float, str]]:
+        """Read an entry from memory, falling back to disk."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+            if self._db is None:
+                return None
+            try:
+                row = self._db.execute(
+                    "SELECT created, details FROM course_details WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Course detail cache read failed: {e}")
+                return None
+            if row is None:
+                return None
+            self._remember(key, row[0], row[1])
+            return row[0], row[1]
+
+    def _remember(self, key: str, created: float, details: str) -> None:
+        """Insert into the memory tier, evicting the least recently used."""
+        self._memory[key] = (created, details)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        """Remove an entry from both tiers."""
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM course_details WHERE key = ?", (key,))
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Course detail cache delete failed: {e}")
+
+    def put(self, url: str, details: Dict[str, Any]) -> None:
+        """Store a course's details.
+
+        Args:
+            url: Course URL
+            details: JSON-serializable course details
+        """
+        key = self._key(url)
+        created = time.time()
+        payload = json.dumps(details, ensure_ascii=False)
+        with self._lock:
+            self._remember(key, created, payload)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO course_details (key, created, details) VALUES (?, ?, ?)",
+                        (key, created, payload),
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Course detail cache write failed: {e}")
+
+    def get(self, url: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Look up a course's details without fetching.
+
+        Args:
+            url: Course URL
+
+        Returns:
+            Tuple of (details or None, whether they are fresh). Entries
+            past the stale window are dropped and reported as a miss.
+        """
+        key = self._key(url)
+        entry = self._load(key)
+        if entry is None:
+            return None, False
+        age = time.time() - entry[0]
+        if self.ttl > 0 and age > self.ttl + self.max_stale:
+            self._delete(key)
+            return None, False
+        return json.loads(entry[1]), self.ttl <= 0 or age <= self.ttl
+
+    def invalidate(self, url: str) -> None:
+        """Drop a course's cached details.
+
+        Args:
+            url: Course URL
+        """
+        self._delete(self._key(url))
+        self.invalidations += 1
+
+    def invalidate_if_price_changed(self, url: str, listing_price: Any) -> bool:
+        """Drop a course's details if a listing shows a different price.
+
+        Args:
+            url: Course URL
+            listing_price: Current price from a listing scrape
+
+        Returns:
+            True if the cached entry was dropped
+        """
+        new_price = parse_price(listing_price)
+        if new_price is None:
+            return False
+        entry = self._load(self._key(url))
+        if entry is None:
+            return False
+        cached_price = parse_price(json.loads(entry[1]).get("price"))
+        if cached_price is None or abs(cached_price - new_price) < 0.005:
+            return False
+        logger.info(f"Price of {url} changed ({cached_price} -> {new_price}), dropping cached details")
+        self.invalidate(url)
+        return True
+
+    def invalidate_changed_prices(self, courses: Iterable[Dict[str, Any]]) -> int:
+        """Apply ``invalidate_if_price_changed`` to scraped listing courses.
+
+        Args:
+            courses: Listing courses with "url" and "price" keys
+
+        Returns:
+            Number of entries dropped
+        """
+        return sum(
+            self.invalidate_if_price_changed(course["url"], course.get("price"))
+            for course in courses
+            if course.get("url")
+        )
+
+    # =========================================================================
+    # Fetching
+    # =========================================================================
+
+    def _start_fetch(self, url: str, fetch: DetailFetcher) -> "asyncio.Task[Optional[Dict[str, Any]]]":
+        """Start a fetch that stores its result, or join the one in flight for the URL."""
+        key = self._key(url)
+        task = self._inflight.get(key)
+        if task is None:
+            async def run() -> Optional[Dict[str, Any]]:
+                try:
+                    details = await fetch()
+                    if details:
+                        self.put(url, details)
+                    return details
+                finally:
+                    self._inflight.pop(key, None)
+
+            task = asyncio.ensure_future(run())
+            self._inflight[key] = task
+        return task
+
+    def _refresh_in_background(self, url: str, fetch: DetailFetcher) -> None:
+        """Start a background refresh unless one is already running."""
+        if self._key(url) in self._inflight:
+            return
+        self.refreshes += 1
+
+        def done(task: "asyncio.Task[Any]") -> None:
+            self._background.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(f"Background refresh of {url} failed: {task.exception()}")
+
+        task = self._start_fetch(url, fetch)
+        self._background.add(task)
+        task.add_done_callback(done)
+
+    async def get_or_fetch(
+        self,
+        url: str,
+        fetch: DetailFetcher,
+        refresh: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Get a course's details, fetching or refreshing as needed.
+
+        Fresh entries are returned directly. Stale entries are returned
+        directly while a background task refetches them. Misses (and
+        ``refresh``) wait for ``fetch``; concurrent misses for the same
+        URL share one fetch. Failed fetches (None) are not cached.
+
+        Args:
+            url: Course URL
+            fetch: Coroutine function fetching the details live
+            refresh: Skip the cache and fetch live
+
+        Returns:
+            Course details, or None if the fetch failed
+        """
+        if not refresh:
+            details, fresh = self.get(url)
+            if details is not None:
+                if fresh:
+                    self.hits += 1
+                else:
+                    self.stale_hits += 1
+                    self._refresh_in_background(url, fetch)
+                return details
+        self.misses += 1
+        return await asyncio.shield(self._start_fetch(url, fetch))
+
+    async def close(self) -> None:
+        """Wait for background refreshes, then close the disk tier."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache occupancy and counters.
+
+        Returns:
+            Dictionary with in-memory entry count, hit/miss counters,
+            background refreshes and invalidations
+        """
+        return {
+            "entries": len(self._memory),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refreshing": len(self._inflight),
+            "invalidations": self.invalidations,
+        }
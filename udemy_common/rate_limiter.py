@@ -0,0 +1,348 @@
+"""Process-wide async rate limiting for LLM providers.
+
+Limiters enforce a requests-per-minute and a tokens-per-minute budget
+with two token buckets that refill continuously. Callers are served in
+arrival order; a bounded number of callers may wait, further callers are
+rejected with ``RateLimitQueueFull`` instead of piling up.
+
+Limiters are registered by key (provider URL and model), so every LLM
+service in the process that talks to the same model draws from the same
+budget::
+
+    limiter = get_rate_limiter(limiter_key(base_url, model), 30, 8000)
+    permit = await limiter.acquire(estimate_message_tokens(messages))
+    response = await client.ainvoke(messages)
+    permit.settle(usage_tokens(response))
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitQueueFull(Exception):
+    """Raised when too many callers are already waiting for a limiter."""
+
+    pass
+
+
+def estimate_message_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Estimate the prompt tokens of a chat message list.
+
+    Uses four characters per token plus a small per-message overhead,
+    which is close enough for budgeting and needs no tokenizer.
+
+    Args:
+        messages: Chat messages with ``content`` strings
+
+    Returns:
+        Estimated token count
+    """
+    return sum(len(str(m.get("content", ""))) // 4 + 4 for m in messages)
+
+
+def usage_tokens(message: Any) -> Optional[int]:
+    """Get the total tokens a provider reported for a response.
+
+    Args:
+        message: LangChain AI message or chunk
+
+    Returns:
+        Total tokens, or None if the response carries no usage data
+    """
+    usage = getattr(message, "usage_metadata", None)
+    return usage.get("total_tokens") if usage else None
+
+
+# =============================================================================
+# Token Bucket
+# =============================================================================
+
+class TokenBucket:
+    """Continuously refilling token bucket.
+
+    The level may go negative when a caller is charged more than it
+    reserved (see ``RatePermit.settle``); later callers then wait for the
+    debt to be refilled.
+    """
+
+    def __init__(self, capacity: float, per_second: float):
+        """Initialize a full bucket.
+
+        Args:
+            capacity: Maximum tokens held
+            per_second: Refill rate
+        """
+        self.capacity = capacity
+        self.per_second = per_second
+        self.level = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.per_second)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Get the seconds until ``amount`` tokens are available.
+
+        Args:
+            amount: Tokens needed (capped at the capacity)
+
+        Returns:
+            Seconds to wait (0 if available now)
+        """
+        self._refill()
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.per_second)
+
+    def consume(self, amount: float) -> None:
+        """Take tokens from the bucket (may go negative).
+
+        Args:
+            amount: Tokens to take
+        """
+        self._refill()
+        self.level -= amount
+
+
+# =============================================================================
+# Limiter
+# =============================================================================
+
+class RatePermit:
+    """Receipt for an acquired request, used to settle its real token cost."""
+
+    __slots__ = ("_limiter", "tokens", "waited")
+
+    def __init__(self, limiter: "AsyncRateLimiter", tokens: int, waited: float):
+        self._limiter = limiter
+        self.tokens = tokens
+        self.waited = waited
+
+    def settle(self, actual_tokens: Optional[int]) -> None:
+        """Correct the token budget with the request's real usage.
+
+        Args:
+            actual_tokens: Tokens reported by the provider (None keeps
+                the estimate)
+        """
+        bucket = self._limiter.tokens
+        if actual_tokens is None or bucket is None:
+            return
+        with self._limiter._guard:
+            bucket.consume(actual_tokens - self.tokens)
+        self.tokens = actual_tokens
+
+
+class AsyncRateLimiter:
+    """FIFO async limiter with request and token budgets per minute.
+
+    A budget of 0 disables that dimension. The limiter can be shared by
+    coroutines on different event loops; each loop gets its own wait
+    queue, while the budgets are shared.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int = 0,
+        max_queue: int = 64,
+        name: str = "llm",
+    ):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Request budget (0 = unlimited)
+            tokens_per_minute: Token budget (0 = unlimited)
+            max_queue: Maximum callers waiting at once (0 = unbounded)
+            name: Name used in logs and stats
+        """
+        self.name = name
+        self.max_queue = max_queue
+        self.requests = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+            if requests_per_minute > 0 else None
+        )
+        self.tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+            if tokens_per_minute > 0 else None
+        )
+
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._guard = threading.Lock()
+
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.acquired = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _loop_lock(self) -> asyncio.Lock:
+        """Get the wait queue of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._guard:
+            lock = self._locks.get(loop)
+            if lock is None:
+                lock = self._locks[loop] = asyncio.Lock()
+            return lock
+
+    def _wait_time(self, tokens: int) -> float:
+        """Get the seconds until both budgets allow the request."""
+        wait = 0.0
+        with self._guard:
+            if self.requests is not None:
+                wait = self.requests.wait_time(1)
+            if self.tokens is not None:
+                wait = max(wait, self.tokens.wait_time(tokens))
+        return wait
+
+    def _consume(self, tokens: int) -> None:
+        """Charge a request against both budgets."""
+        with self._guard:
+            if self.requests is not None:
+                self.requests.consume(1)
+            if self.tokens is not None:
+                self.tokens.consume(tokens)
+
+    async def acquire(self, tokens: int = 0) -> RatePermit:
+        """Wait until a request of ``tokens`` estimated tokens may be sent.
+
+        Args:
+            tokens: Estimated tokens of the request (prompt plus expected
+                completion)
+
+        Returns:
+            Permit for settling the real token usage
+
+        Raises:
+            RateLimitQueueFull: If ``max_queue`` callers are already waiting
+        """
+        if self.max_queue and self.queue_depth >= self.max_queue:
+            self.rejected += 1
+            raise RateLimitQueueFull(
+                f"Rate limiter '{self.name}' queue is full ({self.queue_depth} waiting)"
+            )
+
+        start = time.monotonic()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            async with self._loop_lock():
+                wait = self._wait_time(tokens)
+                while wait > 0:
+                    await asyncio.sleep(wait)
+                    wait = self._wait_time(tokens)
+                self._consume(tokens)
+        finally:
+            self.queue_depth -= 1
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        if waited > 0.1:
+            logger.debug(f"Rate limiter '{self.name}' delayed request by {waited:.2f}s")
+        return RatePermit(self, tokens, waited)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get budget levels and queue/wait metrics.
+
+        Returns:
+            Dictionary with budgets, available capacity, queue depth and
+            wait time counters
+        """
+        with self._guard:
+            requests_available = self.requests.level if self.requests else None
+            tokens_available = self.tokens.level if self.tokens else None
+        return {
+            "requests_per_minute": self.requests.capacity if self.requests else 0,
+            "tokens_per_minute": self.tokens.capacity if self.tokens else 0,
+            "requests_available": requests_available,
+            "tokens_available": tokens_available,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "total_wait": self.total_wait,
+            "avg_wait": self.total_wait / self.acquired if self.acquired else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+_limiters: Dict[str, AsyncRateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def limiter_key(base_url: str, model: str) -> str:
+    """Build the registry key for a provider endpoint and model.
+
+    Args:
+        base_url: Provider API base URL
+        model: Provider model identifier
+
+    Returns:
+        Limiter key shared by all callers of that model
+    """
+    return f"{base_url.rstrip('/')}#{model}"
+
+
+def get_rate_limiter(
+    key: str,
+    requests_per_minute: int,
+    tokens_per_minute: int = 0,
+    max_queue: int = 64,
+) -> AsyncRateLimiter:
+    """Get or create the process-wide limiter for a key.
+
+    The budgets of the first caller for a key win; later callers share
+    the existing limiter.
+
+    Args:
+        key: Limiter identifier (e.g. provider URL and model)
+        requests_per_minute: Request budget (0 = unlimited)
+        tokens_per_minute: Token budget (0 = unlimited)
+        max_queue: Maximum callers waiting at once (0 = unbounded)
+
+    Returns:
+        Shared AsyncRateLimiter
+    """
+    with _registry_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = AsyncRateLimiter(requests_per_minute, tokens_per_minute, max_queue, name=key)
+            _limiters[key] = limiter
+            logger.info(
+                f"Rate limiter '{key}': {requests_per_minute} requests/min, "
+                f"{tokens_per_minute} tokens/min"
+            )
+        return limiter
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Get stats for every registered limiter.
+
+    Returns:
+        Mapping of limiter key to its stats
+    """
+    with _registry_lock:
+        return {key: limiter.stats() for key, limiter in _limiters.items()}
+
+
+def reset_rate_limiters() -> None:
+    """Drop all registered limiters (for testing or reconfiguration)."""
+    with _registry_lock:
+        _limiters.clear()
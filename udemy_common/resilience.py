@@ -0,0 +1,379 @@
+"""Retry and circuit breaking for calls to remote LLM providers.
+
+Errors are classified by what retrying can achieve:
+
+- ``RATE_LIMITED``: HTTP 429; retried after the provider's Retry-After
+- ``TRANSIENT``: 5xx, 408/409, timeouts and connection failures; retried
+  with decorrelated jitter and counted by the circuit breaker
+- ``FATAL``: everything else (bad request, auth, parsing); never retried
+
+A ``CircuitBreaker`` per provider endpoint and model opens after repeated
+transient failures and rejects calls immediately with ``CircuitOpenError``
+until a cool-down has passed, so callers fall back to their non-LLM
+answers instead of each waiting out several timeouts. Classification is
+duck-typed on ``status_code``/``response`` attributes, so it works with
+the OpenAI SDK errors raised through LangChain without importing them.
+"""
+
+import asyncio
+import enum
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying besides 429 and 5xx
+_RETRYABLE_STATUSES = frozenset({408, 409})
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because its circuit is open."""
+
+    pass
+
+
+class ErrorKind(enum.Enum):
+    """How a failed call should be handled."""
+
+    RATE_LIMITED = "rate_limited"
+    TRANSIENT = "transient"
+    FATAL = "fatal"
+
+
+# =============================================================================
+# Error Classification
+# =============================================================================
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """Get the HTTP status of an error, if it carries one."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def classify_error(error: BaseException) -> ErrorKind:
+    """Classify a failed call.
+
+    Args:
+        error: Exception raised by the call
+
+    Returns:
+        ErrorKind deciding whether and how to retry
+    """
+    status = _status_code(error)
+    if status == 429:
+        return ErrorKind.RATE_LIMITED
+    if status is not None:
+        if status >= 500 or status in _RETRYABLE_STATUSES:
+            return ErrorKind.TRANSIENT
+        return ErrorKind.FATAL
+
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return ErrorKind.TRANSIENT
+    # SDK/HTTP client errors without a status (openai.APIConnectionError,
+    # openai.APITimeoutError, httpx.TimeoutException, httpx.ConnectError, ...)
+    name = type(error).__name__
+    if "Timeout" in name or "Connect" in name:
+        return ErrorKind.TRANSIENT
+    return ErrorKind.FATAL
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Get the delay a provider asked for before retrying.
+
+    Reads ``retry-after-ms`` and ``retry-after`` (seconds or HTTP date)
+    from the error's response headers.
+
+    Args:
+        error: Exception raised by the call
+
+    Returns:
+        Delay in seconds, or None if the provider gave none
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000.0)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# =============================================================================
+# Circuit Breaker
+# =============================================================================
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    Closed: calls pass; ``failure_threshold`` consecutive transient
+    failures open the circuit. Open: calls are rejected until
+    ``reset_timeout`` seconds have passed. Half-open: one trial call is
+    let through; its success closes the circuit, its failure reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, name: str = "llm"):
+        """Initialize a closed circuit.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+                (0 = never open)
+            reset_timeout: Seconds the circuit stays open before a trial
+            name: Name used in logs and stats
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self.trips = 0
+        self._trial_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Admit or reject a call.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a half-open trial
+                is already running)
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self.opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(
+                        f"Circuit '{self.name}' is open; retrying in {remaining:.0f}s"
+                    )
+                self.state = self.HALF_OPEN
+                self._trial_started = None
+                logger.info(f"Circuit '{self.name}' half-open, allowing a trial call")
+
+            if self.state == self.HALF_OPEN:
+                # A trial that never reported back (e.g. cancelled) expires
+                # after another reset timeout
+                now = time.monotonic()
+                if self._trial_started is not None and now - self._trial_started < self.reset_timeout:
+                    self.rejected += 1
+                    raise CircuitOpenError(f"Circuit '{self.name}' is half-open; trial call in progress")
+                self._trial_started = now
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit '{self.name}' closed")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_started = None
+
+    def record_failure(self, error: BaseException) -> None:
+        """Record a failed call.
+
+        Only transient failures count. Any other HTTP error shows the
+        provider is reachable and is treated like a success; local errors
+        (e.g. a full rate limiter queue) leave the circuit unchanged.
+
+        Args:
+            error: Exception raised by the call
+        """
+        if classify_error(error) != ErrorKind.TRANSIENT:
+            if _status_code(error) is not None:
+                self.record_success()
+            else:
+                with self._lock:
+                    self._trial_started = None
+            return
+
+        with self._lock:
+            self._trial_started = None
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (
+                self.failure_threshold and self.failures >= self.failure_threshold
+            ):
+                if self.state != self.OPEN:
+                    self.trips += 1
+                    logger.warning(
+                        f"Circuit '{self.name}' opened after {self.failures} failures: {error}"
+                    )
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get circuit state and counters.
+
+        Returns:
+            Dictionary with state, consecutive failures, trips and
+            rejected calls
+        """
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(key: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> CircuitBreaker:
+    """Get or create the process-wide circuit breaker for a key.
+
+    Args:
+        key: Breaker identifier (see ``limiter_key``)
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds the circuit stays open before a trial
+
+    Returns:
+        Shared CircuitBreaker
+    """
+    with _registry_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker(failure_threshold, reset_timeout, name=key)
+        return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """Get stats for every registered circuit breaker.
+
+    Returns:
+        Mapping of breaker key to its stats
+    """
+    with _registry_lock:
+        return {key: breaker.stats() for key, breaker in _breakers.items()}
+
+
+def reset_circuit_breakers() -> None:
+    """Drop all registered circuit breakers (for testing or reconfiguration)."""
+    with _registry_lock:
+        _breakers.clear()
+
+
+# =============================================================================
+# Retry Policy
+# =============================================================================
+
+class RetryPolicy:
+    """Retry schedule with decorrelated jitter and Retry-After support.
+
+    Delays follow ``min(max_delay, uniform(base_delay, previous * 3))``,
+    which spreads out concurrent retries better than fixed exponential
+    steps. A provider's Retry-After takes precedence when present.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0):
+        """Initialize the policy.
+
+        Args:
+            max_attempts: Total attempts including the first
+            base_delay: Minimum delay between attempts in seconds
+            max_delay: Maximum delay between attempts in seconds
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        """Decide whether a failed attempt is retried.
+
+        Args:
+            error: Exception raised by the attempt
+            attempt: Zero-based attempt number that failed
+
+        Returns:
+            True if another attempt should be made
+        """
+        return attempt + 1 < self.max_attempts and classify_error(error) != ErrorKind.FATAL
+
+    def next_delay(self, error: BaseException, previous: float) -> float:
+        """Get the delay before the next attempt.
+
+        Args:
+            error: Exception raised by the failed attempt
+            previous: Previous delay (0 before the first retry)
+
+        Returns:
+            Seconds to wait
+        """
+        requested = retry_after(error)
+        if requested is not None:
+            return min(self.max_delay, requested)
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    async def call(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        breaker: Optional[CircuitBreaker] = None,
+        label: str = "LLM call",
+    ) -> T:
+        """Run an operation with retries and circuit breaking.
+
+        Args:
+            operation: Zero-argument coroutine factory, called per attempt
+            breaker: Optional circuit breaker guarding the operation
+            label: Name used in log messages
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            CircuitOpenError: If the breaker rejects an attempt
+            Exception: The last error once retries are exhausted or on a
+                non-retryable error
+        """
+        delay = 0.0
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_call()
+            try:
+                result = await operation()
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record_failure(e)
+                if not self.should_retry(e, attempt):
+                    raise
+                delay = self.next_delay(e, delay)
+                logger.warning(
+                    f"{label} failed (attempt {attempt + 1}, {classify_error(e).value}): {e}; "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            if breaker is not None:
+                breaker.record_success()
+            return result
@@ -0,0 +1,101 @@
+"""LangSmith tracing that costs nothing when tracing is disabled.
+
+``langsmith`` (and the ``openai`` SDK it pulls in) takes hundreds of
+milliseconds to import. ``traceable`` here is a drop-in for
+``langsmith.traceable`` that defers that import: each decorated function
+decides on its first call whether tracing is enabled, then either wraps
+itself with the real ``langsmith.traceable`` or keeps calling the
+undecorated function. Tracing is enabled by the usual environment
+variables (``LANGSMITH_TRACING`` or ``LANGCHAIN_TRACING_V2``), which only
+have to be set before the first call, not before import::
+
+    from udemy_common import traceable
+
+    @traceable(name="llm_call", run_type="llm")
+    async def call(...): ...
+"""
+
+import contextlib
+import functools
+import inspect
+import os
+import sys
+from typing import Any, Callable, Dict, Optional
+
+_TRACING_ENV_VARS = ("LANGSMITH_TRACING", "LANGCHAIN_TRACING_V2", "LANGCHAIN_TRACING")
+
+
+def tracing_enabled() -> bool:
+    """Check whether LangSmith tracing is enabled in the environment.
+
+    Returns:
+        True if any tracing variable is set to a true value
+    """
+    return any(
+        os.getenv(name, "").strip().lower() in ("1", "true", "yes") for name in _TRACING_ENV_VARS
+    )
+
+
+def current_run_tree() -> Optional[Any]:
+    """Get the current LangSmith run, without importing LangSmith needlessly.
+
+    Returns:
+        The active run tree, or None if not tracing
+    """
+    if "langsmith" not in sys.modules or not tracing_enabled():
+        return None
+    from langsmith.run_helpers import get_current_run_tree
+    return get_current_run_tree()
+
+
+def traceable(*args: Any, **kwargs: Any) -> Any:
+    """Lazily applied ``langsmith.traceable``.
+
+    Supports the same call forms (``@traceable`` and
+    ``@traceable(name=..., run_type=..., reduce_fn=...)``) and the same
+    kinds of functions: plain, coroutine, and (async) generator.
+
+    Returns:
+        Decorated function, or a decorator when called with options
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return _lazy_traceable(args[0], {})
+
+    def decorator(func: Callable) -> Callable:
+        return _lazy_traceable(func, kwargs)
+
+    return decorator
+
+
+def _lazy_traceable(func: Callable, options: Dict[str, Any]) -> Callable:
+    """Wrap a function so tracing is resolved on its first call."""
+    target: Optional[Callable] = None
+
+    def resolve() -> Callable:
+        nonlocal target
+        if target is None:
+            if tracing_enabled():
+                from langsmith import traceable as langsmith_traceable
+                target = langsmith_traceable(**options)(func)
+            else:
+                target = func
+        return target
+
+    if inspect.isasyncgenfunction(func):
+        @functools.wraps(func)
+        async def async_gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+            async with contextlib.aclosing(resolve()(*args, **kwargs)) as items:
+                async for item in items:
+                    yield item
+        return async_gen_wrapper
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await resolve()(*args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return resolve()(*args, **kwargs)
+    return wrapper
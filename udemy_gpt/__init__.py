@@ -17,12 +17,17 @@ CLI Usage:
     ```bash
     python -m udemy_gpt
     ```
+
+Server Usage (many concurrent sessions over HTTP):
+    ```bash
+    udemy-gpt-server --port 8080
+    ```
 """
 
 __version__ = "1.0.0"
 
 # Core
-from udemy_gpt.core import UdemyGPT
+from udemy_gpt.core import SessionManager, UdemyGPT
 
 # Models
 from udemy_gpt.models import (
@@ -47,6 +52,10 @@ from udemy_gpt.exceptions import (
     TopicNotFoundError,
     CourseNotFoundError,
     IntentClassificationError,
+    SessionError,
+    SessionNotFoundError,
+    SessionBusyError,
+    ServerBusyError,
 )
 
 __all__ = [
@@ -54,6 +63,7 @@ __all__ = [
     "__version__",
     # Core
     "UdemyGPT",
+    "SessionManager",
     # Models
     "Course",
     "TopicStats",
@@ -72,4 +82,8 @@ __all__ = [
     "TopicNotFoundError",
     "CourseNotFoundError",
     "IntentClassificationError",
+    "SessionError",
+    "SessionNotFoundError",
+    "SessionBusyError",
+    "ServerBusyError",
 ]
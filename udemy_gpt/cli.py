@@ -218,8 +218,10 @@ async def run_cli() -> None:
                     continue
 
                 print("\nThinking...\n")
-                response = await agent.chat(user_input)
-                print(f"Assistant:\n{response}\n")
+                print("Assistant:")
+                async for chunk in agent.chat_stream(user_input):
+                    print(chunk, end="", flush=True)
+                print("\n")
                 print("-" * 60)
 
             except KeyboardInterrupt:
@@ -6,12 +6,18 @@ from udemy_gpt.config.settings import (
     LLMSettings,
     ConversationSettings,
     BrowserSettings,
+    CacheSettings,
+    DetailCacheSettings,
+    ServerSettings,
     LoggingSettings,
     settings,
     get_paths,
     get_llm_settings,
     get_browser_settings,
     get_conversation_settings,
+    get_cache_settings,
+    get_detail_cache_settings,
+    get_server_settings,
 )
 
 __all__ = [
@@ -20,10 +26,16 @@ __all__ = [
     "LLMSettings",
     "ConversationSettings",
     "BrowserSettings",
+    "CacheSettings",
+    "DetailCacheSettings",
+    "ServerSettings",
     "LoggingSettings",
     "settings",
     "get_paths",
     "get_llm_settings",
     "get_browser_settings",
     "get_conversation_settings",
+    "get_cache_settings",
+    "get_detail_cache_settings",
+    "get_server_settings",
 ]
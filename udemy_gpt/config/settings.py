@@ -8,14 +8,45 @@ Environment Variables:
     GROQ_API_KEY: API key for Groq LLM service (required)
     LLM_BASE_URL: LLM API base URL
     LLM_MODEL: Model name to use (default: openai/gpt-oss-20b)
-    LLM_MAX_RETRIES: Max retry attempts for LLM calls
+    LLM_MAX_RETRIES: Max attempts for retryable LLM errors (429, 5xx, timeouts)
+    LLM_RETRY_DELAY: Base delay between LLM attempts (jittered, or Retry-After)
+    LLM_REQUEST_TIMEOUT: Seconds before an LLM request times out
+    LLM_CIRCUIT_FAILURE_THRESHOLD: Consecutive failures that stop LLM calls (0 = never)
+    LLM_CIRCUIT_RESET_TIMEOUT: Seconds LLM calls stay stopped before a trial call
+    LLM_REQUESTS_PER_MINUTE: Request budget shared by all LLM callers (0 = unlimited)
+    LLM_TOKENS_PER_MINUTE: Token budget shared by all LLM callers (0 = unlimited)
+    LLM_RATE_LIMIT_QUEUE: Maximum calls waiting for the rate limiter
+    LLM_CACHE_ENABLED: Cache identical LLM requests (true/false)
+    LLM_CACHE_TTL: Seconds a cached LLM response stays valid (0 = no expiry)
+    LLM_CACHE_DB_PATH: Optional SQLite file for a persistent response cache
+    LLM_CONTEXT_TOKEN_BUDGET: Token budget for course data in search prompts
+    LLM_CONTEXT_MAX_COURSES: Maximum ranked courses considered for a search prompt
     BROWSER_HEADLESS: Run browser in headless mode (true/false)
+    BROWSER_PAGE_POOL_SIZE: Browser pages open at once for live course fetches
+    BROWSER_PAGE_MAX_USES: Fetches after which a pooled page is replaced (0 = never)
+    BROWSER_BLOCK_RESOURCES: Block images, media, fonts and third-party requests
+    BROWSER_SETTLE_TIMEOUT: Milliseconds to wait for a page section or the DOM to settle
+    BROWSER_HUMAN_PACING: Add human-like random pauses to live course fetches
     LOG_LEVEL: Logging level (DEBUG, INFO, WARNING, ERROR)
+    CACHE_MAX_BYTES: Memory budget of the topic course cache, including the resident
+        all-topics store and search indexes (0 = unbounded)
+    CACHE_MAX_ROWS: Course budget of the topic course cache, including the resident
+        all-topics store (0 = unbounded)
+    CACHE_PINNED_TOPICS: Comma-separated topic slugs never evicted
+    DETAIL_CACHE_ENABLED: Cache fetched live course details (true/false)
+    DETAIL_CACHE_TTL: Seconds cached course details stay fresh (0 = no expiry)
+    DETAIL_CACHE_MAX_STALE: Seconds past the TTL stale details are served while refreshing
+    DETAIL_CACHE_DB_PATH: SQLite file for cached details (default: <data dir>/cache/course_details.sqlite3)
+    SERVER_HOST / SERVER_PORT: Address of the multi-session HTTP server
+    SERVER_SESSION_TTL: Seconds an idle session is kept
+    SERVER_MAX_SESSIONS: Maximum live sessions
+    SERVER_MAX_CONCURRENT_TURNS: Chat turns processed at once
+    SERVER_MAX_PENDING_TURNS: Chat turns waiting before requests are rejected
 """
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -44,6 +75,21 @@ class PathSettings(BaseSettings):
         """Path to topics CSV file."""
         return self.data_dir / "udemy_topics_from_network.csv"
 
+    @property
+    def topic_index_json(self) -> Path:
+        """Path to the persisted topic index."""
+        return self.data_dir / "topic_index.json"
+
+    @property
+    def topic_index_cache(self) -> Path:
+        """Path to the runtime topic index, seeded from the shipped one."""
+        return self.data_dir / "cache" / "topic_index.json"
+
+    @property
+    def course_snapshot(self) -> Path:
+        """Path to the memory-mappable binary snapshot of all course CSVs."""
+        return self.data_dir / "courses.snapshot"
+
     class Config:
         env_prefix = "UDEMY_"
 
@@ -56,8 +102,21 @@ class LLMSettings(BaseSettings):
     model: str = Field(default="openai/gpt-oss-20b")
     max_retries: int = Field(default=3, ge=1, le=10)
     retry_delay: float = Field(default=1.0, ge=0.1)
-    rate_limit_delay: float = Field(default=0.5, ge=0.0)
+    retry_max_delay: float = Field(default=20.0, ge=0.1)
+    request_timeout: float = Field(default=60.0, ge=1.0)
+    circuit_failure_threshold: int = Field(default=5, ge=0)
+    circuit_reset_timeout: float = Field(default=30.0, ge=1.0)
+    requests_per_minute: int = Field(default=30, ge=0)
+    tokens_per_minute: int = Field(default=8000, ge=0)
+    rate_limit_queue: int = Field(default=64, ge=0)
+    completion_token_reserve: int = Field(default=1024, ge=0)
     default_temperature: float = Field(default=0.6, ge=0.0, le=2.0)
+    cache_enabled: bool = Field(default=True)
+    cache_max_entries: int = Field(default=512, ge=1)
+    cache_ttl: float = Field(default=3600.0, ge=0.0)
+    cache_db_path: Optional[Path] = Field(default=None)
+    context_token_budget: int = Field(default=2000, ge=200)
+    context_max_courses: int = Field(default=40, ge=1)
 
     class Config:
         env_prefix = "LLM_"
@@ -86,6 +145,13 @@ class BrowserSettings(BaseSettings):
     headless: bool = Field(default=True)
     timeout: int = Field(default=30000, ge=5000, le=120000)
     cloudflare_wait: int = Field(default=20, ge=5, le=60)
+    settle_timeout: int = Field(default=5000, ge=500, le=30000)
+    human_pacing: bool = Field(default=False)
+    page_pool_size: int = Field(default=3, ge=1, le=16)
+    page_max_uses: int = Field(default=20, ge=0)
+    block_resources: bool = Field(default=True)
+    blocked_resource_types: str = Field(default="image,media,font")
+    allowed_hosts: str = Field(default="udemy.com,udemycdn.com,cloudflare.com")
     user_agent: str = Field(
         default=(
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -98,6 +164,51 @@ class BrowserSettings(BaseSettings):
         env_prefix = "BROWSER_"
 
 
+class CacheSettings(BaseSettings):
+    """Topic course cache settings."""
+
+    max_bytes: int = Field(default=256 * 1024 * 1024, ge=0)
+    max_rows: int = Field(default=0, ge=0)
+    pinned_topics: str = Field(default="")
+
+    class Config:
+        env_prefix = "CACHE_"
+
+    def get_pinned_topics(self) -> List[str]:
+        """Get the pinned topic slugs as a list."""
+        return [slug.strip() for slug in self.pinned_topics.split(",") if slug.strip()]
+
+
+class DetailCacheSettings(BaseSettings):
+    """Live course detail cache settings."""
+
+    enabled: bool = Field(default=True)
+    ttl: float = Field(default=86400.0, ge=0.0)
+    max_stale: float = Field(default=604800.0, ge=0.0)
+    max_entries: int = Field(default=256, ge=1)
+    persist: bool = Field(default=True)
+    db_path: Optional[Path] = Field(default=None)
+
+    class Config:
+        env_prefix = "DETAIL_CACHE_"
+
+
+class ServerSettings(BaseSettings):
+    """Multi-session HTTP server settings."""
+
+    host: str = Field(default="127.0.0.1")
+    port: int = Field(default=8080, ge=1, le=65535)
+    session_ttl: float = Field(default=1800.0, ge=10.0)
+    max_sessions: int = Field(default=1000, ge=1)
+    max_concurrent_turns: int = Field(default=16, ge=1)
+    max_pending_turns: int = Field(default=64, ge=0)
+    max_message_chars: int = Field(default=4000, ge=1)
+    max_body_bytes: int = Field(default=64 * 1024, ge=1024)
+
+    class Config:
+        env_prefix = "SERVER_"
+
+
 class LoggingSettings(BaseSettings):
     """Logging configuration."""
 
@@ -115,6 +226,9 @@ class Settings(BaseSettings):
     llm: LLMSettings = Field(default_factory=LLMSettings)
     conversation: ConversationSettings = Field(default_factory=ConversationSettings)
     browser: BrowserSettings = Field(default_factory=BrowserSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
+    detail_cache: DetailCacheSettings = Field(default_factory=DetailCacheSettings)
+    server: ServerSettings = Field(default_factory=ServerSettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
 
 
@@ -141,3 +255,18 @@ def get_browser_settings() -> BrowserSettings:
 def get_conversation_settings() -> ConversationSettings:
     """Get conversation settings."""
     return settings.conversation
+
+
+def get_cache_settings() -> CacheSettings:
+    """Get topic cache settings."""
+    return settings.cache
+
+
+def get_detail_cache_settings() -> DetailCacheSettings:
+    """Get live course detail cache settings."""
+    return settings.detail_cache
+
+
+def get_server_settings() -> ServerSettings:
+    """Get HTTP server settings."""
+    return settings.server
@@ -1,8 +1,10 @@
 """Core module for Udemy GPT.
 
-Contains the main agent orchestrator and intent handlers.
+Contains the main agent orchestrator, intent handlers and the session
+manager used to serve many conversations from one agent.
 """
 
 from udemy_gpt.core.agent import UdemyGPT
+from udemy_gpt.core.sessions import Session, SessionManager
 
-__all__ = ["UdemyGPT"]
+__all__ = ["UdemyGPT", "Session", "SessionManager"]
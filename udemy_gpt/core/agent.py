@@ -6,13 +6,12 @@ interface for course discovery.
 """
 
 import logging
-from typing import Any, Dict, Optional
-
-from langsmith import traceable
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+from udemy_common import traceable
 from udemy_gpt.config import settings
 from udemy_gpt.data import build_index, get_available_slugs
-from udemy_gpt.models import ConversationState
+from udemy_gpt.models import ConversationState, IntentClassification
 from udemy_gpt.services import LLMService, IntentService, close_browser
 from udemy_gpt.core.handlers import (
     SearchHandler,
@@ -32,14 +31,22 @@ class UdemyGPT:
     This class orchestrates all services and handlers to provide
     a conversational interface for discovering Udemy courses.
 
+    The agent holds only shared resources (topic index, LLM service,
+    handlers); conversation state is passed per call, so one agent can
+    serve many sessions concurrently (see ``SessionManager``). Calls
+    without a state use the agent's own ``state``.
+
     Attributes:
-        state: Conversation state tracking messages and search results
+        state: Default conversation state tracking messages and search results
 
     Example:
         ```python
         agent = UdemyGPT()
         response = await agent.chat("Find Python courses for beginners")
         print(response)
+
+        async for chunk in agent.chat_stream("Compare course 1 and 2"):
+            print(chunk, end="", flush=True)
         await agent.close()
         ```
     """
@@ -68,21 +75,76 @@ class UdemyGPT:
 
         logger.info(f"Initialized with {len(self._available_topics)} available topics")
 
-    def _get_conversation_history(self) -> str:
+    def _get_conversation_history(self, state: ConversationState) -> str:
         """Get formatted conversation history for context.
 
+        Args:
+            state: Conversation state of the session
+
         Returns:
             Formatted conversation history string
         """
         if not settings.conversation.include_history_in_prompt:
             return ""
         return format_conversation_context(
-            self.state.messages,
+            state.messages,
             settings.conversation.max_history_messages
         )
 
+    def _route(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        state: ConversationState,
+        history: str,
+    ) -> Tuple[Any, str, tuple]:
+        """Pick the handler action for a classified intent.
+
+        Args:
+            intent: Classified intent
+            user_message: User's input message
+            state: Conversation state of the session
+            history: Formatted conversation history
+
+        Returns:
+            Tuple of (handler, action name, action arguments); the handler
+            provides ``handle_<action>`` and ``stream_<action>`` methods
+        """
+        if intent.intent in ("search", "recommend", "filter"):
+            return self._search_handler, "search", (intent, user_message, state, history)
+        if intent.intent == "compare":
+            return self._compare_handler, "compare", (intent, user_message, state, history)
+        if intent.intent in ("compare_topics", "cross_topic_analysis"):
+            return self._compare_handler, "compare_topics", (intent, user_message, history)
+        if intent.intent == "details":
+            return self._details_handler, "details", (intent, user_message, state, history)
+        if intent.intent == "top_valuable":
+            return self._search_handler, "top_valuable", (intent, user_message, state, history)
+        if intent.intent == "learning_path":
+            return self._learning_path_handler, "learning_path", (intent, user_message, state, history)
+        if intent.intent == "stats":
+            return self._search_handler, "stats", (intent, user_message, history)
+        return self._chat_handler, "chat", (user_message, history)
+
+    async def _classify(self, user_message: str, state: ConversationState) -> IntentClassification:
+        """Classify a user message and record the current intent."""
+        intent = await self._intent_service.classify(
+            user_message,
+            state.last_search_results
+        )
+        state.current_intent = intent.intent
+        return intent
+
+    def _finish_turn(self, response: str, state: ConversationState) -> None:
+        """Record the assistant response and trim history."""
+        state.add_message("assistant", response)
+
+        # Trim history if needed
+        max_history = settings.conversation.max_history_messages * 2
+        state.trim_history(max_history)
+
     @traceable(name="chat", run_type="chain")
-    async def chat(self, user_message: str) -> str:
+    async def chat(self, user_message: str, state: Optional[ConversationState] = None) -> str:
         """Main chat interface.
 
         Process a user message and return an appropriate response.
@@ -91,83 +153,92 @@ class UdemyGPT:
 
         Args:
             user_message: User's input message
+            state: Conversation state of the session (defaults to the
+                agent's own state)
 
         Returns:
             Agent's response text
         """
-        self.state.add_message("user", user_message)
-        history = self._get_conversation_history()
+        state = state if state is not None else self.state
+        state.add_message("user", user_message)
+        history = self._get_conversation_history(state)
 
         try:
-            # Classify intent
-            intent = await self._intent_service.classify(
-                user_message,
-                self.state.last_search_results
-            )
-            self.state.current_intent = intent.intent
-
-            # Route to appropriate handler
-            if intent.intent in ("search", "recommend", "filter"):
-                response = await self._search_handler.handle_search(
-                    intent, user_message, self.state, history
-                )
-            elif intent.intent == "compare":
-                response = await self._compare_handler.handle_compare(
-                    intent, user_message, self.state, history
-                )
-            elif intent.intent in ("compare_topics", "cross_topic_analysis"):
-                response = await self._compare_handler.handle_compare_topics(
-                    intent, user_message, history
-                )
-            elif intent.intent == "details":
-                response = await self._details_handler.handle_details(
-                    intent, user_message, self.state, history
-                )
-            elif intent.intent == "top_valuable":
-                response = await self._search_handler.handle_top_valuable(
-                    intent, user_message, self.state, history
-                )
-            elif intent.intent == "learning_path":
-                response = await self._learning_path_handler.handle_learning_path(
-                    intent, user_message, self.state, history
-                )
-            elif intent.intent == "stats":
-                response = await self._search_handler.handle_stats(
-                    intent, user_message, history
-                )
-            else:
-                response = await self._chat_handler.handle_chat(
-                    user_message, history
-                )
+            intent = await self._classify(user_message, state)
+            handler, action, args = self._route(intent, user_message, state, history)
+            response = await getattr(handler, f"handle_{action}")(*args)
 
         except Exception as e:
             logger.error(f"Error processing chat: {e}", exc_info=True)
             response = "I encountered an error. Please try again."
 
-        self.state.add_message("assistant", response)
+        self._finish_turn(response, state)
+        return response
 
-        # Trim history if needed
-        max_history = settings.conversation.max_history_messages * 2
-        self.state.trim_history(max_history)
+    @traceable(name="chat_stream", run_type="chain", reduce_fn="".join)
+    async def chat_stream(
+        self,
+        user_message: str,
+        state: Optional[ConversationState] = None,
+    ) -> AsyncIterator[str]:
+        """Streaming chat interface.
 
-        return response
+        Like ``chat``, but yields the response as it is generated. The
+        text is recorded in the conversation state when the stream ends,
+        also if it ends in an error or the caller stops consuming it.
+
+        Args:
+            user_message: User's input message
+            state: Conversation state of the session (defaults to the
+                agent's own state)
+
+        Yields:
+            Response text chunks
+        """
+        state = state if state is not None else self.state
+        state.add_message("user", user_message)
+        history = self._get_conversation_history(state)
+        parts: List[str] = []
+
+        try:
+            intent = await self._classify(user_message, state)
+            handler, action, args = self._route(intent, user_message, state, history)
+            async for chunk in getattr(handler, f"stream_{action}")(*args):
+                parts.append(chunk)
+                yield chunk
+
+        except Exception as e:
+            logger.error(f"Error processing chat: {e}", exc_info=True)
+            error = "I encountered an error. Please try again."
+            if parts:
+                error = f"\n\n{error}"
+            parts.append(error)
+            yield error
+
+        finally:
+            self._finish_turn("".join(parts), state)
 
     def clear_history(self) -> None:
         """Clear conversation history and search results."""
         self.state.clear()
         logger.info("Conversation history cleared")
 
-    def get_session_stats(self) -> Dict[str, Any]:
+    def get_session_stats(self, state: Optional[ConversationState] = None) -> Dict[str, Any]:
         """Get current session statistics.
 
+        Args:
+            state: Conversation state of the session (defaults to the
+                agent's own state)
+
         Returns:
             Dictionary with session statistics
         """
+        state = state if state is not None else self.state
         return {
-            "messages_count": len(self.state.messages),
-            "last_search_count": len(self.state.last_search_results),
-            "current_intent": self.state.current_intent,
-            "last_topic": self.state.last_topic,
+            "messages_count": len(state.messages),
+            "last_search_count": len(state.last_search_results),
+            "current_intent": state.current_intent,
+            "last_topic": state.last_topic,
             "available_topics": len(self._available_topics),
         }
 
@@ -0,0 +1,110 @@
+"""Shared plumbing for intent handlers.
+
+Handlers first prepare a response: either a final text (for early exits
+such as "please search first") or an ``LLMReply`` describing the LLM call
+that produces it. The prepared response is then either awaited in full
+or streamed chunk by chunk, so the blocking and streaming variants of a
+handler share all of their preparation logic.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional, Union
+
+from udemy_gpt.services import LLMService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LLMReply:
+    """A prepared LLM call answering the user.
+
+    Attributes:
+        system_prompt: System message for the call
+        user_prompt: User message for the call
+        temperature: Sampling temperature
+        conversation_history: Optional previous conversation
+        fallback: Text returned if the LLM call fails (None re-raises)
+        label: Name used when logging a failure
+    """
+
+    system_prompt: str
+    user_prompt: str
+    temperature: float
+    conversation_history: str = ""
+    fallback: Optional[str] = None
+    label: str = "Handler"
+
+
+# A prepared handler response: final text or an LLM call to make
+Prepared = Union[str, LLMReply]
+
+
+class BaseHandler:
+    """Base class providing blocking and streaming response delivery."""
+
+    def __init__(self, llm_service: LLMService):
+        """Initialize handler.
+
+        Args:
+            llm_service: LLM service for generating responses
+        """
+        self._llm = llm_service
+
+    async def _complete(self, prepared: Prepared) -> str:
+        """Produce the full response text for a prepared response.
+
+        Args:
+            prepared: Final text or LLM call
+
+        Returns:
+            Response text
+        """
+        if isinstance(prepared, str):
+            return prepared
+
+        try:
+            return await self._llm.call(
+                prepared.system_prompt,
+                prepared.user_prompt,
+                temperature=prepared.temperature,
+                conversation_history=prepared.conversation_history,
+            )
+        except Exception as e:
+            if prepared.fallback is None:
+                raise
+            logger.error(f"{prepared.label} LLM failed: {e}")
+            return prepared.fallback
+
+    async def _stream(self, prepared: Prepared) -> AsyncIterator[str]:
+        """Stream the response text for a prepared response.
+
+        The fallback text is used only if the call fails before any text
+        was produced; a failure mid-response is raised to the caller.
+
+        Args:
+            prepared: Final text or LLM call
+
+        Yields:
+            Response text chunks
+        """
+        if isinstance(prepared, str):
+            yield prepared
+            return
+
+        started = False
+        try:
+            async for chunk in self._llm.astream(
+                prepared.system_prompt,
+                prepared.user_prompt,
+                temperature=prepared.temperature,
+                conversation_history=prepared.conversation_history,
+            ):
+                started = True
+                yield chunk
+        except Exception as e:
+            if started or prepared.fallback is None:
+                raise
+            logger.error(f"{prepared.label} LLM failed: {e}")
+            yield prepared.fallback
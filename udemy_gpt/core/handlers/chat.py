@@ -4,25 +4,18 @@ Handles chat intent for general queries and conversation.
 """
 
 import logging
+from typing import AsyncIterator
 
+from udemy_gpt.core.handlers.base import BaseHandler, LLMReply, Prepared
 from udemy_gpt.data import get_available_topics
 from udemy_gpt.prompts import get_response_prompt
-from udemy_gpt.services import LLMService
 
 logger = logging.getLogger(__name__)
 
 
-class ChatHandler:
+class ChatHandler(BaseHandler):
     """Handler for general chat intent."""
 
-    def __init__(self, llm_service: LLMService):
-        """Initialize chat handler.
-
-        Args:
-            llm_service: LLM service for generating responses
-        """
-        self._llm = llm_service
-
     async def handle_chat(
         self,
         user_message: str,
@@ -37,6 +30,27 @@ class ChatHandler:
         Returns:
             Conversational response
         """
+        return await self._complete(self._prepare_chat(user_message, conversation_history))
+
+    async def stream_chat(
+        self,
+        user_message: str,
+        conversation_history: str = "",
+    ) -> AsyncIterator[str]:
+        """Stream the response to general chat/conversation.
+
+        Args:
+            user_message: User's message
+            conversation_history: Optional history
+
+        Yields:
+            Response text chunks
+        """
+        async for chunk in self._stream(self._prepare_chat(user_message, conversation_history)):
+            yield chunk
+
+    def _prepare_chat(self, user_message: str, conversation_history: str) -> Prepared:
+        """Build the LLM call for a conversational reply."""
         available = get_available_topics()[:10]
         topics_preview = ", ".join(t['slug'] for t in available)
 
@@ -56,15 +70,13 @@ I'm a Udemy course discovery assistant. I help with:
 
 Available topics: {topics_preview}, and more."""
 
-        try:
-            return await self._llm.call(
-                get_response_prompt("chat"),
-                prompt,
-                temperature=0.5,
-            )
-        except Exception as e:
-            logger.error(f"Chat LLM failed: {e}")
-            return (
+        return LLMReply(
+            get_response_prompt("chat"),
+            prompt,
+            temperature=0.5,
+            fallback=(
                 f"Hello! I'm your Udemy course assistant. "
                 f"I can help you find courses on topics like {topics_preview}."
-            )
+            ),
+            label="Chat",
+        )
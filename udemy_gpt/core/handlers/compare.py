@@ -5,29 +5,21 @@ Handles compare and compare_topics intents.
 
 import logging
 import re
-from typing import List
-
-from langsmith import traceable
+from typing import AsyncIterator, List
 
+from udemy_common import traceable
+from udemy_gpt.core.handlers.base import BaseHandler, LLMReply, Prepared
 from udemy_gpt.models import IntentClassification, ConversationState
 from udemy_gpt.prompts import get_response_prompt
-from udemy_gpt.services import compare_topics, LLMService
+from udemy_gpt.services import compare_topics
 from udemy_gpt.utils import format_comparison
 
 logger = logging.getLogger(__name__)
 
 
-class CompareHandler:
+class CompareHandler(BaseHandler):
     """Handler for comparison intents."""
 
-    def __init__(self, llm_service: LLMService):
-        """Initialize compare handler.
-
-        Args:
-            llm_service: LLM service for generating responses
-        """
-        self._llm = llm_service
-
     @traceable(name="handle_compare", run_type="chain")
     async def handle_compare(
         self,
@@ -47,6 +39,41 @@ class CompareHandler:
         Returns:
             Comparison response
         """
+        return await self._complete(
+            self._prepare_compare(intent, user_message, state, conversation_history)
+        )
+
+    @traceable(name="stream_compare", run_type="chain", reduce_fn="".join)
+    async def stream_compare(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        state: ConversationState,
+        conversation_history: str = "",
+    ) -> AsyncIterator[str]:
+        """Stream the response to a course comparison.
+
+        Args:
+            intent: Classified intent
+            user_message: Original user message
+            state: Conversation state with search results
+            conversation_history: Optional history
+
+        Yields:
+            Response text chunks
+        """
+        prepared = self._prepare_compare(intent, user_message, state, conversation_history)
+        async for chunk in self._stream(prepared):
+            yield chunk
+
+    def _prepare_compare(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        state: ConversationState,
+        conversation_history: str,
+    ) -> Prepared:
+        """Pick the referenced courses from the last search and build the LLM call."""
         if not state.last_search_results:
             return "Please search for courses first, then I can compare them."
 
@@ -70,7 +97,7 @@ class CompareHandler:
         comparison_text = format_comparison(courses_to_compare)
         prompt = f"User wants to compare:\n{comparison_text}\nProvide detailed comparison and recommendation."
 
-        return await self._llm.call(
+        return LLMReply(
             get_response_prompt("compare"),
             prompt,
             temperature=0.3,
@@ -94,6 +121,38 @@ class CompareHandler:
         Returns:
             Topic comparison response
         """
+        return await self._complete(
+            self._prepare_compare_topics(intent, user_message, conversation_history)
+        )
+
+    @traceable(name="stream_compare_topics", run_type="chain", reduce_fn="".join)
+    async def stream_compare_topics(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        conversation_history: str = "",
+    ) -> AsyncIterator[str]:
+        """Stream the response to a topic comparison.
+
+        Args:
+            intent: Classified intent with topics to compare
+            user_message: Original user message
+            conversation_history: Optional history
+
+        Yields:
+            Response text chunks
+        """
+        prepared = self._prepare_compare_topics(intent, user_message, conversation_history)
+        async for chunk in self._stream(prepared):
+            yield chunk
+
+    def _prepare_compare_topics(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        conversation_history: str,
+    ) -> Prepared:
+        """Gather per-topic statistics and build the LLM call."""
         if len(intent.topics) < 2:
             return "Please specify topics to compare (e.g., 'Python vs JavaScript')."
 
@@ -136,13 +195,11 @@ class CompareHandler:
             f"Analysis: {comparison.recommendation}"
         )
 
-        try:
-            return await self._llm.call(
-                get_response_prompt("compare_topics"),
-                prompt,
-                temperature=0.3,
-                conversation_history=conversation_history,
-            )
-        except Exception as e:
-            logger.error(f"Compare topics LLM failed: {e}")
-            return f"Comparison data:\n{topics_text}\n\n{comparison.recommendation}"
+        return LLMReply(
+            get_response_prompt("compare_topics"),
+            prompt,
+            temperature=0.3,
+            conversation_history=conversation_history,
+            fallback=f"Comparison data:\n{topics_text}\n\n{comparison.recommendation}",
+            label="Compare topics",
+        )
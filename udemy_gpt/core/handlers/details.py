@@ -5,13 +5,14 @@ Handles details intent for showing detailed course information.
 
 import logging
 import re
+from typing import AsyncIterator
 
-from langsmith import traceable
-
-from udemy_gpt.data import get_index, search_course_by_name, generate_course_url
+from udemy_common import traceable
+from udemy_gpt.core.handlers.base import BaseHandler, LLMReply, Prepared
+from udemy_gpt.data import get_index, asearch_course_by_name, generate_course_url
 from udemy_gpt.models import IntentClassification, ConversationState
 from udemy_gpt.prompts import get_response_prompt
-from udemy_gpt.services import fetch_course_details, LLMService
+from udemy_gpt.services import fetch_course_details
 from udemy_gpt.utils import format_live_details, format_kb_details
 
 logger = logging.getLogger(__name__)
@@ -81,17 +82,9 @@ def _extract_course_name(message: str) -> str:
     return ""
 
 
-class DetailsHandler:
+class DetailsHandler(BaseHandler):
     """Handler for course details intent."""
 
-    def __init__(self, llm_service: LLMService):
-        """Initialize details handler.
-
-        Args:
-            llm_service: LLM service for generating responses
-        """
-        self._llm = llm_service
-
     @traceable(name="details_handle_request", run_type="chain")
     async def handle_details(
         self,
@@ -111,6 +104,41 @@ class DetailsHandler:
         Returns:
             Detailed course information response
         """
+        return await self._complete(
+            await self._prepare_details(intent, user_message, state, conversation_history)
+        )
+
+    @traceable(name="details_stream_request", run_type="chain", reduce_fn="".join)
+    async def stream_details(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        state: ConversationState,
+        conversation_history: str = "",
+    ) -> AsyncIterator[str]:
+        """Stream the response to a course details request.
+
+        Args:
+            intent: Classified intent with course reference
+            user_message: Original user message
+            state: Conversation state with search results
+            conversation_history: Optional history
+
+        Yields:
+            Response text chunks
+        """
+        prepared = await self._prepare_details(intent, user_message, state, conversation_history)
+        async for chunk in self._stream(prepared):
+            yield chunk
+
+    async def _prepare_details(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        state: ConversationState,
+        conversation_history: str,
+    ) -> Prepared:
+        """Resolve the course, fetch live details if needed, and build the LLM call."""
         course = None
         course_url = ""
         course_title = ""
@@ -122,7 +150,7 @@ class DetailsHandler:
         if course_name:
             logger.info(f"Searching for course by name: {course_name}")
             index = get_index()
-            course = search_course_by_name(
+            course = await asearch_course_by_name(
                 course_name,
                 index,
                 state.last_search_results
@@ -193,13 +221,11 @@ INSTRUCTIONS:
 2. Then provide your analysis and insights
 3. Do NOT add a separate "Direct Link" at the end - the URL is already in the data"""
 
-        try:
-            return await self._llm.call(
-                get_response_prompt("details"),
-                prompt,
-                temperature=0.3,
-                conversation_history=conversation_history,
-            )
-        except Exception as e:
-            logger.error(f"Details LLM failed: {e}")
-            return f"Course details:\n{details_text}"
+        return LLMReply(
+            get_response_prompt("details"),
+            prompt,
+            temperature=0.3,
+            conversation_history=conversation_history,
+            fallback=f"Course details:\n{details_text}",
+            label="Details",
+        )
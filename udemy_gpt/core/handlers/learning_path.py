@@ -4,11 +4,11 @@ Handles learning_path intent for career-oriented course recommendations.
 """
 
 import logging
-from typing import Dict, List, Set
+from typing import AsyncIterator, Dict, List, Set
 
-from langsmith import traceable
-
-from udemy_gpt.data import get_index, load_multiple_topics, validate_topics, parse_rating, parse_duration
+from udemy_common import traceable
+from udemy_gpt.core.handlers.base import BaseHandler, LLMReply, Prepared
+from udemy_gpt.data import get_index, aload_multiple_topics, validate_topics, parse_rating, parse_duration
 from udemy_gpt.models import IntentClassification, ConversationState
 from udemy_gpt.prompts import get_response_prompt
 from udemy_gpt.services import LLMService
@@ -30,7 +30,7 @@ CAREER_PATHS: Dict[str, List[str]] = {
 }
 
 
-class LearningPathHandler:
+class LearningPathHandler(BaseHandler):
     """Handler for learning path intent."""
 
     def __init__(self, llm_service: LLMService, available_topics: Set[str]):
@@ -40,7 +40,7 @@ class LearningPathHandler:
             llm_service: LLM service for generating responses
             available_topics: Set of available topic slugs
         """
-        self._llm = llm_service
+        super().__init__(llm_service)
         self._available_topics = available_topics
 
     def _detect_career_path(self, goal: str) -> List[str]:
@@ -79,6 +79,41 @@ class LearningPathHandler:
         Returns:
             Learning path response with courses
         """
+        return await self._complete(
+            await self._prepare_learning_path(intent, user_message, state, conversation_history)
+        )
+
+    @traceable(name="stream_learning_path", run_type="chain", reduce_fn="".join)
+    async def stream_learning_path(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        state: ConversationState,
+        conversation_history: str = "",
+    ) -> AsyncIterator[str]:
+        """Stream the response to a learning path request.
+
+        Args:
+            intent: Classified intent with goal
+            user_message: Original user message
+            state: Conversation state
+            conversation_history: Optional history
+
+        Yields:
+            Response text chunks
+        """
+        prepared = await self._prepare_learning_path(intent, user_message, state, conversation_history)
+        async for chunk in self._stream(prepared):
+            yield chunk
+
+    async def _prepare_learning_path(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        state: ConversationState,
+        conversation_history: str,
+    ) -> Prepared:
+        """Pick courses for each topic of the career path and build the LLM call."""
         goal = intent.goal or user_message
 
         # Detect topics from career path
@@ -92,7 +127,7 @@ class LearningPathHandler:
             return f"No courses found for that path. Available: {', '.join(list(self._available_topics)[:10])}"
 
         index = get_index()
-        all_courses = load_multiple_topics(validated_topics, index, deduplicate=True)
+        all_courses = await aload_multiple_topics(validated_topics, index, deduplicate=True)
 
         # Get top courses per topic
         path_courses = []
@@ -137,13 +172,11 @@ class LearningPathHandler:
             f"Create structured learning path with best course per topic."
         )
 
-        try:
-            return await self._llm.call(
-                get_response_prompt("learning_path"),
-                prompt,
-                temperature=0.4,
-                conversation_history=conversation_history,
-            )
-        except Exception as e:
-            logger.error(f"Learning path LLM failed: {e}")
-            return f"Courses for your learning path:\n{path_text}"
+        return LLMReply(
+            get_response_prompt("learning_path"),
+            prompt,
+            temperature=0.4,
+            conversation_history=conversation_history,
+            fallback=f"Courses for your learning path:\n{path_text}",
+            label="Learning path",
+        )
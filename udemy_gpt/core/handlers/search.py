@@ -4,25 +4,26 @@ Handles search, recommend, filter, top_valuable, and stats intents.
 """
 
 import logging
-from typing import Any, Dict, List, Set
-
-from langsmith import traceable
+from typing import Any, AsyncIterator, Dict, List, Sequence, Set, Tuple
 
+from udemy_common import traceable
+from udemy_gpt.config import settings
+from udemy_gpt.core.handlers.base import BaseHandler, LLMReply, Prepared
 from udemy_gpt.data import (
     get_index,
-    load_multiple_topics,
+    aload_multiple_topics,
     validate_topics,
     get_available_topics,
 )
 from udemy_gpt.models import IntentClassification, ConversationState
 from udemy_gpt.prompts import get_analysis_prompt, get_response_prompt
-from udemy_gpt.services import filter_courses, get_topic_stats, LLMService
-from udemy_gpt.utils import describe_filters, format_courses_for_llm
+from udemy_gpt.services import filter_courses, get_topic_stats, rank_courses, LLMService
+from udemy_gpt.utils import build_course_context, describe_filters, format_courses_for_llm
 
 logger = logging.getLogger(__name__)
 
 
-class SearchHandler:
+class SearchHandler(BaseHandler):
     """Handler for search-related intents."""
 
     def __init__(self, llm_service: LLMService, available_topics: Set[str]):
@@ -32,9 +33,29 @@ class SearchHandler:
             llm_service: LLM service for generating responses
             available_topics: Set of available topic slugs
         """
-        self._llm = llm_service
+        super().__init__(llm_service)
         self._available_topics = available_topics
 
+    def _course_context(
+        self, courses: Sequence[Dict], limit: int, sort_by: str = "rating"
+    ) -> Tuple[str, Sequence[Dict]]:
+        """Rank matching courses and pack the best into the prompt budget.
+
+        Args:
+            courses: Filtered courses
+            limit: Number of courses the user asked for
+            sort_by: Ranking criterion requested by the user
+
+        Returns:
+            Tuple of (compact course table, courses listed in it, in order)
+        """
+        ranked = rank_courses(courses, sort_by=sort_by, limit=max(limit, settings.llm.context_max_courses))
+        courses_text, shown = build_course_context(
+            ranked, settings.llm.context_token_budget, total=len(courses), sort_by=sort_by
+        )
+        logger.debug(f"Course context: {shown} of {len(courses)} courses by {sort_by}")
+        return courses_text, ranked[:shown]
+
     @traceable(name="handle_search", run_type="chain")
     async def handle_search(
         self,
@@ -54,12 +75,47 @@ class SearchHandler:
         Returns:
             Response text with course recommendations
         """
+        return await self._complete(
+            await self._prepare_search(intent, user_message, state, conversation_history)
+        )
+
+    @traceable(name="stream_search", run_type="chain", reduce_fn="".join)
+    async def stream_search(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        state: ConversationState,
+        conversation_history: str = "",
+    ) -> AsyncIterator[str]:
+        """Stream the response to search/recommend intents.
+
+        Args:
+            intent: Classified intent with topics and filters
+            user_message: Original user message
+            state: Conversation state (will be updated)
+            conversation_history: Optional conversation history
+
+        Yields:
+            Response text chunks
+        """
+        prepared = await self._prepare_search(intent, user_message, state, conversation_history)
+        async for chunk in self._stream(prepared):
+            yield chunk
+
+    async def _prepare_search(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        state: ConversationState,
+        conversation_history: str,
+    ) -> Prepared:
+        """Load, filter and rank courses for a search and build the LLM call."""
         if not intent.topics:
             suggestions = ", ".join(list(self._available_topics)[:10])
             return f"I couldn't determine which topics to search. Available topics include: {suggestions}"
 
         index = get_index()
-        courses = load_multiple_topics(intent.topics, index, deduplicate=True)
+        courses = await aload_multiple_topics(intent.topics, index, deduplicate=True)
 
         if not courses:
             suggestions = ", ".join(list(self._available_topics)[:10])
@@ -83,10 +139,11 @@ class SearchHandler:
             return f"No courses match your criteria ({filter_desc}). Found {total_before_filter} courses but none matched filters."
 
         limit = int(filters.get("limit") or 10)
-        state.last_search_results = courses
+        courses_text, ranked = self._course_context(courses, limit, filters.get("sort_by", "rating"))
+        # Keep the listed order so "the second one" refers to rank 2
+        state.last_search_results = list(ranked)
         state.last_topic = intent.topics[0] if intent.topics else ""
 
-        courses_text = format_courses_for_llm(courses)
         filter_summary = describe_filters(filters)
 
         prompt = get_analysis_prompt().format(
@@ -94,16 +151,14 @@ class SearchHandler:
             course_data=f"Topics: {', '.join(intent.topics)}\nFilters: {filter_summary}\nTotal: {len(courses)}\nRequested: Top {limit}\n\n{courses_text}"
         )
 
-        try:
-            return await self._llm.call(
-                get_response_prompt(intent.intent),
-                prompt,
-                temperature=0.4,
-                conversation_history=conversation_history,
-            )
-        except Exception as e:
-            logger.error(f"Search handler LLM failed: {e}")
-            return f"Here are the matching courses:\n{courses_text}"
+        return LLMReply(
+            get_response_prompt(intent.intent),
+            prompt,
+            temperature=0.4,
+            conversation_history=conversation_history,
+            fallback=f"Here are the matching courses:\n{format_courses_for_llm(ranked[:limit])}",
+            label="Search handler",
+        )
 
     @traceable(name="handle_top_valuable", run_type="chain")
     async def handle_top_valuable(
@@ -124,6 +179,41 @@ class SearchHandler:
         Returns:
             Response with top courses
         """
+        return await self._complete(
+            await self._prepare_top_valuable(intent, user_message, state, conversation_history)
+        )
+
+    @traceable(name="stream_top_valuable", run_type="chain", reduce_fn="".join)
+    async def stream_top_valuable(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        state: ConversationState,
+        conversation_history: str = "",
+    ) -> AsyncIterator[str]:
+        """Stream the response to a top/valuable courses request.
+
+        Args:
+            intent: Classified intent
+            user_message: Original user message
+            state: Conversation state
+            conversation_history: Optional history
+
+        Yields:
+            Response text chunks
+        """
+        prepared = await self._prepare_top_valuable(intent, user_message, state, conversation_history)
+        async for chunk in self._stream(prepared):
+            yield chunk
+
+    async def _prepare_top_valuable(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        state: ConversationState,
+        conversation_history: str,
+    ) -> Prepared:
+        """Select top courses (popular topics by default) and build the LLM call."""
         filters = intent.filters or {}
         message_lower = user_message.lower()
 
@@ -139,11 +229,11 @@ class SearchHandler:
         index = get_index()
 
         if intent.topics:
-            courses = load_multiple_topics(intent.topics, index, deduplicate=True)
+            courses = await aload_multiple_topics(intent.topics, index, deduplicate=True)
         else:
             popular = ["python", "javascript", "data-science", "machine-learning", "web-development"]
             validated = validate_topics(popular)
-            courses = load_multiple_topics(validated, index, deduplicate=True)
+            courses = await aload_multiple_topics(validated, index, deduplicate=True)
 
         if courses:
             courses = filter_courses(
@@ -159,8 +249,8 @@ class SearchHandler:
         if not courses:
             return "No courses match your criteria. Try relaxing your filters."
 
-        state.last_search_results = courses
-        courses_text = format_courses_for_llm(courses)
+        courses_text, ranked = self._course_context(courses, limit, filters.get("sort_by", "rating"))
+        state.last_search_results = list(ranked)
         filter_summary = describe_filters(filters)
 
         prompt = get_analysis_prompt().format(
@@ -168,16 +258,14 @@ class SearchHandler:
             course_data=f"Topics: {', '.join(intent.topics) if intent.topics else 'popular'}\nFilters: {filter_summary}\nTotal: {len(courses)}\nRequested: Top {limit}\n\n{courses_text}"
         )
 
-        try:
-            return await self._llm.call(
-                get_response_prompt("top_valuable"),
-                prompt,
-                temperature=0.4,
-                conversation_history=conversation_history,
-            )
-        except Exception as e:
-            logger.error(f"Top valuable LLM failed: {e}")
-            return f"Here are the courses:\n{courses_text}"
+        return LLMReply(
+            get_response_prompt("top_valuable"),
+            prompt,
+            temperature=0.4,
+            conversation_history=conversation_history,
+            fallback=f"Here are the courses:\n{format_courses_for_llm(ranked[:limit])}",
+            label="Top valuable",
+        )
 
     @traceable(name="handle_stats", run_type="chain")
     async def handle_stats(
@@ -196,6 +284,36 @@ class SearchHandler:
         Returns:
             Statistics response
         """
+        return await self._complete(self._prepare_stats(intent, user_message, conversation_history))
+
+    @traceable(name="stream_stats", run_type="chain", reduce_fn="".join)
+    async def stream_stats(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        conversation_history: str = "",
+    ) -> AsyncIterator[str]:
+        """Stream the response to a statistics query.
+
+        Args:
+            intent: Classified intent
+            user_message: Original user message
+            conversation_history: Optional history
+
+        Yields:
+            Response text chunks
+        """
+        prepared = self._prepare_stats(intent, user_message, conversation_history)
+        async for chunk in self._stream(prepared):
+            yield chunk
+
+    def _prepare_stats(
+        self,
+        intent: IntentClassification,
+        user_message: str,
+        conversation_history: str,
+    ) -> Prepared:
+        """Gather topic or knowledge base statistics and build the LLM call."""
         if intent.topics:
             stats_text = ""
             for topic in intent.topics:
@@ -220,7 +338,7 @@ Knowledge Base Statistics:
 
         prompt = f"User: {user_message}\n\nStatistics:\n{stats_text}"
 
-        return await self._llm.call(
+        return LLMReply(
             get_response_prompt("stats"),
             prompt,
             temperature=0.3,
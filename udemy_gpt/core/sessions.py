@@ -0,0 +1,277 @@
+"""Session management for serving many conversations from one agent.
+
+Each session owns a ``ConversationState``; the ``UdemyGPT`` agent and
+everything behind it (topic index, course stores, LLM client, browser)
+is shared. Turns of one session run one at a time, while turns of
+different sessions run concurrently up to ``max_concurrent_turns``. A
+bounded number of further turns may wait; beyond that, requests are
+rejected with ``ServerBusyError`` so load is pushed back to clients
+instead of queueing without limit. Idle sessions expire after the TTL.
+"""
+
+import asyncio
+import contextlib
+import logging
+import secrets
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Optional
+
+from udemy_gpt.config import settings
+from udemy_gpt.exceptions import ServerBusyError, SessionBusyError, SessionNotFoundError
+from udemy_gpt.models import ConversationState
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Session:
+    """A single user's conversation.
+
+    Attributes:
+        session_id: Opaque session identifier
+        state: Conversation state of the session
+        created: Creation time (monotonic seconds)
+        last_active: Time of the last request (monotonic seconds)
+        turns: Completed chat turns
+    """
+
+    session_id: str
+    state: ConversationState = field(default_factory=ConversationState)
+    created: float = field(default_factory=time.monotonic)
+    last_active: float = field(default_factory=time.monotonic)
+    turns: int = 0
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    @property
+    def busy(self) -> bool:
+        """Whether a turn is in progress."""
+        return self._lock.locked()
+
+    def idle_for(self, now: Optional[float] = None) -> float:
+        """Get the seconds since the last request.
+
+        Args:
+            now: Current monotonic time (defaults to now)
+
+        Returns:
+            Idle time in seconds
+        """
+        return (now if now is not None else time.monotonic()) - self.last_active
+
+
+class SessionManager:
+    """Registry of live sessions with TTL eviction and turn admission.
+
+    Example:
+        ```python
+        sessions = SessionManager()
+        session = sessions.create()
+        async with sessions.turn(session.session_id) as state:
+            response = await agent.chat("Find Python courses", state)
+        ```
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_sessions: Optional[int] = None,
+        max_concurrent_turns: Optional[int] = None,
+        max_pending_turns: Optional[int] = None,
+    ):
+        """Initialize the manager (defaults come from server settings).
+
+        Args:
+            ttl: Seconds an idle session is kept
+            max_sessions: Maximum live sessions
+            max_concurrent_turns: Turns processed at once across sessions
+            max_pending_turns: Turns allowed to wait for a free slot
+        """
+        server_settings = settings.server
+        self.ttl = ttl if ttl is not None else server_settings.session_ttl
+        self.max_sessions = max_sessions if max_sessions is not None else server_settings.max_sessions
+        self.max_concurrent_turns = (
+            max_concurrent_turns if max_concurrent_turns is not None
+            else server_settings.max_concurrent_turns
+        )
+        self.max_pending_turns = (
+            max_pending_turns if max_pending_turns is not None
+            else server_settings.max_pending_turns
+        )
+
+        self._sessions: Dict[str, Session] = {}
+        self._slots = asyncio.Semaphore(self.max_concurrent_turns)
+        self._sweeper: Optional[asyncio.Task] = None
+
+        self.active_turns = 0
+        self.pending_turns = 0
+        self.completed_turns = 0
+        self.rejected_turns = 0
+        self.expired_sessions = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    # =========================================================================
+    # Session Lifecycle
+    # =========================================================================
+
+    def create(self) -> Session:
+        """Create a new session.
+
+        When the session limit is reached, the least recently active idle
+        session is evicted to make room.
+
+        Returns:
+            New session
+
+        Raises:
+            ServerBusyError: If the limit is reached and every session is busy
+        """
+        self.expire()
+        if len(self._sessions) >= self.max_sessions:
+            idle = [s for s in self._sessions.values() if not s.busy]
+            if not idle:
+                raise ServerBusyError(f"Session limit reached ({self.max_sessions})")
+            oldest = min(idle, key=lambda s: s.last_active)
+            del self._sessions[oldest.session_id]
+            self.expired_sessions += 1
+            logger.info(f"Evicted session {oldest.session_id} to stay within {self.max_sessions} sessions")
+
+        session = Session(session_id=secrets.token_urlsafe(16))
+        self._sessions[session.session_id] = session
+        logger.debug(f"Created session {session.session_id}")
+        return session
+
+    def get(self, session_id: str) -> Session:
+        """Look up a live session and mark it active.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            The session
+
+        Raises:
+            SessionNotFoundError: If the session does not exist or expired
+        """
+        session = self._sessions.get(session_id)
+        if session is None or (not session.busy and session.idle_for() > self.ttl):
+            raise SessionNotFoundError(session_id)
+        session.last_active = time.monotonic()
+        return session
+
+    def delete(self, session_id: str) -> bool:
+        """Delete a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if the session existed
+        """
+        return self._sessions.pop(session_id, None) is not None
+
+    def expire(self) -> int:
+        """Remove sessions idle for longer than the TTL.
+
+        Returns:
+            Number of sessions removed
+        """
+        now = time.monotonic()
+        expired = [
+            session_id for session_id, session in self._sessions.items()
+            if not session.busy and session.idle_for(now) > self.ttl
+        ]
+        for session_id in expired:
+            del self._sessions[session_id]
+        if expired:
+            self.expired_sessions += len(expired)
+            logger.info(f"Expired {len(expired)} idle sessions")
+        return len(expired)
+
+    def start(self) -> None:
+        """Start periodic TTL eviction on the running event loop."""
+        if self._sweeper is None:
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep())
+
+    async def close(self) -> None:
+        """Stop periodic eviction and drop all sessions."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweeper
+            self._sweeper = None
+        self._sessions.clear()
+
+    async def _sweep(self) -> None:
+        """Expire idle sessions periodically."""
+        interval = min(60.0, self.ttl / 4)
+        while True:
+            await asyncio.sleep(interval)
+            self.expire()
+
+    # =========================================================================
+    # Turn Admission
+    # =========================================================================
+
+    @contextlib.asynccontextmanager
+    async def turn(self, session_id: str) -> AsyncIterator[ConversationState]:
+        """Run one chat turn of a session.
+
+        Waits for a free turn slot; the session's state may be used until
+        the context exits.
+
+        Args:
+            session_id: Session identifier
+
+        Yields:
+            Conversation state of the session
+
+        Raises:
+            SessionNotFoundError: If the session does not exist or expired
+            SessionBusyError: If the session already has a turn in progress
+            ServerBusyError: If too many turns are already waiting
+        """
+        session = self.get(session_id)
+        if session.busy:
+            self.rejected_turns += 1
+            raise SessionBusyError(session_id)
+        if self._slots.locked() and self.pending_turns >= self.max_pending_turns:
+            self.rejected_turns += 1
+            raise ServerBusyError(f"Too many pending turns ({self.pending_turns} waiting)")
+
+        async with session._lock:
+            self.pending_turns += 1
+            try:
+                await self._slots.acquire()
+            finally:
+                self.pending_turns -= 1
+
+            self.active_turns += 1
+            try:
+                yield session.state
+            finally:
+                self.active_turns -= 1
+                self._slots.release()
+                session.turns += 1
+                session.last_active = time.monotonic()
+                self.completed_turns += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get session and turn counters.
+
+        Returns:
+            Dictionary with live sessions, turn load and counters
+        """
+        return {
+            "sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "active_turns": self.active_turns,
+            "pending_turns": self.pending_turns,
+            "max_concurrent_turns": self.max_concurrent_turns,
+            "max_pending_turns": self.max_pending_turns,
+            "completed_turns": self.completed_turns,
+            "rejected_turns": self.rejected_turns,
+            "expired_sessions": self.expired_sessions,
+        }
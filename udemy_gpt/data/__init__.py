@@ -1,10 +1,23 @@
 """Data access layer for Udemy GPT.
 
 This module provides:
-- CSV data loading and caching (repository)
+- Columnar, parse-once course storage (course_store)
+- CSV data loading and caching (repository, topic_cache)
+- Memory-mapped binary corpus snapshot (snapshot)
+- Course name and full-text search indexes (search_index)
 - Topic indexing and validation (topic_index)
 """
 
+from udemy_gpt.data.course_store import (
+    CourseStore,
+    CourseRow,
+    StringColumn,
+    StringInterner,
+    LEVELS,
+    TOPICS,
+    SECTIONS,
+)
+
 from udemy_gpt.data.repository import (
     # Parsing utilities
     parse_number,
@@ -13,32 +26,73 @@ from udemy_gpt.data.repository import (
     parse_rating,
     # Loading functions
     load_csv,
+    build_course_store,
+    build_snapshot,
+    get_snapshot,
     load_topic_courses,
     load_multiple_topics,
+    aload_topic_courses,
+    aload_multiple_topics,
     load_all_courses,
     # Cache management
     clear_cache,
     get_cache_stats,
+    pin_topics,
+    unpin_topics,
+    # Topic statistics
+    compute_topic_stats,
     # Course search
+    get_course_name_index,
+    aget_course_name_index,
+    get_course_text_index,
     search_course_by_name,
+    asearch_course_by_name,
     generate_course_url,
 )
 
+from udemy_gpt.data.topic_cache import TopicCache
+
+from udemy_gpt.data.snapshot import (
+    CourseSnapshot,
+    SNAPSHOT_FORMAT_VERSION,
+)
+
+from udemy_gpt.data.search_index import (
+    BM25Index,
+    CourseNameIndex,
+    tokenize,
+    content_words,
+    searchable_text,
+    trigrams,
+)
+
 from udemy_gpt.data.topic_index import (
+    TOPIC_SHORTLIST_SIZE,
     # Index management
     build_index,
     get_index,
     get_topic_list_for_llm,
+    get_topic_stats_table,
+    shortlist_topics,
     reset_index,
     # Topic queries
     get_available_slugs,
     get_available_topics,
+    find_topics_in_text,
     search_topics,
     # Validation
     validate_topics,
 )
 
 __all__ = [
+    # Course Store
+    "CourseStore",
+    "CourseRow",
+    "StringColumn",
+    "StringInterner",
+    "LEVELS",
+    "TOPICS",
+    "SECTIONS",
     # Repository - Parsing
     "parse_number",
     "parse_price",
@@ -46,22 +100,51 @@ __all__ = [
     "parse_rating",
     # Repository - Loading
     "load_csv",
+    "build_course_store",
+    "build_snapshot",
+    "get_snapshot",
     "load_topic_courses",
     "load_multiple_topics",
+    "aload_topic_courses",
+    "aload_multiple_topics",
     "load_all_courses",
     # Repository - Cache
     "clear_cache",
     "get_cache_stats",
+    "pin_topics",
+    "unpin_topics",
+    # Repository - Statistics
+    "compute_topic_stats",
     # Repository - Course search
+    "get_course_name_index",
+    "aget_course_name_index",
+    "get_course_text_index",
     "search_course_by_name",
+    "asearch_course_by_name",
+    # Topic Cache
+    "TopicCache",
+    # Snapshot
+    "CourseSnapshot",
+    "SNAPSHOT_FORMAT_VERSION",
+    # Search Index
+    "BM25Index",
+    "CourseNameIndex",
+    "tokenize",
+    "content_words",
+    "searchable_text",
+    "trigrams",
     "generate_course_url",
     # Topic Index
+    "TOPIC_SHORTLIST_SIZE",
     "build_index",
     "get_index",
     "get_topic_list_for_llm",
+    "get_topic_stats_table",
+    "shortlist_topics",
     "reset_index",
     "get_available_slugs",
     "get_available_topics",
+    "find_topics_in_text",
     "search_topics",
     "validate_topics",
 ]
@@ -0,0 +1,35 @@
+"""Build the binary course snapshot from the course CSVs.
+
+Usage:
+    python -m udemy_gpt.data.build_snapshot [--output PATH]
+
+Re-run after re-scraping; topics whose CSV changed since the snapshot
+was built are read from the CSV until then.
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+from udemy_gpt.config import settings
+from udemy_gpt.data.repository import build_snapshot
+from udemy_gpt.data.topic_index import get_index
+
+
+def main() -> None:
+    """Entry point for the snapshot build."""
+    parser = argparse.ArgumentParser(description="Compile course CSVs into a binary snapshot.")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help=f"Snapshot file (default: {settings.paths.course_snapshot})",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format=settings.logging.format)
+    build_snapshot(get_index(), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,560 @@
+"""Columnar storage for course data.
+
+Course CSVs are parsed once at load time into typed column arrays so that
+filtering, ranking and statistics work on numbers instead of re-parsing
+the raw strings on every query. Rows are only materialized as lightweight
+read-only views when results are rendered.
+"""
+
+import sys
+import threading
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Raw text columns as they appear in the scraped course CSVs
+TEXT_COLUMNS: Tuple[str, ...] = (
+    "title",
+    "url",
+    "instructor",
+    "rating",
+    "reviews_count",
+    "price",
+    "original_price",
+    "duration",
+    "lectures",
+    "level",
+)
+
+# Derived columns exposed on every row view
+META_COLUMNS: Tuple[str, ...] = ("topic", "section")
+
+# Supported ranking criteria (see CourseStore.rank_key)
+SORT_KEYS: Tuple[str, ...] = ("rating", "reviews", "price", "price_desc", "duration", "duration_asc")
+
+
+def _float_bits(values: np.ndarray) -> np.ndarray:
+    """Map non-negative floats to integers with the same ordering."""
+    return values.astype(np.float32).view(np.uint32).astype(np.int64)
+
+
+# =============================================================================
+# String Interning
+# =============================================================================
+
+class StringInterner:
+    """Bidirectional mapping between strings and small integer codes.
+
+    Used for low-cardinality columns (level, topic, section) so each row
+    stores a compact integer instead of its own string object. Interning
+    is thread-safe, as topics may be parsed on worker threads.
+    """
+
+    def __init__(self):
+        """Initialize an empty interner."""
+        self._codes: Dict[str, int] = {}
+        self._values: List[str] = []
+        self._lock = threading.Lock()
+
+    def intern(self, value: str) -> int:
+        """Get the code for a value, assigning a new one if needed.
+
+        Args:
+            value: String to intern
+
+        Returns:
+            Integer code for the value
+        """
+        code = self._codes.get(value)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(value)
+                if code is None:
+                    code = len(self._values)
+                    self._values.append(value)
+                    self._codes[value] = code
+        return code
+
+    def code(self, value: str) -> Optional[int]:
+        """Look up the code for a value without interning it.
+
+        Args:
+            value: String to look up
+
+        Returns:
+            Integer code, or None if the value was never interned
+        """
+        return self._codes.get(value)
+
+    def value(self, code: int) -> str:
+        """Get the string for a code.
+
+        Args:
+            code: Integer code
+
+        Returns:
+            Interned string value
+        """
+        return self._values[code]
+
+    def codes_where(self, predicate: Callable[[str], bool]) -> List[int]:
+        """Get codes of all interned values matching a predicate.
+
+        Args:
+            predicate: Function called with each interned value
+
+        Returns:
+            List of matching codes
+        """
+        return [code for code, value in enumerate(self._values) if predicate(value)]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+# Shared interners so codes are comparable across stores
+LEVELS = StringInterner()
+TOPICS = StringInterner()
+SECTIONS = StringInterner()
+
+
+# =============================================================================
+# String Columns
+# =============================================================================
+
+class StringColumn(Sequence):
+    """Read-only text column backed by a UTF-8 byte heap.
+
+    Each value is the byte range ``heap[starts[i]:ends[i]]``, decoded on
+    access. The heap is typically a memory-mapped corpus snapshot, so
+    columns, slices and selections share one copy of the text.
+    """
+
+    __slots__ = ("starts", "ends", "heap")
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, heap: memoryview):
+        """Initialize column.
+
+        Args:
+            starts: Start offset of each value in the heap
+            ends: End offset of each value in the heap
+            heap: UTF-8 encoded text of all values
+        """
+        self.starts = starts
+        self.ends = ends
+        self.heap = heap
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[str, "StringColumn"]:
+        if isinstance(item, slice):
+            return StringColumn(self.starts[item], self.ends[item], self.heap)
+        return bytes(self.heap[int(self.starts[item]):int(self.ends[item])]).decode("utf-8")
+
+    def take(self, indices: np.ndarray) -> "StringColumn":
+        """Select values by position without copying any text.
+
+        Args:
+            indices: Row positions in the desired order
+
+        Returns:
+            New column over the same heap
+        """
+        return StringColumn(self.starts[indices], self.ends[indices], self.heap)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of offsets plus the heap text this column references."""
+        return int(self.starts.nbytes + self.ends.nbytes + (self.ends - self.starts).sum())
+
+    def __repr__(self) -> str:
+        return f"StringColumn({len(self)} values)"
+
+
+def _take_text(values: Sequence, idx: np.ndarray) -> Sequence:
+    """Select rows of a text column, keeping heap-backed columns zero-copy."""
+    if isinstance(values, StringColumn):
+        return values.take(idx)
+    return [values[i] for i in idx.tolist()]
+
+
+def _concat_text(columns: List[Sequence]) -> Sequence:
+    """Concatenate text columns, staying on a shared heap when possible."""
+    first = columns[0]
+    if isinstance(first, StringColumn) and all(
+        isinstance(c, StringColumn) and c.heap is first.heap for c in columns
+    ):
+        return StringColumn(
+            np.concatenate([c.starts for c in columns]),
+            np.concatenate([c.ends for c in columns]),
+            first.heap,
+        )
+    return [value for column in columns for value in column]
+
+
+# =============================================================================
+# Row Views
+# =============================================================================
+
+class CourseRow(Mapping):
+    """Read-only dictionary view over a single row of a CourseStore.
+
+    Behaves like the ``csv.DictReader`` row dictionaries used previously
+    (including the ``topic`` and ``section`` keys), but reads its values
+    from the owning store on access.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "CourseStore", index: int):
+        """Initialize row view.
+
+        Args:
+            store: Owning course store
+            index: Row position within the store
+        """
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        return self._store._value(key, self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.columns)
+
+    def __len__(self) -> int:
+        return len(self._store.columns)
+
+    def __repr__(self) -> str:
+        return f"CourseRow({dict(self)!r})"
+
+
+# =============================================================================
+# Course Store
+# =============================================================================
+
+IndexLike = Union[Sequence, np.ndarray]
+
+
+class CourseStore(Sequence):
+    """Columnar block of courses with typed numeric columns.
+
+    Numeric fields are parsed once into NumPy arrays (``rating``, ``price``,
+    ``hours``, ``reviews``) and low-cardinality fields are stored as interned
+    codes (``level_code``, ``topic_code``, ``section_code``). The original
+    CSV text is kept per column for display, either as lists of strings or
+    as ``StringColumn`` views into a corpus snapshot.
+
+    The store is itself a sequence of ``CourseRow`` views, so it can be
+    passed anywhere a list of course dictionaries was expected.
+    """
+
+    def __init__(
+        self,
+        text: Dict[str, Sequence],
+        rating: np.ndarray,
+        price: np.ndarray,
+        hours: np.ndarray,
+        reviews: np.ndarray,
+        bestseller: np.ndarray,
+        level_code: np.ndarray,
+        topic_code: np.ndarray,
+        section_code: np.ndarray,
+    ):
+        """Initialize store from prepared columns.
+
+        Args:
+            text: Raw text columns keyed by CSV header (lists of strings
+                or ``StringColumn``)
+            rating: Parsed ratings (float32)
+            price: Parsed prices (float32, 0 for free)
+            hours: Parsed durations in hours (float32)
+            reviews: Parsed review counts (int32)
+            bestseller: Bestseller flags (bool)
+            level_code: Interned lowercase level codes (int16)
+            topic_code: Interned topic slug codes (int16)
+            section_code: Interned section codes (int16)
+        """
+        self.text = text
+        self.rating = rating
+        self.price = price
+        self.hours = hours
+        self.reviews = reviews
+        self.bestseller = bestseller
+        self.level_code = level_code
+        self.topic_code = topic_code
+        self.section_code = section_code
+        self.columns: Tuple[str, ...] = tuple(text) + META_COLUMNS
+        self._rank_keys: Dict[str, np.ndarray] = {}
+        self._orderings: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def empty(cls) -> "CourseStore":
+        """Create an empty store."""
+        return cls(
+            text={name: [] for name in TEXT_COLUMNS},
+            rating=np.empty(0, dtype=np.float32),
+            price=np.empty(0, dtype=np.float32),
+            hours=np.empty(0, dtype=np.float32),
+            reviews=np.empty(0, dtype=np.int32),
+            bestseller=np.empty(0, dtype=bool),
+            level_code=np.empty(0, dtype=np.int16),
+            topic_code=np.empty(0, dtype=np.int16),
+            section_code=np.empty(0, dtype=np.int16),
+        )
+
+    # -------------------------------------------------------------------------
+    # Sequence protocol
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.rating)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[CourseRow, "CourseStore"]:
+        if isinstance(item, slice):
+            return self.take(np.arange(len(self))[item])
+        index = int(item)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CourseStore index out of range")
+        return CourseRow(self, index)
+
+    def __iter__(self) -> Iterator[CourseRow]:
+        for index in range(len(self)):
+            yield CourseRow(self, index)
+
+    def __repr__(self) -> str:
+        return f"CourseStore({len(self)} courses)"
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the store.
+
+        Counts numeric columns, cached ranking keys and orderings, and the
+        text columns (string objects for lists, referenced heap bytes for
+        ``StringColumn``).
+        """
+        total = sum(
+            array.nbytes
+            for array in (
+                self.rating, self.price, self.hours, self.reviews, self.bestseller,
+                self.level_code, self.topic_code, self.section_code,
+            )
+        )
+        total += sum(key.nbytes for key in self._rank_keys.values())
+        total += sum(order.nbytes for order in self._orderings.values())
+        for values in self.text.values():
+            if isinstance(values, StringColumn):
+                total += values.nbytes
+            else:
+                total += sys.getsizeof(values) + sum(sys.getsizeof(v) for v in values)
+        return total
+
+    # -------------------------------------------------------------------------
+    # Column access
+    # -------------------------------------------------------------------------
+
+    def _value(self, key: str, index: int) -> Any:
+        """Get a single cell for a row view."""
+        if key == "topic":
+            return TOPICS.value(int(self.topic_code[index]))
+        if key == "section":
+            return SECTIONS.value(int(self.section_code[index]))
+        return self.text[key][index]
+
+    def rows(self, indices: Optional[IndexLike] = None) -> List[CourseRow]:
+        """Materialize row views.
+
+        Args:
+            indices: Optional row positions (defaults to all rows)
+
+        Returns:
+            List of row views
+        """
+        if indices is None:
+            return list(self)
+        return [CourseRow(self, int(i)) for i in indices]
+
+    def take(self, indices: IndexLike) -> "CourseStore":
+        """Create a new store containing only the given rows.
+
+        Args:
+            indices: Row positions in the desired order
+
+        Returns:
+            New CourseStore with the selected rows
+        """
+        idx = np.asarray(indices, dtype=np.intp)
+        taken = CourseStore(
+            text={name: _take_text(values, idx) for name, values in self.text.items()},
+            rating=self.rating[idx],
+            price=self.price[idx],
+            hours=self.hours[idx],
+            reviews=self.reviews[idx],
+            bestseller=self.bestseller[idx],
+            level_code=self.level_code[idx],
+            topic_code=self.topic_code[idx],
+            section_code=self.section_code[idx],
+        )
+
+        taken._rank_keys = {name: key[idx] for name, key in self._rank_keys.items()}
+        if self._orderings and (len(idx) < 2 or bool(np.all(idx[1:] > idx[:-1]))):
+            # Increasing selections keep relative order, so the parent's
+            # orderings can be narrowed instead of re-sorted
+            position = np.full(len(self), -1, dtype=np.intp)
+            position[idx] = np.arange(len(idx))
+            for name, order in self._orderings.items():
+                narrowed = position[order]
+                taken._orderings[name] = narrowed[narrowed >= 0]
+        return taken
+
+    @classmethod
+    def concat(cls, stores: Iterable["CourseStore"]) -> "CourseStore":
+        """Concatenate several stores into one.
+
+        Args:
+            stores: Stores to combine, in order
+
+        Returns:
+            Combined CourseStore
+        """
+        stores = [s for s in stores if len(s)]
+        if not stores:
+            return cls.empty()
+        if len(stores) == 1:
+            return stores[0]
+
+        names: List[str] = []
+        for store in stores:
+            names.extend(name for name in store.text if name not in names)
+
+        text = {
+            name: _concat_text([store.text.get(name, [""] * len(store)) for store in stores])
+            for name in names
+        }
+
+        combined = cls(
+            text=text,
+            rating=np.concatenate([s.rating for s in stores]),
+            price=np.concatenate([s.price for s in stores]),
+            hours=np.concatenate([s.hours for s in stores]),
+            reviews=np.concatenate([s.reviews for s in stores]),
+            bestseller=np.concatenate([s.bestseller for s in stores]),
+            level_code=np.concatenate([s.level_code for s in stores]),
+            topic_code=np.concatenate([s.topic_code for s in stores]),
+            section_code=np.concatenate([s.section_code for s in stores]),
+        )
+
+        shared_keys = set.intersection(*(set(s._rank_keys) for s in stores))
+        combined._rank_keys = {
+            name: np.concatenate([s._rank_keys[name] for s in stores])
+            for name in shared_keys
+        }
+        return combined
+
+    # -------------------------------------------------------------------------
+    # Ranking
+    # -------------------------------------------------------------------------
+
+    def rank_key(self, sort_by: str) -> np.ndarray:
+        """Get the integer ranking key for a sort criterion.
+
+        Keys are computed once per store and cached; larger keys rank
+        first and ties keep row order. Ratings are ranked by
+        ``(rating, reviews)`` packed into one int64.
+
+        Args:
+            sort_by: Sort criterion (rating, reviews, price, price_desc,
+                duration, duration_asc); unknown values fall back to rating
+
+        Returns:
+            int64 array of ranking keys
+        """
+        if sort_by not in SORT_KEYS:
+            sort_by = "rating"
+
+        key = self._rank_keys.get(sort_by)
+        if key is None:
+            reviews = np.maximum(self.reviews, 0).astype(np.int64)
+            if sort_by == "reviews":
+                key = reviews
+            elif sort_by == "price":
+                key = -_float_bits(self.price)
+            elif sort_by == "price_desc":
+                key = _float_bits(self.price)
+            elif sort_by == "duration":
+                key = _float_bits(self.hours)
+            elif sort_by == "duration_asc":
+                key = -_float_bits(self.hours)
+            else:
+                key = (_float_bits(self.rating) << 32) | reviews
+            self._rank_keys[sort_by] = key
+        return key
+
+    def ordering(self, sort_by: str) -> np.ndarray:
+        """Get the full stable ordering of rows for a sort criterion.
+
+        The ordering is cached on the store and reused by later queries,
+        including filtered subsets produced by ``take``.
+
+        Args:
+            sort_by: Sort criterion
+
+        Returns:
+            Row positions from best to worst
+        """
+        if sort_by not in SORT_KEYS:
+            sort_by = "rating"
+
+        order = self._orderings.get(sort_by)
+        if order is None:
+            order = np.argsort(-self.rank_key(sort_by), kind="stable")
+            self._orderings[sort_by] = order
+        return order
+
+    def precompute_orderings(self, sort_keys: Iterable[str] = SORT_KEYS) -> None:
+        """Compute and cache orderings for the given sort criteria.
+
+        Args:
+            sort_keys: Sort criteria to prepare
+        """
+        for sort_by in sort_keys:
+            self.ordering(sort_by)
+
+    def top_k(self, sort_by: str, k: int) -> np.ndarray:
+        """Get positions of the best ``k`` rows for a sort criterion.
+
+        Uses a cached ordering when one exists; otherwise selects the
+        k-th largest key with ``np.partition`` and only sorts the
+        candidates, so the cost is linear in the store size.
+
+        Args:
+            sort_by: Sort criterion
+            k: Number of rows to return
+
+        Returns:
+            Row positions from best to worst, identical to the first ``k``
+            entries of ``ordering(sort_by)``
+        """
+        if sort_by not in SORT_KEYS:
+            sort_by = "rating"
+
+        n = len(self)
+        if k <= 0 or n == 0:
+            return np.empty(0, dtype=np.intp)
+
+        cached = self._orderings.get(sort_by)
+        if cached is not None:
+            return cached[:k]
+        if k >= n:
+            return self.ordering(sort_by)
+
+        key = self.rank_key(sort_by)
+        kth = np.partition(key, n - k)[n - k]
+        above = np.flatnonzero(key > kth)
+        ties = np.flatnonzero(key == kth)[: k - len(above)]
+        candidates = np.sort(np.concatenate([above, ties]))
+        return candidates[np.argsort(-key[candidates], kind="stable")]
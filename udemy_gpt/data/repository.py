@@ -1,21 +1,65 @@
 """Data repository for CSV course data access.
 
 This module handles all CSV file operations including loading, caching,
-and parsing of course data.
+and parsing of course data. Each topic CSV is parsed once into a columnar
+``CourseStore`` which is cached and shared by all queries. Async callers
+use ``aload_multiple_topics``, which loads cold topics on worker threads
+so file I/O and parsing never block the event loop.
 """
 
+import asyncio
 import csv
 import logging
 import re
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
 
 from udemy_gpt.config import settings
+from udemy_gpt.data.course_store import (
+    CourseStore,
+    LEVELS,
+    SECTIONS,
+    TOPICS,
+)
+from udemy_gpt.data.snapshot import CourseSnapshot, open_snapshot, write_snapshot
+from udemy_gpt.data.topic_cache import TopicCache
+from udemy_gpt.data.search_index import BM25Index, CourseNameIndex, content_words, name_match_score
 
 logger = logging.getLogger(__name__)
 
-# In-memory cache for loaded CSV data
-_csv_cache: Dict[str, List[Dict]] = {}
+# Bounded LRU cache of parsed topic stores
+_topic_cache = TopicCache(
+    max_bytes=settings.cache.max_bytes,
+    max_rows=settings.cache.max_rows,
+    pinned=settings.cache.get_pinned_topics(),
+)
+
+# Background loads of cold topics, keyed by topic slug; concurrent
+# requests for the same topic await one load
+_topic_loads: Dict[str, "asyncio.Task[CourseStore]"] = {}
+
+# Memory-mapped corpus snapshot, opened on first use
+_snapshot: Optional[CourseSnapshot] = None
+_snapshot_checked = False
+_snapshot_lock = threading.Lock()
+
+# Combined store of every topic, reused across global queries. It and the
+# two indexes below stay resident once built; their sizes are reserved in
+# the topic cache budget so cached topics make room for them.
+_all_courses: Optional[CourseStore] = None
+_all_courses_topics: Tuple[str, ...] = ()
+
+# Token/trigram index for course name lookups, built over _all_courses
+_name_index: Optional[CourseNameIndex] = None
+
+# In-flight background build of the name index
+_name_index_load: Optional["asyncio.Task[CourseNameIndex]"] = None
+
+# BM25 full-text index for free-text course search, built over _all_courses
+_text_index: Optional[BM25Index] = None
 
 
 # =============================================================================
@@ -158,49 +202,198 @@ def load_csv(file_path: Path) -> List[Dict[str, Any]]:
         return []
 
 
-def load_topic_courses(topic_slug: str, topic_info: Dict[str, Any]) -> List[Dict]:
+def build_course_store(rows: List[Dict[str, Any]], topic_slug: str, section: str = "") -> CourseStore:
+    """Parse raw CSV rows into a columnar CourseStore.
+
+    All numeric fields are parsed exactly once here; downstream filtering,
+    ranking and statistics operate on the typed columns.
+
+    Args:
+        rows: Row dictionaries as produced by ``csv.DictReader``
+        topic_slug: Topic the rows belong to
+        section: Section the topic belongs to
+
+    Returns:
+        CourseStore holding the parsed rows
+    """
+    count = len(rows)
+    names: List[str] = []
+    for row in rows[:1]:
+        names = [name for name in row if name is not None and name not in ("topic", "section")]
+
+    text = {name: [row.get(name) or "" for row in rows] for name in names}
+
+    rating = np.fromiter(
+        (parse_rating(row.get("rating", "0")) for row in rows), dtype=np.float32, count=count
+    )
+    price = np.fromiter(
+        (parse_price(row.get("price", "$99")) for row in rows), dtype=np.float32, count=count
+    )
+    hours = np.fromiter(
+        (parse_duration(row.get("duration", "0")) for row in rows), dtype=np.float32, count=count
+    )
+    reviews = np.fromiter(
+        (parse_number(row.get("reviews_count", "0")) for row in rows), dtype=np.int32, count=count
+    )
+    bestseller = np.fromiter(
+        (str(row.get("bestseller", "")).lower() in ("true", "yes", "1") for row in rows),
+        dtype=bool,
+        count=count,
+    )
+    level_code = np.fromiter(
+        (LEVELS.intern((row.get("level") or "").lower()) for row in rows), dtype=np.int16, count=count
+    )
+
+    return CourseStore(
+        text=text,
+        rating=rating,
+        price=price,
+        hours=hours,
+        reviews=reviews,
+        bestseller=bestseller,
+        level_code=level_code,
+        topic_code=np.full(count, TOPICS.intern(topic_slug), dtype=np.int16),
+        section_code=np.full(count, SECTIONS.intern(section), dtype=np.int16),
+    )
+
+
+def get_snapshot() -> Optional[CourseSnapshot]:
+    """Get the memory-mapped corpus snapshot, opening it on first use.
+
+    Returns:
+        CourseSnapshot, or None if no valid snapshot has been built
+    """
+    global _snapshot, _snapshot_checked
+
+    if not _snapshot_checked:
+        with _snapshot_lock:
+            if not _snapshot_checked:
+                _snapshot = open_snapshot(settings.paths.course_snapshot)
+                _snapshot_checked = True
+    return _snapshot
+
+
+def build_snapshot(topic_index: Dict[str, Dict], path: Optional[Path] = None) -> Path:
+    """Compile every topic CSV into a binary corpus snapshot.
+
+    CSVs are parsed directly (bypassing the course cache), and the
+    snapshot records each CSV's fingerprint from the topic index.
+
+    Args:
+        topic_index: Topic index dictionary
+        path: Destination file (defaults to the configured snapshot path)
+
+    Returns:
+        Path of the written snapshot
+    """
+    global _snapshot_checked
+
+    path = path or settings.paths.course_snapshot
+    topics = (
+        (slug, info, build_course_store(load_csv(Path(info["full_path"])), slug, info.get("section", "")))
+        for slug, info in topic_index.items()
+        if "full_path" in info
+    )
+    write_snapshot(path, topics)
+
+    # Reopen on next use so this process picks up the new file
+    _snapshot_checked = False
+    return path
+
+
+def load_topic_courses(
+    topic_slug: str,
+    topic_info: Dict[str, Any],
+    cache: bool = True,
+) -> CourseStore:
     """Load courses for a specific topic with caching.
 
+    Topics are read from the memory-mapped snapshot when it holds the
+    current version of their CSV, and parsed from the CSV otherwise.
+
     Args:
         topic_slug: Topic identifier
         topic_info: Topic metadata including file path
+        cache: Whether to add a freshly loaded topic to the topic cache
+            (an already cached topic is returned either way)
 
     Returns:
-        List of course dictionaries
+        CourseStore with the topic's courses (empty if unavailable)
     """
-    global _csv_cache
-
-    if topic_slug in _csv_cache:
-        return _csv_cache[topic_slug]
+    cached = _topic_cache.get(topic_slug)
+    if cached is not None:
+        return cached
 
     if "full_path" not in topic_info:
-        return []
+        return CourseStore.empty()
+
+    snapshot = get_snapshot()
+    if snapshot is not None and snapshot.is_current(topic_slug, topic_info):
+        courses = snapshot.topic_store(topic_slug)
+        courses.precompute_orderings()
+        if cache:
+            _topic_cache.put(topic_slug, courses)
+        return courses
 
     csv_path = Path(topic_info["full_path"])
     if not csv_path.exists():
-        return []
+        return CourseStore.empty()
 
-    courses = []
     try:
         with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                row["topic"] = topic_slug
-                row["section"] = topic_info.get("section", "")
-                courses.append(row)
+            rows = list(csv.DictReader(f))
+        courses = build_course_store(rows, topic_slug, topic_info.get("section", ""))
+        courses.precompute_orderings()
     except Exception as e:
         logger.error(f"Error loading {csv_path}: {e}")
-        return []
+        return CourseStore.empty()
 
-    _csv_cache[topic_slug] = courses
+    if cache:
+        _topic_cache.put(topic_slug, courses)
     return courses
 
 
+def _combine_topic_stores(stores: List[CourseStore], deduplicate: bool) -> CourseStore:
+    """Concatenate per-topic stores, optionally dropping repeated courses.
+
+    Courses are identified by URL, or by title and instructor when the
+    URL is missing; the first occurrence wins.
+
+    Args:
+        stores: Topic stores in request order
+        deduplicate: Whether to remove duplicate courses
+
+    Returns:
+        Combined CourseStore
+    """
+    if not deduplicate:
+        return CourseStore.concat(stores)
+
+    kept = []
+    seen_urls: Set[str] = set()
+    for courses in stores:
+        urls = courses.text.get("url", [""] * len(courses))
+        titles = courses.text.get("title", [""] * len(courses))
+        instructors = courses.text.get("instructor", [""] * len(courses))
+        keep = []
+        for i, url in enumerate(urls):
+            key = url or f"{titles[i]}|{instructors[i]}"
+            if key not in seen_urls:
+                seen_urls.add(key)
+                keep.append(i)
+        if len(keep) == len(courses):
+            kept.append(courses)
+        else:
+            kept.append(courses.take(keep))
+
+    return CourseStore.concat(kept)
+
+
 def load_multiple_topics(
     topics: List[str],
     topic_index: Dict[str, Dict],
     deduplicate: bool = True
-) -> List[Dict]:
+) -> CourseStore:
     """Load courses from multiple topics.
 
     Args:
@@ -209,53 +402,117 @@ def load_multiple_topics(
         deduplicate: Whether to remove duplicate courses
 
     Returns:
-        Combined list of courses
+        Combined CourseStore
     """
-    all_courses = []
-    seen_urls: Set[str] = set()
+    stores = [load_topic_courses(topic, topic_index.get(topic, {})) for topic in topics]
+    return _combine_topic_stores(stores, deduplicate)
+
+
+async def aload_topic_courses(topic_slug: str, topic_info: Dict[str, Any]) -> CourseStore:
+    """Load courses for a topic without blocking the event loop.
+
+    Cached topics are returned directly. A cold topic is loaded by
+    ``load_topic_courses`` on a worker thread; concurrent requests for
+    the same topic share that load, and cancelling one waiter does not
+    cancel it for the others.
+
+    Args:
+        topic_slug: Topic identifier
+        topic_info: Topic metadata including file path
+
+    Returns:
+        CourseStore with the topic's courses (empty if unavailable)
+    """
+    if topic_slug in _topic_cache:
+        cached = _topic_cache.get(topic_slug)
+        if cached is not None:
+            return cached
+
+    loop = asyncio.get_running_loop()
+    task = _topic_loads.get(topic_slug)
+    if task is None or task.get_loop() is not loop:
+        task = loop.create_task(asyncio.to_thread(load_topic_courses, topic_slug, topic_info))
+        _topic_loads[topic_slug] = task
+        task.add_done_callback(lambda done: _forget_topic_load(topic_slug, done))
+    return await asyncio.shield(task)
+
+
+def _forget_topic_load(topic_slug: str, task: "asyncio.Task[CourseStore]") -> None:
+    """Drop a finished background load from the in-flight registry."""
+    if _topic_loads.get(topic_slug) is task:
+        del _topic_loads[topic_slug]
 
-    for topic in topics:
-        topic_info = topic_index.get(topic, {})
-        courses = load_topic_courses(topic, topic_info)
-
-        if deduplicate:
-            for course in courses:
-                url = course.get("url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    all_courses.append(course)
-                elif not url:
-                    key = f"{course.get('title', '')}|{course.get('instructor', '')}"
-                    if key not in seen_urls:
-                        seen_urls.add(key)
-                        all_courses.append(course)
-        else:
-            all_courses.extend(courses)
 
-    return all_courses
+async def aload_multiple_topics(
+    topics: List[str],
+    topic_index: Dict[str, Dict],
+    deduplicate: bool = True
+) -> CourseStore:
+    """Load courses from multiple topics without blocking the event loop.
 
+    Async counterpart of ``load_multiple_topics``: cold topics are loaded
+    in parallel on worker threads, and the result (including
+    deduplication order) is the same as the blocking version.
 
-def load_all_courses(topic_index: Dict[str, Dict]) -> List[Dict]:
+    Args:
+        topics: List of topic slugs
+        topic_index: Topic index dictionary
+        deduplicate: Whether to remove duplicate courses
+
+    Returns:
+        Combined CourseStore
+    """
+    unique = list(dict.fromkeys(topics))
+    loaded = await asyncio.gather(
+        *(aload_topic_courses(topic, topic_index.get(topic, {})) for topic in unique)
+    )
+    by_topic = dict(zip(unique, loaded))
+    return _combine_topic_stores([by_topic[topic] for topic in topics], deduplicate)
+
+
+def load_all_courses(topic_index: Dict[str, Dict]) -> CourseStore:
     """Load all courses from all topics.
 
+    The combined store is cached on its own; topics loaded only to build
+    it are not added to the topic cache, so a global query does not
+    flood it.
+
     Args:
         topic_index: Topic index dictionary
 
     Returns:
-        All courses from all topics
+        CourseStore with all courses from all topics
     """
-    all_courses = []
-    for slug, info in topic_index.items():
-        if "full_path" in info:
-            courses = load_topic_courses(slug, info)
-            all_courses.extend(courses)
-    return all_courses
+    global _all_courses, _all_courses_topics
+
+    topics = tuple(slug for slug, info in topic_index.items() if "full_path" in info)
+    if _all_courses is not None and topics == _all_courses_topics:
+        return _all_courses
+
+    stores = [load_topic_courses(slug, topic_index[slug], cache=False) for slug in topics]
+    combined = CourseStore.concat(stores)
+    # Global rankings are requested repeatedly; sort each key once
+    combined.precompute_orderings()
+
+    _all_courses = combined
+    _all_courses_topics = topics
+    _topic_cache.reserve("all_courses", combined.nbytes, len(combined))
+    return combined
 
 
 def clear_cache() -> None:
-    """Clear the CSV cache."""
-    global _csv_cache
-    _csv_cache.clear()
+    """Clear the topic cache and every structure built from it."""
+    global _all_courses, _all_courses_topics, _name_index, _text_index
+    global _snapshot, _snapshot_checked
+    _topic_cache.clear()
+    for name in ("all_courses", "name_index", "text_index"):
+        _topic_cache.release(name)
+    _snapshot = None
+    _snapshot_checked = False
+    _all_courses = None
+    _all_courses_topics = ()
+    _name_index = None
+    _text_index = None
     logger.info("CSV cache cleared")
 
 
@@ -263,11 +520,91 @@ def get_cache_stats() -> Dict[str, int]:
     """Get cache statistics.
 
     Returns:
-        Dictionary with cache stats
+        Dictionary with topic cache occupancy (topics, courses, bytes),
+        budgets, pinned topic count, hit/miss/eviction counters, and the
+        courses and bytes of the resident all-topics store and indexes
+        (also included in ``resident_bytes``)
+    """
+    stats = _topic_cache.stats()
+    stats["all_courses_cached"] = len(_all_courses) if _all_courses is not None else 0
+    stats["all_courses_bytes"] = _topic_cache.reserved_bytes("all_courses")
+    stats["name_index_bytes"] = _topic_cache.reserved_bytes("name_index")
+    stats["text_index_bytes"] = _topic_cache.reserved_bytes("text_index")
+    return stats
+
+
+def pin_topics(topics: Iterable[str]) -> None:
+    """Exempt topics from eviction from the topic cache.
+
+    Args:
+        topics: Topic slugs to pin (they are loaded on first use as usual)
+    """
+    for topic in topics:
+        _topic_cache.pin(topic)
+
+
+def unpin_topics(topics: Iterable[str]) -> None:
+    """Make pinned topics evictable again.
+
+    Args:
+        topics: Topic slugs to unpin
+    """
+    for topic in topics:
+        _topic_cache.unpin(topic)
+
+
+# =============================================================================
+# Topic Statistics
+# =============================================================================
+
+def compute_topic_stats(courses: CourseStore) -> Dict[str, Any]:
+    """Aggregate statistics for a topic's courses.
+
+    The result is plain JSON-serializable data so it can be persisted
+    with the topic index.
+
+    Args:
+        courses: Store holding one topic's courses
+
+    Returns:
+        Dictionary with course_count, avg_rating, avg_price, total_reviews,
+        free_courses, beginner_courses and top_course (None if empty)
     """
+    if not courses:
+        return {
+            "course_count": 0,
+            "avg_rating": 0.0,
+            "avg_price": 0.0,
+            "total_reviews": 0,
+            "free_courses": 0,
+            "beginner_courses": 0,
+            "top_course": None,
+        }
+
+    # Top course by rating and reviews (first one wins on ties)
+    top_idx = int(courses.top_k("rating", 1)[0])
+    top = courses[top_idx]
+    beginner_codes = LEVELS.codes_where(lambda value: "beginner" in value)
+
+    # Average the CSV values in float64; the float32 columns would change
+    # the low digits of the means
+    ratings = [parse_rating(course.get("rating", "0")) for course in courses]
+    prices = [parse_price(course.get("price", "$0")) for course in courses]
+
     return {
-        "cached_topics": len(_csv_cache),
-        "cached_courses": sum(len(courses) for courses in _csv_cache.values()),
+        "course_count": len(courses),
+        "avg_rating": sum(ratings) / len(ratings),
+        "avg_price": sum(prices) / len(prices),
+        "total_reviews": int(courses.reviews.astype(np.int64).sum()),
+        "free_courses": int(np.count_nonzero(courses.price == 0)),
+        "beginner_courses": int(np.count_nonzero(np.isin(courses.level_code, beginner_codes))),
+        "top_course": {
+            "title": top.get("title", ""),
+            "url": top.get("url", ""),
+            "rating": parse_rating(top.get("rating", "0")),
+            "reviews_count": int(courses.reviews[top_idx]),
+            "price": top.get("price", ""),
+        },
     }
 
 
@@ -281,45 +618,86 @@ def _match_course_name(query: str, title: str) -> float:
     Returns:
         Match score (0.0 to 1.0)
     """
-    query_lower = query.lower().strip()
-    title_lower = title.lower().strip()
+    return name_match_score(
+        query.lower().strip(), content_words(query), title.lower().strip(), content_words(title)
+    )
 
-    # Exact match
-    if query_lower == title_lower:
-        return 1.0
 
-    # Query is substring of title or vice versa
-    if query_lower in title_lower:
-        return 0.9
-    if title_lower in query_lower:
-        return 0.85
+def get_course_name_index(topic_index: Dict[str, Dict]) -> CourseNameIndex:
+    """Get the name index over all courses, building it if needed.
 
-    # Word overlap matching
-    query_words = set(re.findall(r'\b\w+\b', query_lower))
-    title_words = set(re.findall(r'\b\w+\b', title_lower))
+    The index is rebuilt whenever the combined all-topics store changes
+    (for example after ``clear_cache``).
 
-    # Remove common stop words
-    stop_words = {'the', 'a', 'an', 'in', 'on', 'to', 'for', 'of', 'and', 'with', 'from', 'course'}
-    query_words = query_words - stop_words
-    title_words = title_words - stop_words
+    Args:
+        topic_index: Topic index dictionary
 
-    if not query_words or not title_words:
-        return 0.0
+    Returns:
+        CourseNameIndex over every loaded course
+    """
+    global _name_index
 
-    # Calculate Jaccard-like similarity
-    overlap = query_words & title_words
-    if not overlap:
-        return 0.0
+    store = load_all_courses(topic_index)
+    if _name_index is None or _name_index.store is not store:
+        _name_index = CourseNameIndex(store)
+        _topic_cache.reserve("name_index", _name_index.nbytes)
+        logger.info(f"Course name index built over {len(store)} courses")
+    return _name_index
+
+
+async def aget_course_name_index(topic_index: Dict[str, Dict]) -> CourseNameIndex:
+    """Get the name index without blocking the event loop.
+
+    Building it loads every topic, so a cold build runs
+    ``get_course_name_index`` on a worker thread; concurrent callers
+    share that build, and cancelling one waiter does not cancel it for
+    the others.
+
+    Args:
+        topic_index: Topic index dictionary
+
+    Returns:
+        CourseNameIndex over every loaded course
+    """
+    global _name_index_load
+
+    topics = tuple(slug for slug, info in topic_index.items() if "full_path" in info)
+    if (
+        _name_index is not None
+        and _all_courses is not None
+        and _name_index.store is _all_courses
+        and topics == _all_courses_topics
+    ):
+        return _name_index
+
+    loop = asyncio.get_running_loop()
+    task = _name_index_load
+    if task is None or task.done() or task.get_loop() is not loop:
+        task = loop.create_task(asyncio.to_thread(get_course_name_index, topic_index))
+        _name_index_load = task
+    return await asyncio.shield(task)
 
-    # Score based on how many query words are in title
-    query_coverage = len(overlap) / len(query_words)
-    # Bonus for significant overlap
-    if len(overlap) >= 3:
-        return min(0.8, query_coverage)
-    elif len(overlap) >= 2:
-        return min(0.6, query_coverage)
 
-    return query_coverage * 0.5
+def get_course_text_index(topic_index: Dict[str, Dict]) -> BM25Index:
+    """Get the BM25 full-text index over all courses, building it if needed.
+
+    Like the name index, it is rebuilt whenever the combined all-topics
+    store changes.
+
+    Args:
+        topic_index: Topic index dictionary
+
+    Returns:
+        BM25Index over every loaded course
+    """
+    global _text_index
+
+    store = load_all_courses(topic_index)
+    if _text_index is None or _text_index.store is not store:
+        _text_index = BM25Index(store)
+        _topic_cache.reserve("text_index", _text_index.nbytes)
+        logger.info(f"Course text index built over {len(store)} courses")
+    return _text_index
 
 
 def search_course_by_name(
@@ -329,6 +707,10 @@ def search_course_by_name(
 ) -> Optional[Dict]:
     """Search for a course by name in search results or knowledge base.
 
+    Previous search results are checked first; the knowledge base lookup
+    goes through the token/trigram name index, so only a short list of
+    candidate titles is scored.
+
     Args:
         course_name: Course name/title to search for
         topic_index: Topic index dictionary
@@ -344,53 +726,33 @@ def search_course_by_name(
     best_score = 0.0
     min_score_threshold = 0.5  # Minimum score to consider a match
 
-    # Helper to check a list of courses
-    def check_courses(courses: List[Dict]) -> None:
-        nonlocal best_match, best_score
-        for course in courses:
+    # First check in previous search results (highest priority)
+    if search_results:
+        query_lower = course_name.lower().strip()
+        query_words = content_words(course_name)
+        for course in search_results:
             title = course.get("title", "")
             if not title:
                 continue
-            score = _match_course_name(course_name, title)
+            score = name_match_score(
+                query_lower, query_words, title.lower().strip(), content_words(title)
+            )
             if score > best_score:
                 best_score = score
                 best_match = course
                 # Early exit for high confidence match
                 if score >= 0.9:
-                    return
-
-    # First check in previous search results (highest priority)
-    if search_results:
-        check_courses(search_results)
+                    break
         if best_score >= 0.9:
             logger.info(f"Found course in search results with score {best_score:.2f}")
             return best_match
 
-    # Search in cached courses
-    for courses in _csv_cache.values():
-        check_courses(courses)
-        if best_score >= 0.9:
-            logger.info(f"Found course in cache with score {best_score:.2f}")
-            return best_match
-
-    # Load topics matching likely keywords in course name
-    name_lower = course_name.lower()
-    likely_topics = []
-    for slug in topic_index.keys():
-        slug_clean = slug.replace('-', ' ')
-        if slug_clean in name_lower or any(word in name_lower for word in slug_clean.split()):
-            likely_topics.append(slug)
-
-    # Search in likely topics first
-    for slug in likely_topics:
-        if slug not in _csv_cache:
-            info = topic_index.get(slug, {})
-            if "full_path" in info:
-                courses = load_topic_courses(slug, info)
-                check_courses(courses)
-                if best_score >= 0.9:
-                    logger.info(f"Found course in topic '{slug}' with score {best_score:.2f}")
-                    return best_match
+    # Look up the whole knowledge base through the name index
+    name_index = get_course_name_index(topic_index)
+    doc_id, score = name_index.best_match(course_name)
+    if doc_id is not None and score > best_score:
+        best_score = score
+        best_match = name_index.store[doc_id]
 
     # Return best match if above threshold
     if best_match and best_score >= min_score_threshold:
@@ -401,6 +763,30 @@ def search_course_by_name(
     return None
 
 
+async def asearch_course_by_name(
+    course_name: str,
+    topic_index: Dict[str, Dict],
+    search_results: Optional[List[Dict]] = None,
+) -> Optional[Dict]:
+    """Search for a course by name without blocking the event loop.
+
+    Async counterpart of ``search_course_by_name``: the name index is
+    built off the event loop (see ``aget_course_name_index``) before
+    the lookup runs.
+
+    Args:
+        course_name: Course name/title to search for
+        topic_index: Topic index dictionary
+        search_results: Optional previous search results to check first
+
+    Returns:
+        Course dictionary if found, None otherwise
+    """
+    if course_name:
+        await aget_course_name_index(topic_index)
+    return search_course_by_name(course_name, topic_index, search_results)
+
+
 def generate_course_url(course_name: str) -> str:
     """Generate a Udemy course URL from course name.
 
@@ -0,0 +1,562 @@
+"""In-memory search indexes over the course corpus.
+
+Provides an inverted token index (title and instructor) plus a character
+trigram index over the word vocabulary, so course name lookups become
+candidate-set intersections with match scoring applied only to a short
+list of candidates, and a BM25 full-text index for free-text course
+search.
+"""
+
+import re
+import sys
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from udemy_gpt.data.course_store import CourseStore
+
+# Words ignored when comparing course names
+STOP_WORDS = frozenset({
+    "the", "a", "an", "in", "on", "to", "for", "of", "and", "with", "from", "course",
+})
+
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# Scraped titles end with the listing card text ("Rating: 4.6 out of 5...")
+_LISTING_TAIL_RE = re.compile(r"Rating:\s*\d.*$", re.DOTALL)
+
+# Lowercase-to-uppercase boundary where a subtitle was glued onto a title
+_CASE_BOUNDARY_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
+
+
+# =============================================================================
+# Tokenization
+# =============================================================================
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of word tokens in order
+    """
+    return _WORD_RE.findall(text.lower())
+
+
+def content_words(text: str) -> Set[str]:
+    """Get the set of non-stop-word tokens in text.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Set of content words
+    """
+    return set(tokenize(text)) - STOP_WORDS
+
+
+def trigrams(text: str) -> Set[str]:
+    """Get character trigrams of the normalized text.
+
+    Words are joined by single spaces and the text is padded so short
+    words still produce trigrams.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Set of 3-character strings
+    """
+    normalized = f" {' '.join(tokenize(text))} "
+    return {normalized[i:i + 3] for i in range(len(normalized) - 2)}
+
+
+def name_match_score(
+    query_lower: str,
+    query_words: Set[str],
+    title_lower: str,
+    title_words: Set[str],
+) -> float:
+    """Score how well a course title matches a queried course name.
+
+    Args:
+        query_lower: Lowercased, stripped query
+        query_words: Content words of the query
+        title_lower: Lowercased, stripped title
+        title_words: Content words of the title
+
+    Returns:
+        Match score (0.0 to 1.0)
+    """
+    # Exact match
+    if query_lower == title_lower:
+        return 1.0
+
+    # Query is substring of title or vice versa
+    if query_lower in title_lower:
+        return 0.9
+    if title_lower in query_lower:
+        return 0.85
+
+    if not query_words or not title_words:
+        return 0.0
+
+    overlap = query_words & title_words
+    if not overlap:
+        return 0.0
+
+    # Score based on how many query words are in title
+    query_coverage = len(overlap) / len(query_words)
+    # Bonus for significant overlap
+    if len(overlap) >= 3:
+        return min(0.8, query_coverage)
+    elif len(overlap) >= 2:
+        return min(0.6, query_coverage)
+
+    return query_coverage * 0.5
+
+
+def searchable_text(title: str) -> str:
+    """Strip the scraped listing card text from a course field.
+
+    The scraped ``title`` column holds the title, the subtitle and the
+    listing card (rating, reviews, hours, price) run together; only the
+    first two describe the course. Some ``instructor`` values carry the
+    same trailing card text.
+
+    Args:
+        title: Raw title (or instructor) column value
+
+    Returns:
+        Title and subtitle text
+    """
+    return _LISTING_TAIL_RE.sub("", title)
+
+
+def text_terms(text: str) -> List[str]:
+    """Tokenize free text for full-text indexing.
+
+    Words containing a lowercase-to-uppercase boundary yield their parts
+    as well as the whole word, so a subtitle glued onto a title
+    ("ThinkingA complete guide") still produces "thinking", while
+    "JavaScript" keeps matching "javascript".
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms, stop words removed
+    """
+    terms = []
+    for word in _WORD_RE.findall(text):
+        lower = word.lower()
+        if lower not in STOP_WORDS:
+            terms.append(lower)
+        parts = _CASE_BOUNDARY_RE.split(word)
+        if len(parts) > 1:
+            terms.extend(p.lower() for p in parts if p.lower() not in STOP_WORDS)
+    return terms
+
+
+def _build_postings(docs: Iterable[Iterable[str]]) -> Dict[str, np.ndarray]:
+    """Build term -> sorted document id arrays."""
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for doc_id, terms in enumerate(docs):
+        for term in terms:
+            postings[term].append(doc_id)
+    return {term: np.asarray(ids, dtype=np.int32) for term, ids in postings.items()}
+
+
+def _approx_nbytes(value: Any) -> int:
+    """Approximate memory of nested containers of strings, numbers and arrays."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_approx_nbytes(k) + _approx_nbytes(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_approx_nbytes(item) for item in value)
+    return size
+
+
+def _word_trigrams(word: str, pad: bool = True) -> Set[str]:
+    """Get character trigrams of a single word."""
+    text = f" {word} " if pad else word
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# =============================================================================
+# Course Name Index
+# =============================================================================
+
+class CourseNameIndex:
+    """Inverted token index and trigram index for looking up courses by name.
+
+    Titles and instructors are indexed by word. A character trigram index
+    over the word vocabulary resolves partial words at the edges of a
+    query (so "ython boot" still finds "python bootcamp") and maps typos
+    onto known words. A lookup intersects posting lists to find titles
+    that may contain the query, adds titles sharing content words with
+    it, and scores only the best ``shortlist_size`` candidates with
+    ``name_match_score``.
+    """
+
+    def __init__(self, store: CourseStore, shortlist_size: int = 50):
+        """Build the index.
+
+        Args:
+            store: Course store to index (row positions are document ids)
+            shortlist_size: Maximum candidates scored per lookup
+        """
+        self.store = store
+        self.shortlist_size = shortlist_size
+
+        titles = store.text.get("title", [""] * len(store))
+        instructors = store.text.get("instructor", [""] * len(store))
+
+        self._titles_lower = [title.lower().strip() for title in titles]
+        title_tokens = [set(tokenize(title)) for title in titles]
+        self._title_words = [tokens - STOP_WORDS for tokens in title_tokens]
+
+        self._exact: Dict[str, int] = {}
+        for doc_id, title in enumerate(self._titles_lower):
+            self._exact.setdefault(title, doc_id)
+
+        # Title postings include stop words so phrase candidates can be
+        # intersected; scoring only ever looks up content words
+        self._title_postings = _build_postings(title_tokens)
+        self._instructor_postings = _build_postings(content_words(i) for i in instructors)
+
+        self._vocab = sorted(set(self._title_postings) | set(self._instructor_postings))
+        vocab_grams = [_word_trigrams(word) for word in self._vocab]
+        self._vocab_trigrams = _build_postings(vocab_grams)
+        self._vocab_gram_counts = np.fromiter(
+            (len(grams) for grams in vocab_grams), dtype=np.int64, count=len(self._vocab)
+        )
+
+    def __len__(self) -> int:
+        return len(self._titles_lower)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the index (the store is not counted)."""
+        return sum(
+            _approx_nbytes(part)
+            for part in (
+                self._titles_lower, self._title_words, self._exact, self._title_postings,
+                self._instructor_postings, self._vocab, self._vocab_trigrams, self._vocab_gram_counts,
+            )
+        )
+
+    def _hit_counts(self, postings: Dict[str, np.ndarray], terms: Iterable[str]) -> np.ndarray:
+        """Count, per document, how many of the terms it contains."""
+        arrays = [postings[term] for term in terms if term in postings]
+        if not arrays:
+            return np.zeros(len(self), dtype=np.int64)
+        return np.bincount(np.concatenate(arrays), minlength=len(self))
+
+    def _vocab_sharing_trigrams(self, grams: Set[str]) -> np.ndarray:
+        """Count, per vocabulary word, how many of the trigrams it has."""
+        arrays = [self._vocab_trigrams[g] for g in grams if g in self._vocab_trigrams]
+        if not arrays:
+            return np.zeros(len(self._vocab), dtype=np.int64)
+        return np.bincount(np.concatenate(arrays), minlength=len(self._vocab))
+
+    def _docs_with_partial_word(self, token: str, match: Callable[[str], bool]) -> Optional[np.ndarray]:
+        """Get title documents containing a word that satisfies ``match``.
+
+        Args:
+            token: Possibly partial query word (at least 3 characters)
+            match: Predicate a vocabulary word must satisfy
+
+        Returns:
+            Sorted document ids
+        """
+        grams = _word_trigrams(token, pad=False)
+        shared = self._vocab_sharing_trigrams(grams)
+        words = [
+            self._vocab[i] for i in np.flatnonzero(shared >= len(grams)).tolist()
+            if match(self._vocab[i]) and self._vocab[i] in self._title_postings
+        ]
+        if not words:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate([self._title_postings[w] for w in words]))
+
+    def _substring_docs(self, query_lower: str) -> np.ndarray:
+        """Get documents whose title contains the query as a substring.
+
+        Every interior query word must be a whole title word, the first
+        may be the end of a word, the last the start of one, and a single
+        word may sit anywhere inside one. The intersection of those
+        posting lists is verified with a plain substring test.
+
+        Args:
+            query_lower: Lowercased, stripped query
+
+        Returns:
+            Document ids in ascending order
+        """
+        tokens = tokenize(query_lower)
+        if not tokens:
+            return np.empty(0, dtype=np.int64)
+
+        doc_sets = []
+        last = len(tokens) - 1
+        for position, token in enumerate(tokens):
+            if 0 < position < last:
+                docs = self._title_postings.get(token)
+            elif len(token) < 3:
+                continue  # Too short to narrow down through trigrams
+            elif last == 0:
+                docs = self._docs_with_partial_word(token, lambda word: token in word)
+            elif position == 0:
+                docs = self._docs_with_partial_word(token, lambda word: word.endswith(token))
+            else:
+                docs = self._docs_with_partial_word(token, lambda word: word.startswith(token))
+            if docs is None or len(docs) == 0:
+                return np.empty(0, dtype=np.int64)
+            doc_sets.append(docs)
+
+        if not doc_sets:
+            # Only very short words: nothing to intersect, scan titles
+            candidates = range(len(self))
+        else:
+            doc_sets.sort(key=len)
+            candidates = doc_sets[0]
+            for docs in doc_sets[1:]:
+                candidates = np.intersect1d(candidates, docs, assume_unique=True)
+            candidates = candidates.tolist()
+
+        return np.asarray(
+            [d for d in candidates if query_lower in self._titles_lower[d]], dtype=np.int64
+        )
+
+    def _closest_word(self, word: str, min_similarity: float = 0.34) -> Optional[str]:
+        """Map an out-of-vocabulary word to the most similar indexed word.
+
+        Similarity is the Jaccard index of padded character trigrams.
+
+        Args:
+            word: Query word not present in any posting list
+            min_similarity: Minimum trigram similarity to accept
+
+        Returns:
+            Closest vocabulary word, or None if nothing is similar enough
+        """
+        word_grams = _word_trigrams(word)
+        shared = self._vocab_sharing_trigrams(word_grams)
+        if not shared.any():
+            return None
+        similarity = shared / (len(word_grams) + self._vocab_gram_counts - shared)
+        best = int(np.argmax(similarity))
+        if similarity[best] < min_similarity:
+            return None
+        return self._vocab[best]
+
+    def _query_words(self, query: str) -> Set[str]:
+        """Get query content words with typos mapped onto the vocabulary."""
+        words = set()
+        for word in content_words(query):
+            if word in self._title_postings or word in self._instructor_postings:
+                words.add(word)
+            else:
+                words.add(self._closest_word(word) or word)
+        return words
+
+    def candidates(self, query: str) -> np.ndarray:
+        """Get the shortlist of documents worth scoring for a query.
+
+        Args:
+            query: Course name query
+
+        Returns:
+            Document ids in ascending order
+        """
+        query_lower = query.lower().strip()
+        query_words = self._query_words(query)
+
+        title_hits = self._hit_counts(self._title_postings, query_words)
+        instructor_hits = self._hit_counts(self._instructor_postings, query_words)
+
+        # Title word overlap drives the final score; instructor hits only
+        # break ties, and titles containing the query always make the cut
+        relevance = title_hits.astype(np.float64) + 0.25 * (instructor_hits > 0)
+        matched = (title_hits > 0) | (instructor_hits > 0)
+
+        if query_lower:
+            substring = self._substring_docs(query_lower)
+            relevance[substring] += len(query_words) + 1
+            matched[substring] = True
+            exact = self._exact.get(query_lower)
+            if exact is not None:
+                relevance[exact] += len(query_words) + 2
+                matched[exact] = True
+
+        shortlist = np.flatnonzero(matched)
+        if len(shortlist) > self.shortlist_size:
+            top = np.argpartition(-relevance[shortlist], self.shortlist_size - 1)
+            shortlist = np.sort(shortlist[top[:self.shortlist_size]])
+        return shortlist
+
+    def best_match(self, query: str) -> Tuple[Optional[int], float]:
+        """Find the best matching document for a course name.
+
+        Args:
+            query: Course name query
+
+        Returns:
+            Tuple of (document id or None, score); the earliest document
+            wins on ties
+        """
+        query_lower = query.lower().strip()
+        query_words = self._query_words(query)
+
+        best_id: Optional[int] = None
+        best_score = 0.0
+        for doc_id in self.candidates(query).tolist():
+            score = name_match_score(
+                query_lower, query_words, self._titles_lower[doc_id], self._title_words[doc_id]
+            )
+            if score > best_score:
+                best_id, best_score = doc_id, score
+                if score >= 1.0:
+                    break
+        return best_id, best_score
+
+
+# =============================================================================
+# BM25 Full-Text Index
+# =============================================================================
+
+class BM25Index:
+    """Okapi BM25 index over course title, subtitle and instructor.
+
+    Term frequencies are stored per posting, so scoring a query touches
+    only the documents containing its terms. ``search`` blends the
+    normalized relevance with the course rating.
+    """
+
+    def __init__(self, store: CourseStore, k1: float = 1.2, b: float = 0.75):
+        """Build the index.
+
+        Args:
+            store: Course store to index (row positions are document ids)
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.store = store
+        self.k1 = k1
+        self.b = b
+
+        titles = store.text.get("title", [""] * len(store))
+        instructors = store.text.get("instructor", [""] * len(store))
+
+        postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        lengths = np.zeros(len(store), dtype=np.float64)
+        for doc_id, (title, instructor) in enumerate(zip(titles, instructors)):
+            terms = text_terms(searchable_text(title)) + text_terms(searchable_text(instructor))
+            lengths[doc_id] = len(terms)
+            for term in terms:
+                counts = postings[term]
+                counts[doc_id] = counts.get(doc_id, 0) + 1
+
+        n_docs = len(store)
+        avg_length = float(lengths.mean()) if n_docs and lengths.any() else 1.0
+        self._length_norm = k1 * (1.0 - b + b * lengths / avg_length)
+
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._idf: Dict[str, float] = {}
+        for term, counts in postings.items():
+            doc_ids = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+            freqs = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+            self._postings[term] = (doc_ids, freqs)
+            df = len(counts)
+            self._idf[term] = float(np.log(1.0 + (n_docs - df + 0.5) / (df + 0.5)))
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the index (the store is not counted)."""
+        return sum(_approx_nbytes(part) for part in (self._length_norm, self._postings, self._idf))
+
+    def scores(self, query: str) -> np.ndarray:
+        """Compute the BM25 score of every document for a query.
+
+        Args:
+            query: Free-text query
+
+        Returns:
+            Array of scores indexed by document id (0 where no term matches)
+        """
+        scores = np.zeros(len(self), dtype=np.float64)
+        for term in set(text_terms(query)):
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            doc_ids, freqs = posting
+            scores[doc_ids] += self._idf[term] * freqs * (self.k1 + 1.0) / (
+                freqs + self._length_norm[doc_ids]
+            )
+        return scores
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        mask: Optional[np.ndarray] = None,
+        rating_weight: float = 0.3,
+        distinct: Optional[str] = "url",
+    ) -> np.ndarray:
+        """Find the best documents for a query.
+
+        Relevance is normalized to the best match and blended with the
+        rating (out of 5): ``(1 - rating_weight) * relevance +
+        rating_weight * rating / 5``.
+
+        Args:
+            query: Free-text query
+            limit: Maximum results to return
+            mask: Optional boolean array restricting eligible documents
+            rating_weight: Share of the blended score given to the rating
+            distinct: Text column whose non-empty values may appear only
+                once in the results (courses listed under several topics),
+                or None to keep duplicates
+
+        Returns:
+            Document ids, best first
+        """
+        scores = self.scores(query)
+        if mask is not None:
+            scores[~mask] = 0.0
+        matched = np.flatnonzero(scores > 0)
+        if len(matched) == 0 or limit <= 0:
+            return matched[:0]
+
+        relevance = scores[matched] / scores[matched].max()
+        ratings = self.store.rating[matched].astype(np.float64) / 5.0
+        blended = (1.0 - rating_weight) * relevance + rating_weight * ratings
+
+        keys = self.store.text.get(distinct) if distinct else None
+        if keys is None:
+            if len(matched) > limit:
+                top = np.argpartition(-blended, limit - 1)[:limit]
+                matched, blended = matched[top], blended[top]
+            return matched[np.lexsort((matched, -blended))]
+
+        results: List[int] = []
+        seen: Set[str] = set()
+        for doc_id in matched[np.lexsort((matched, -blended))].tolist():
+            key = keys[doc_id]
+            if key:
+                if key in seen:
+                    continue
+                seen.add(key)
+            results.append(doc_id)
+            if len(results) >= limit:
+                break
+        return np.asarray(results, dtype=np.int64)
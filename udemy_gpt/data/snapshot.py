@@ -0,0 +1,318 @@
+"""Binary snapshot of the course corpus.
+
+The snapshot compiles every topic CSV into one versioned file that is
+memory-mapped read-only, so worker processes share a single page-cache
+copy of the corpus instead of each parsing the CSVs into its own cache.
+
+Layout (all integers little-endian, segments aligned to 64 bytes)::
+
+    magic      8 bytes   b"UDEMYSNP"
+    version    uint32    SNAPSHOT_FORMAT_VERSION
+    header     uint32    length of the JSON header that follows
+    JSON header          row count, topics, levels and segment table
+    segments             fixed-width numeric columns, per-column uint32
+                         offsets (row count + 1) into one UTF-8 text heap,
+                         and the heap itself
+
+Topics are stored as contiguous row ranges together with the size,
+mtime and content digest fingerprint of their CSV, so a topic whose CSV
+changed after the snapshot was built is detected and read from the CSV
+instead. The digest decides when present, so touching a CSV or checking
+it out again does not invalidate its rows.
+
+Build a snapshot with::
+
+    python -m udemy_gpt.data.build_snapshot
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from udemy_gpt.data.course_store import (
+    CourseStore,
+    LEVELS,
+    SECTIONS,
+    TOPICS,
+    StringColumn,
+    StringInterner,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"UDEMYSNP"
+
+# Version of the binary layout; bump on any incompatible change
+SNAPSHOT_FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 64
+
+# Numeric columns and their on-disk dtypes
+_NUMERIC_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("rating", "<f4"),
+    ("price", "<f4"),
+    ("hours", "<f4"),
+    ("reviews", "<i4"),
+    ("bestseller", "|b1"),
+    ("level_code", "<i2"),
+)
+
+
+def _aligned(offset: int) -> int:
+    """Round an offset up to the segment alignment."""
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+# =============================================================================
+# Writing
+# =============================================================================
+
+def write_snapshot(
+    path: Path,
+    topics: Iterable[Tuple[str, Dict[str, Any], CourseStore]],
+) -> int:
+    """Write course stores to a snapshot file.
+
+    The file is written to a temporary path and moved into place, so
+    readers never see a partial snapshot.
+
+    Args:
+        path: Destination file
+        topics: ``(slug, topic_info, store)`` triples; ``topic_info`` must
+            carry the CSV ``path``, ``section``, ``size``, ``mtime`` and
+            ``digest``
+
+    Returns:
+        Number of courses written
+    """
+    levels = StringInterner()
+    text_names: List[str] = []
+    entries: List[Dict[str, Any]] = []
+    stores: List[CourseStore] = []
+    start = 0
+
+    for slug, info, store in topics:
+        for name in store.text:
+            if name not in text_names:
+                text_names.append(name)
+        entries.append({
+            "slug": slug,
+            "section": info.get("section", ""),
+            "path": info.get("path", ""),
+            "size": info.get("size"),
+            "mtime": info.get("mtime"),
+            "digest": info.get("digest"),
+            "columns": list(store.text),
+            "start": start,
+            "stop": start + len(store),
+        })
+        stores.append(store)
+        start += len(store)
+
+    count = start
+    columns: Dict[str, np.ndarray] = {}
+    for name, dtype in _NUMERIC_COLUMNS:
+        if name == "level_code":
+            parts = [
+                np.array([levels.intern(LEVELS.value(int(c))) for c in s.level_code], dtype=dtype)
+                for s in stores
+            ]
+        else:
+            parts = [getattr(s, name).astype(dtype) for s in stores]
+        columns[name] = np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+    heap = bytearray()
+    for name in text_names:
+        offsets = np.empty(count + 1, dtype="<u4")
+        offsets[0] = len(heap)
+        row = 0
+        for store in stores:
+            for value in store.text.get(name, [""] * len(store)):
+                heap += value.encode("utf-8")
+                row += 1
+                offsets[row] = len(heap)
+        columns[f"text:{name}"] = offsets
+    if len(heap) >= 2 ** 32:
+        raise ValueError("Course text exceeds the 4 GiB snapshot heap limit")
+    columns["heap"] = np.frombuffer(bytes(heap), dtype="|u1")
+
+    # Lay out segments after the header; the header size depends on the
+    # offsets it records, so grow the estimate until it is stable
+    header: Dict[str, Any] = {}
+    data_start = 0
+    while True:
+        segments = {}
+        offset = data_start
+        for name, array in columns.items():
+            offset = _aligned(offset)
+            segments[name] = {"dtype": array.dtype.str, "offset": offset, "count": len(array)}
+            offset += array.nbytes
+        header = {
+            "count": count,
+            "text_columns": text_names,
+            "levels": [levels.value(code) for code in range(len(levels))],
+            "topics": entries,
+            "segments": segments,
+        }
+        encoded = json.dumps(header, sort_keys=True).encode("utf-8")
+        needed = _aligned(_PREAMBLE.size + len(encoded))
+        if needed <= data_start:
+            break
+        data_start = needed
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(encoded)))
+        f.write(encoded)
+        for name, array in columns.items():
+            f.write(b"\0" * (segments[name]["offset"] - f.tell()))
+            f.write(array.tobytes())
+    os.replace(tmp_path, path)
+
+    logger.info(f"Snapshot written to {path}: {len(entries)} topics, {count} courses")
+    return count
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+class CourseSnapshot:
+    """Read-only, memory-mapped view of a corpus snapshot.
+
+    Numeric columns and text are NumPy/memoryview views into the mapping;
+    only the small level code column is copied (to translate snapshot
+    level codes into this process's ``LEVELS`` codes).
+    """
+
+    def __init__(self, path: Path):
+        """Open and validate a snapshot.
+
+        Args:
+            path: Snapshot file
+
+        Raises:
+            ValueError: If the file is not a snapshot of a supported version
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _PREAMBLE.size:
+            raise ValueError(f"Truncated snapshot: {path}")
+        magic, version, header_size = _PREAMBLE.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not a course snapshot: {path}")
+        if version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}: {path}")
+        header = json.loads(self._mmap[_PREAMBLE.size:_PREAMBLE.size + header_size])
+
+        self.count: int = header["count"]
+        self._arrays: Dict[str, np.ndarray] = {}
+        for name, segment in header["segments"].items():
+            dtype = np.dtype(segment["dtype"])
+            end = segment["offset"] + segment["count"] * dtype.itemsize
+            if end > len(self._mmap):
+                raise ValueError(f"Truncated snapshot: {path}")
+            self._arrays[name] = np.frombuffer(
+                self._mmap, dtype=dtype, count=segment["count"], offset=segment["offset"]
+            )
+
+        heap_segment = header["segments"]["heap"]
+        self._heap = memoryview(self._mmap)[
+            heap_segment["offset"]:heap_segment["offset"] + heap_segment["count"]
+        ]
+        self._text: Dict[str, StringColumn] = {}
+        for name in header["text_columns"]:
+            offsets = self._arrays[f"text:{name}"]
+            self._text[name] = StringColumn(offsets[:-1], offsets[1:], self._heap)
+
+        level_codes = np.array([LEVELS.intern(level) for level in header["levels"]], dtype=np.int16)
+        self._level_code = (
+            level_codes[self._arrays["level_code"]]
+            if len(level_codes) else np.zeros(self.count, dtype=np.int16)
+        )
+        self.topics: Dict[str, Dict[str, Any]] = {t["slug"]: t for t in header["topics"]}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"CourseSnapshot({self.path}, {len(self.topics)} topics, {self.count} courses)"
+
+    def is_current(self, topic_slug: str, topic_info: Dict[str, Any]) -> bool:
+        """Check whether the snapshot holds the current version of a topic.
+
+        The content digest is compared when both sides have one; the
+        mtime is only used for snapshots built before digests existed.
+
+        Args:
+            topic_slug: Topic identifier
+            topic_info: Topic index entry with the CSV's size, mtime and
+                digest
+
+        Returns:
+            True if the topic's CSV is unchanged since the snapshot was built
+        """
+        entry = self.topics.get(topic_slug)
+        if entry is None or entry["size"] != topic_info.get("size"):
+            return False
+        digest = entry.get("digest")
+        if digest and topic_info.get("digest"):
+            return digest == topic_info["digest"]
+        return entry["mtime"] == topic_info.get("mtime")
+
+    def topic_store(self, topic_slug: str) -> Optional[CourseStore]:
+        """Get a topic's courses as a store backed by the mapping.
+
+        Args:
+            topic_slug: Topic identifier
+
+        Returns:
+            CourseStore over the topic's rows, or None if not in the snapshot
+        """
+        entry = self.topics.get(topic_slug)
+        if entry is None:
+            return None
+
+        rows = slice(entry["start"], entry["stop"])
+        count = entry["stop"] - entry["start"]
+        arrays = self._arrays
+        return CourseStore(
+            text={name: self._text[name][rows] for name in entry["columns"]},
+            rating=arrays["rating"][rows],
+            price=arrays["price"][rows],
+            hours=arrays["hours"][rows],
+            reviews=arrays["reviews"][rows],
+            bestseller=arrays["bestseller"][rows],
+            level_code=self._level_code[rows],
+            topic_code=np.full(count, TOPICS.intern(topic_slug), dtype=np.int16),
+            section_code=np.full(count, SECTIONS.intern(entry["section"]), dtype=np.int16),
+        )
+
+
+def open_snapshot(path: Path) -> Optional[CourseSnapshot]:
+    """Open a snapshot if one exists and is readable.
+
+    Args:
+        path: Snapshot file
+
+    Returns:
+        CourseSnapshot, or None if missing or invalid
+    """
+    if not path.exists():
+        return None
+    try:
+        snapshot = CourseSnapshot(path)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring course snapshot {path}: {e}")
+        return None
+    logger.info(f"Using {snapshot!r}")
+    return snapshot
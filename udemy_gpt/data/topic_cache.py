@@ -0,0 +1,218 @@
+"""Bounded LRU cache of per-topic course stores.
+
+Loaded topics are kept in least-recently-used order and evicted once the
+cache exceeds its byte or row budget. Pinned topics are never evicted.
+Structures built from the whole corpus (the combined all-topics store
+and its search indexes) stay resident outside the LRU; they are
+registered with ``reserve`` so they count against the same budget and
+topics are evicted to make room for them.
+Hit, miss and eviction counters are kept for ``get_cache_stats``. The
+cache is thread-safe, as topics may be loaded on worker threads.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from udemy_gpt.data.course_store import CourseStore
+
+logger = logging.getLogger(__name__)
+
+
+class TopicCache:
+    """LRU cache of CourseStores keyed by topic slug, with byte accounting.
+
+    A budget of 0 means unbounded. The most recently inserted topic is
+    never evicted by its own insertion, so a single topic larger than the
+    budget is still cached until the next one arrives.
+    """
+
+    def __init__(self, max_bytes: int = 0, max_rows: int = 0, pinned: Iterable[str] = ()):
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Memory budget in bytes (0 = unbounded)
+            max_rows: Course budget (0 = unbounded)
+            pinned: Topic slugs that are never evicted
+        """
+        self.max_bytes = max_bytes
+        self.max_rows = max_rows
+        self.pinned: Set[str] = set(pinned)
+
+        self._entries: "OrderedDict[str, CourseStore]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self.bytes = 0
+        self.rows = 0
+        self._resident: Dict[str, Tuple[int, int]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, topic_slug: object) -> bool:
+        return topic_slug in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def values(self) -> Iterable[CourseStore]:
+        """Get the cached stores, least recently used first."""
+        with self._lock:
+            return list(self._entries.values())
+
+    def get(self, topic_slug: str) -> Optional[CourseStore]:
+        """Look up a topic, marking it as recently used.
+
+        Args:
+            topic_slug: Topic identifier
+
+        Returns:
+            Cached store, or None on a miss
+        """
+        with self._lock:
+            store = self._entries.get(topic_slug)
+            if store is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(topic_slug)
+            return store
+
+    def put(self, topic_slug: str, store: CourseStore) -> None:
+        """Cache a topic's store and evict to stay within budget.
+
+        Args:
+            topic_slug: Topic identifier
+            store: Loaded course store
+        """
+        size = store.nbytes
+        with self._lock:
+            self._discard(topic_slug)
+            self._entries[topic_slug] = store
+            self._sizes[topic_slug] = size
+            self.bytes += size
+            self.rows += len(store)
+            self._evict(keep=topic_slug)
+
+    def pin(self, topic_slug: str) -> None:
+        """Exempt a topic from eviction.
+
+        Args:
+            topic_slug: Topic identifier
+        """
+        self.pinned.add(topic_slug)
+
+    def unpin(self, topic_slug: str) -> None:
+        """Make a pinned topic evictable again.
+
+        Args:
+            topic_slug: Topic identifier
+        """
+        with self._lock:
+            self.pinned.discard(topic_slug)
+            self._evict()
+
+    def reserve(self, name: str, nbytes: int, rows: int = 0) -> None:
+        """Count a resident structure against the budget.
+
+        Replaces any earlier reservation under the same name and evicts
+        unpinned topics until the cache fits in what is left.
+
+        Args:
+            name: Structure name (e.g. "all_courses")
+            nbytes: Approximate memory held by the structure
+            rows: Courses it holds
+        """
+        with self._lock:
+            self._resident[name] = (nbytes, rows)
+            self._evict()
+
+    def release(self, name: str) -> None:
+        """Stop counting a resident structure that was dropped.
+
+        Args:
+            name: Structure name passed to ``reserve``
+        """
+        with self._lock:
+            self._resident.pop(name, None)
+
+    def reserved_bytes(self, name: str) -> int:
+        """Get the bytes reserved for a resident structure (0 if none)."""
+        return self._resident.get(name, (0, 0))[0]
+
+    @property
+    def resident_bytes(self) -> int:
+        """Memory held by reserved resident structures."""
+        return sum(nbytes for nbytes, _ in self._resident.values())
+
+    @property
+    def resident_rows(self) -> int:
+        """Courses held by reserved resident structures."""
+        return sum(rows for _, rows in self._resident.values())
+
+    def clear(self) -> None:
+        """Drop all cached topics (counters and pins are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.bytes = 0
+            self.rows = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache occupancy and counters.
+
+        Returns:
+            Dictionary with topic/course/byte occupancy, resident
+            structure occupancy, budgets, pinned topic count, and
+            hit/miss/eviction counters
+        """
+        return {
+            "cached_topics": len(self._entries),
+            "cached_courses": self.rows,
+            "cached_bytes": self.bytes,
+            "resident_courses": self.resident_rows,
+            "resident_bytes": self.resident_bytes,
+            "max_bytes": self.max_bytes,
+            "max_rows": self.max_rows,
+            "pinned_topics": len(self.pinned),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _discard(self, topic_slug: str) -> None:
+        """Remove a topic and release its accounted size."""
+        store = self._entries.pop(topic_slug, None)
+        if store is not None:
+            self.bytes -= self._sizes.pop(topic_slug)
+            self.rows -= len(store)
+
+    def _over_budget(self) -> bool:
+        """Check whether either budget is exceeded, counting resident structures."""
+        return (
+            (self.max_bytes > 0 and self.bytes + self.resident_bytes > self.max_bytes)
+            or (self.max_rows > 0 and self.rows + self.resident_rows > self.max_rows)
+        )
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used, unpinned topics until within budget.
+
+        Args:
+            keep: Topic to spare (the one just inserted)
+        """
+        if not self._over_budget():
+            return
+        for topic_slug in list(self._entries):
+            if topic_slug == keep or topic_slug in self.pinned:
+                continue
+            self._discard(topic_slug)
+            self.evictions += 1
+            logger.debug(f"Evicted topic '{topic_slug}' from course cache")
+            if not self._over_budget():
+                return
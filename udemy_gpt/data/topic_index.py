@@ -2,21 +2,60 @@
 
 This module handles topic indexing, validation, fuzzy matching,
 and provides the topic catalog for the LLM.
+
+The index is persisted together with a size, mtime and content digest
+fingerprint and precomputed statistics for every course CSV, so startup
+only re-scans files that changed since the index was last written. The
+repository ships ``topic_index.json``; at runtime the index is read from
+and written to a cache copy under ``cache/`` so the tracked file is never
+rewritten. Checkouts set fresh mtimes, so a CSV whose size matches but
+whose mtime does not is confirmed by its digest instead of re-scanned.
 """
 
 import csv
+import hashlib
+import json
 import logging
+import os
+import re
+from collections import OrderedDict
 from difflib import SequenceMatcher
-from typing import Dict, List, Optional, Set
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
 
 from udemy_gpt.config import settings
+from udemy_gpt.data.repository import build_course_store, compute_topic_stats, load_csv
 
 logger = logging.getLogger(__name__)
 
+# Version of the persisted index format
+INDEX_FORMAT_VERSION = 1
+
+# Maximum number of memoized fuzzy topic lookups
+FUZZY_CACHE_SIZE = 1024
+
+# Default number of topics offered to the LLM per intent classification
+TOPIC_SHORTLIST_SIZE = 30
+
 # Module-level cache
 _topic_index: Optional[Dict[str, Dict]] = None
 _topic_list_for_llm: str = ""
 _topic_aliases: Dict[str, str] = {}
+_topic_matcher: Optional["TopicMatcher"] = None
+_topic_lines: Dict[str, str] = {}
+_topic_word_index: Dict[str, Set[str]] = {}
+_topic_stats: Dict[str, Dict[str, Any]] = {}
+
+# Words common in course queries that should not be fuzzy-matched to topics
+_QUERY_FILLER_WORDS = frozenset({
+    "course", "courses", "class", "classes", "tutorial", "tutorials", "learn", "learning",
+    "best", "top", "free", "cheap", "rating", "rated", "stars", "price", "hours", "short",
+    "beginner", "beginners", "intermediate", "advanced", "level", "levels", "under", "over",
+    "want", "need", "find", "show", "recommend", "suggest", "compare", "with", "about",
+    "what", "which", "should", "become", "good", "great", "more", "most", "some",
+})
 
 
 # =============================================================================
@@ -72,49 +111,213 @@ def _build_topic_aliases(index: Dict[str, Dict]) -> Dict[str, str]:
     return valid_aliases
 
 
+def _stem(word: str) -> str:
+    """Strip common English suffixes so word forms compare equal."""
+    while True:
+        for suffix in ("ments", "ment", "ings", "ing", "ers", "er", "s"):
+            if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+                word = word[:-len(suffix)]
+                break
+        else:
+            return word
+
+
+def _build_topic_word_index(index: Dict[str, Dict], aliases: Dict[str, str]) -> Dict[str, Set[str]]:
+    """Map stemmed slug and alias words to the topics containing them.
+
+    Args:
+        index: Topic index dictionary
+        aliases: Alias table from ``_build_topic_aliases``
+
+    Returns:
+        Mapping of stemmed word to topic slugs
+    """
+    words: Dict[str, Set[str]] = {}
+    for slug, info in index.items():
+        if info.get("course_count", 0) > 0:
+            for word in slug.split("-"):
+                words.setdefault(_stem(word), set()).add(slug)
+    for alias, slug in aliases.items():
+        if " " not in alias and "-" not in alias:
+            words.setdefault(_stem(alias), set()).add(slug)
+    return words
+
+
 # =============================================================================
 # Index Building
 # =============================================================================
 
+def _fingerprint(csv_file: Path) -> Dict[str, Any]:
+    """Get the size and modification time of a CSV file."""
+    stat = csv_file.stat()
+    return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def _content_digest(csv_file: Path) -> str:
+    """Get the SHA-256 hex digest of a CSV file's contents."""
+    return hashlib.sha256(csv_file.read_bytes()).hexdigest()
+
+
+def _summarize_csv(csv_file: Path, section: str) -> Dict[str, Any]:
+    """Compute statistics for a topic CSV.
+
+    The store is built just for aggregation and is not added to the
+    course cache.
+
+    Args:
+        csv_file: Topic CSV file
+        section: Section the topic belongs to
+
+    Returns:
+        Topic statistics dictionary (see ``compute_topic_stats``)
+    """
+    rows = load_csv(csv_file)
+    return compute_topic_stats(build_course_store(rows, csv_file.stem, section))
+
+
+def _load_persisted_index() -> Dict[str, Dict]:
+    """Load the persisted topic index, keyed by relative CSV path.
+
+    Reads the runtime cache copy, falling back to the shipped index.
+    Older index files (a bare slug mapping with Windows-style paths and
+    no fingerprints or statistics) are accepted; their entries are simply
+    treated as stale and re-scanned.
+
+    Returns:
+        Mapping of POSIX relative CSV path to persisted entry
+    """
+    paths = settings.paths
+    index_path = paths.topic_index_cache
+    if not index_path.exists():
+        index_path = paths.topic_index_json
+    if not index_path.exists():
+        return {}
+
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        logger.warning(f"Error reading topic index {index_path}: {e}")
+        return {}
+
+    topics = data.get("topics", {}) if data.get("version") == INDEX_FORMAT_VERSION else data
+    persisted = {}
+    for slug, entry in topics.items():
+        if not isinstance(entry, dict) or "path" not in entry:
+            continue
+        rel_path = str(entry["path"]).replace("\\", "/")
+        persisted[rel_path] = {**entry, "slug": slug, "path": rel_path}
+    return persisted
+
+
+def _save_persisted_index(index: Dict[str, Dict], index_path: Optional[Path] = None) -> None:
+    """Write CSV-backed topics and their fingerprints to disk.
+
+    Args:
+        index: Topic index dictionary
+        index_path: Destination file (defaults to the runtime cache copy;
+            pass ``settings.paths.topic_index_json`` to refresh the
+            shipped index after re-scraping)
+    """
+    index_path = index_path or settings.paths.topic_index_cache
+    topics = {
+        slug: {key: value for key, value in info.items() if key != "full_path"}
+        for slug, info in index.items()
+        if "full_path" in info
+    }
+    payload = {"version": INDEX_FORMAT_VERSION, "topics": topics}
+
+    tmp_path = index_path.with_suffix(".json.tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        logger.warning(f"Could not persist topic index to {index_path}: {e}")
+
+
+def _scan_courses_dir(courses_dir: Path, persisted: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Index course CSVs, re-reading only files whose fingerprint changed.
+
+    Each entry carries the topic's precomputed statistics, which are
+    recomputed together with the course count whenever the CSV changes.
+    A CSV with the persisted size but a different mtime (e.g. after a
+    fresh checkout) keeps its statistics if its content digest matches.
+
+    Args:
+        courses_dir: Root directory of the section/topic CSV tree
+        persisted: Previously persisted entries keyed by relative path
+
+    Returns:
+        Topic index dictionary for CSV-backed topics
+    """
+    index = {}
+    rescanned = 0
+    verified = 0
+
+    if courses_dir.exists():
+        for section_dir in courses_dir.iterdir():
+            if not section_dir.is_dir():
+                continue
+            section = section_dir.name
+            for csv_file in section_dir.glob("*.csv"):
+                rel_path = csv_file.relative_to(courses_dir).as_posix()
+                fingerprint = _fingerprint(csv_file)
+                cached = persisted.get(rel_path)
+
+                usable = cached and cached.get("size") == fingerprint["size"] and "stats" in cached
+                if usable and cached.get("mtime") == fingerprint["mtime"] and cached.get("digest"):
+                    stats = cached["stats"]
+                    digest = cached["digest"]
+                else:
+                    digest = _content_digest(csv_file)
+                    if usable and cached.get("digest") == digest:
+                        stats = cached["stats"]
+                        verified += 1
+                    else:
+                        stats = _summarize_csv(csv_file, section)
+                        rescanned += 1
+
+                index[csv_file.stem] = {
+                    "path": rel_path,
+                    "full_path": str(csv_file),
+                    "section": section,
+                    "course_count": stats["course_count"],
+                    "stats": stats,
+                    "digest": digest,
+                    **fingerprint,
+                }
+
+    stale = rescanned or verified or set(persisted) != {info["path"] for info in index.values()}
+    if stale:
+        _save_persisted_index(index)
+    logger.info(f"Topic index: {len(index)} CSVs, {rescanned} re-scanned, {verified} verified by digest")
+
+    return index
+
+
 def build_index() -> Dict[str, Dict]:
     """Build index of available topics from CSV files.
 
     Scans the courses directory and builds a comprehensive index
-    of all available topics with their metadata.
+    of all available topics with their metadata. Course counts and
+    statistics are reused from the persisted index for CSVs whose size
+    and mtime (or content digest) are unchanged; only new or modified
+    files are re-read.
 
     Returns:
         Topic index dictionary
     """
-    global _topic_index, _topic_list_for_llm, _topic_aliases
+    global _topic_index, _topic_list_for_llm, _topic_aliases, _topic_matcher
+    global _topic_lines, _topic_word_index, _topic_stats
 
     if _topic_index is not None:
         return _topic_index
 
     logger.info("Building topic index...")
-    index = {}
     paths = settings.paths
-
-    # Scan courses directory
-    if paths.courses_dir.exists():
-        for section_dir in paths.courses_dir.iterdir():
-            if section_dir.is_dir():
-                section = section_dir.name
-                for csv_file in section_dir.glob("*.csv"):
-                    slug = csv_file.stem
-                    try:
-                        with open(csv_file, "r", encoding="utf-8") as f:
-                            reader = csv.DictReader(f)
-                            course_count = sum(1 for _ in reader)
-                    except Exception as e:
-                        logger.warning(f"Error counting courses in {csv_file}: {e}")
-                        course_count = 0
-
-                    index[slug] = {
-                        "path": str(csv_file.relative_to(paths.courses_dir)),
-                        "full_path": str(csv_file),
-                        "section": section,
-                        "course_count": course_count,
-                    }
+    index = _scan_courses_dir(paths.courses_dir, _load_persisted_index())
 
     # Also index from topics CSV for reference
     if paths.topics_csv.exists():
@@ -135,14 +338,17 @@ def build_index() -> Dict[str, Dict]:
 
     _topic_index = index
     _topic_aliases = _build_topic_aliases(index)
+    _topic_matcher = TopicMatcher(index)
+    _topic_word_index = _build_topic_word_index(index, _topic_aliases)
+    _topic_stats = {slug: info["stats"] for slug, info in index.items() if "stats" in info}
 
     # Build formatted list for LLM context
-    available_topics = [
-        f"- {slug} ({info['course_count']} courses, {info['section']})"
+    _topic_lines = {
+        slug: f"- {slug} ({info['course_count']} courses, {info['section']})"
         for slug, info in index.items()
         if info.get("course_count", 0) > 0
-    ]
-    _topic_list_for_llm = "\n".join(sorted(available_topics))
+    }
+    _topic_list_for_llm = "\n".join(sorted(_topic_lines.values()))
 
     topics_with_courses = len([t for t in index.values() if t.get("course_count", 0) > 0])
     logger.info(f"Index built: {topics_with_courses} topics with courses")
@@ -161,15 +367,77 @@ def get_index() -> Dict[str, Dict]:
     return _topic_index
 
 
-def get_topic_list_for_llm() -> str:
+def get_topic_list_for_llm(topics: Optional[List[str]] = None) -> str:
     """Get pre-formatted topic list for LLM context.
 
+    Args:
+        topics: Optional topic slugs to list (e.g. from
+            ``shortlist_topics``); defaults to every available topic
+
     Returns:
-        Formatted string listing all available topics
+        Formatted string listing the topics
     """
     if not _topic_list_for_llm:
         build_index()
-    return _topic_list_for_llm
+    if topics is None:
+        return _topic_list_for_llm
+    return "\n".join(sorted(_topic_lines[slug] for slug in set(topics) if slug in _topic_lines))
+
+
+def shortlist_topics(message: str, limit: int = TOPIC_SHORTLIST_SIZE) -> List[str]:
+    """Select the topics most likely relevant to a message.
+
+    Topics named outright (slug or alias) rank first, then topics sharing
+    (stemmed) words with the message, then fuzzy matches of individual
+    words. Remaining slots are filled with the largest topics so broad
+    requests ("best courses") still have popular candidates.
+
+    Args:
+        message: User message
+        limit: Maximum number of topics to return
+
+    Returns:
+        Topic slugs, most relevant first
+    """
+    index = get_index()
+    scores: Dict[str, float] = {}
+
+    for slug in find_topics_in_text(message):
+        scores[slug] = scores.get(slug, 0.0) + 3.0
+
+    words = [w for w in re.findall(r"[a-z0-9]+", message.lower()) if len(w) >= 2]
+    for word in set(words):
+        matched = _topic_word_index.get(_stem(word), set())
+        for slug in matched:
+            # Reward covering a larger share of the slug's words
+            scores[slug] = scores.get(slug, 0.0) + 1.0 / len(slug.split("-"))
+        if not matched and len(word) >= 4 and word not in _QUERY_FILLER_WORDS:
+            fuzzy = _fuzzy_match_topic(word, index)
+            if fuzzy:
+                scores[fuzzy] = scores.get(fuzzy, 0.0) + 0.5
+
+    ranked = sorted(scores, key=lambda slug: (-scores[slug], slug))[:limit]
+    if len(ranked) < limit:
+        for topic in get_available_topics():
+            if topic["slug"] not in scores:
+                ranked.append(topic["slug"])
+                if len(ranked) >= limit:
+                    break
+    return ranked
+
+
+def get_topic_stats_table() -> Dict[str, Dict[str, Any]]:
+    """Get the precomputed statistics of every CSV-backed topic.
+
+    The table is built with the index and shared between callers, so it
+    must not be modified.
+
+    Returns:
+        Mapping of topic slug to statistics dictionary
+    """
+    if _topic_index is None:
+        build_index()
+    return _topic_stats
 
 
 # =============================================================================
@@ -204,6 +472,54 @@ def get_available_topics() -> List[Dict]:
     return sorted(topics, key=lambda x: x["course_count"], reverse=True)
 
 
+# Spellings whose punctuation would be lost by word splitting
+_TOPIC_TEXT_REPLACEMENTS = (("c++", " c plus plus "), ("c#", " c sharp "), (".js", "js"))
+
+
+def _resolve_topic_phrase(words: List[str], index: Dict[str, Dict]) -> Optional[str]:
+    """Resolve a phrase to a topic slug via the index and alias table."""
+    for candidate in ("-".join(words), " ".join(words), "".join(words)):
+        if candidate in index and index[candidate].get("course_count", 0) > 0:
+            return candidate
+        if candidate in _topic_aliases:
+            return _topic_aliases[candidate]
+    return None
+
+
+def find_topics_in_text(text: str, max_words: int = 5) -> List[str]:
+    """Find topics mentioned verbatim in free text.
+
+    Scans the text left to right, preferring the longest phrase (up to
+    ``max_words`` words) that names a topic slug or alias.
+
+    Args:
+        text: Free text such as a user message
+        max_words: Longest phrase to consider
+
+    Returns:
+        Topic slugs in order of first mention
+    """
+    index = get_index()
+    text_lower = text.lower()
+    for old, new in _TOPIC_TEXT_REPLACEMENTS:
+        text_lower = text_lower.replace(old, new)
+    words = re.findall(r"[a-z0-9]+", text_lower)
+
+    found: List[str] = []
+    position = 0
+    while position < len(words):
+        for length in range(min(max_words, len(words) - position), 0, -1):
+            slug = _resolve_topic_phrase(words[position:position + length], index)
+            if slug:
+                if slug not in found:
+                    found.append(slug)
+                position += length
+                break
+        else:
+            position += 1
+    return found
+
+
 def search_topics(query: str) -> List[str]:
     """Search for matching topic slugs.
 
@@ -232,9 +548,103 @@ def search_topics(query: str) -> List[str]:
 # Topic Validation
 # =============================================================================
 
+def _normalize_topic(text: str) -> str:
+    """Strip separators and lowercase a topic string for fuzzy comparison."""
+    return text.replace("-", "").replace("_", "").replace(" ", "").lower()
+
+
+class TopicMatcher:
+    """Fuzzy topic matcher over pre-normalized slugs.
+
+    Slugs are normalized once and their character counts kept in a
+    matrix. Twice the shared character count over the combined length is
+    an upper bound on ``SequenceMatcher.ratio``, so slugs whose bound
+    cannot reach the threshold (or beat the best score so far) are
+    skipped without running ``SequenceMatcher``. Results are memoized per
+    normalized query in a bounded LRU.
+    """
+
+    def __init__(self, index: Dict[str, Dict], cache_size: int = FUZZY_CACHE_SIZE):
+        """Build the matcher.
+
+        Args:
+            index: Topic index dictionary
+            cache_size: Maximum number of memoized lookups
+        """
+        self.slugs = [slug for slug, info in index.items() if info.get("course_count", 0) > 0]
+        self.normalized = [_normalize_topic(slug) for slug in self.slugs]
+        self.lengths = np.array([len(n) for n in self.normalized], dtype=np.int64)
+
+        alphabet = sorted({char for n in self.normalized for char in n})
+        self._columns = {char: col for col, char in enumerate(alphabet)}
+        self._char_counts = np.zeros((len(self.slugs), len(alphabet)), dtype=np.int64)
+        for row, n in enumerate(self.normalized):
+            for char in n:
+                self._char_counts[row, self._columns[char]] += 1
+
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, Optional[str]]" = OrderedDict()
+
+    def _ratio_bounds(self, query_normalized: str) -> np.ndarray:
+        """Upper bounds of the SequenceMatcher ratio against every slug."""
+        query_counts = np.zeros(len(self._columns), dtype=np.int64)
+        for char in query_normalized:
+            col = self._columns.get(char)
+            if col is not None:
+                query_counts[col] += 1
+        shared = np.minimum(self._char_counts, query_counts).sum(axis=1)
+        total = self.lengths + len(query_normalized)
+        return np.divide(2.0 * shared, total, out=np.ones(len(self.slugs)), where=total > 0)
+
+    def match(self, query: str, threshold: float = 0.7) -> Optional[str]:
+        """Find the best fuzzy match for a topic query.
+
+        Args:
+            query: Topic query string
+            threshold: Minimum similarity threshold
+
+        Returns:
+            Best matching topic slug or None
+        """
+        query_normalized = _normalize_topic(query)
+        key = (query_normalized, threshold)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        best_match = None
+        best_score = 0
+        bounds = self._ratio_bounds(query_normalized).tolist()
+
+        for slug, slug_normalized, bound in zip(self.slugs, self.normalized, bounds):
+            # Check if query is substring
+            if query_normalized in slug_normalized or slug_normalized in query_normalized:
+                score = 0.8 + (len(query_normalized) / len(slug_normalized)) * 0.2
+                if score > best_score:
+                    best_score = score
+                    best_match = slug
+                continue
+
+            # Use sequence matcher only where the bound leaves a chance
+            if bound < threshold or bound <= best_score:
+                continue
+            score = SequenceMatcher(None, query_normalized, slug_normalized).ratio()
+            if score > best_score and score >= threshold:
+                best_score = score
+                best_match = slug
+
+        self._cache[key] = best_match
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return best_match
+
+
 def _fuzzy_match_topic(query: str, index: Dict[str, Dict], threshold: float = 0.7) -> Optional[str]:
     """Find best fuzzy match for a topic query.
 
+    Uses the matcher built with the topic index, or a throwaway one for
+    any other index.
+
     Args:
         query: Topic query string
         index: Topic index
@@ -243,30 +653,8 @@ def _fuzzy_match_topic(query: str, index: Dict[str, Dict], threshold: float = 0.
     Returns:
         Best matching topic slug or None
     """
-    best_match = None
-    best_score = 0
-    query_normalized = query.replace("-", "").replace("_", "").replace(" ", "").lower()
-
-    for slug, info in index.items():
-        if info.get("course_count", 0) == 0:
-            continue
-        slug_normalized = slug.replace("-", "").replace("_", "").replace(" ", "").lower()
-
-        # Check if query is substring
-        if query_normalized in slug_normalized or slug_normalized in query_normalized:
-            score = 0.8 + (len(query_normalized) / len(slug_normalized)) * 0.2
-            if score > best_score:
-                best_score = score
-                best_match = slug
-            continue
-
-        # Use sequence matcher for similarity
-        score = SequenceMatcher(None, query_normalized, slug_normalized).ratio()
-        if score > best_score and score >= threshold:
-            best_score = score
-            best_match = slug
-
-    return best_match
+    matcher = _topic_matcher if index is _topic_index and _topic_matcher else TopicMatcher(index)
+    return matcher.match(query, threshold)
 
 
 def validate_topics(topics: List[str]) -> List[str]:
@@ -318,8 +706,13 @@ def validate_topics(topics: List[str]) -> List[str]:
 
 def reset_index() -> None:
     """Reset the topic index (for testing or reloading)."""
-    global _topic_index, _topic_list_for_llm, _topic_aliases
+    global _topic_index, _topic_list_for_llm, _topic_aliases, _topic_matcher
+    global _topic_lines, _topic_word_index, _topic_stats
     _topic_index = None
     _topic_list_for_llm = ""
     _topic_aliases = {}
+    _topic_matcher = None
+    _topic_lines = {}
+    _topic_word_index = {}
+    _topic_stats = {}
     logger.info("Topic index reset")
@@ -55,3 +55,31 @@ class IntentClassificationError(UdemyGPTError):
     """Raised when intent classification fails."""
 
     pass
+
+
+class SessionError(UdemyGPTError):
+    """Base exception for chat session management errors."""
+
+    pass
+
+
+class SessionNotFoundError(SessionError):
+    """Raised when a session does not exist or has expired."""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        super().__init__(f"Session not found: {session_id}")
+
+
+class SessionBusyError(SessionError):
+    """Raised when a session already has a turn in progress."""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        super().__init__(f"Session is busy: {session_id}")
+
+
+class ServerBusyError(SessionError):
+    """Raised when the server cannot accept more sessions or turns."""
+
+    pass
@@ -31,6 +31,8 @@ class IntentClassification(BaseModel):
         course_reference: Course index if user refers to a specific course
         needs_browser: Whether live browser fetch is needed
         goal: Career or learning goal for learning path intent
+        confidence: Rule-based classifier confidence (None when the LLM
+            classified the message)
     """
 
     intent: IntentType = Field(
@@ -57,3 +59,9 @@ class IntentClassification(BaseModel):
         default=None,
         description="Career or learning goal for learning path",
     )
+    confidence: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Rule-based classifier confidence (None if classified by the LLM)",
+    )
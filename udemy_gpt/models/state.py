@@ -65,7 +65,7 @@ class ConversationState(BaseModel):
     def clear(self) -> None:
         """Clear all state."""
         self.messages.clear()
-        self.last_search_results.clear()
+        self.last_search_results = []
         self.last_topic = None
         self.last_query = None
         self.current_intent = None
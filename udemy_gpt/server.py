@@ -0,0 +1,338 @@
+"""Multi-session HTTP server for Udemy GPT.
+
+Serves many concurrent conversations from one process. All sessions
+share one ``UdemyGPT`` agent (topic index, course stores, LLM client and
+rate limiter, browser); each session has its own conversation state.
+The server is a small HTTP/1.1 implementation on ``asyncio`` streams, so
+it needs no web framework.
+
+Usage:
+    udemy-gpt-server [--host HOST] [--port PORT]
+
+Endpoints:
+    POST   /sessions                  Create a session -> {"session_id": ...}
+    GET    /sessions/{id}             Session statistics
+    DELETE /sessions/{id}             End a session
+    POST   /sessions/{id}/messages    Chat: {"message": ..., "stream": true}
+    GET    /health                    Server, session and LLM statistics
+
+Streamed replies are sent as chunked ``text/plain``; otherwise the reply
+is ``{"response": ...}``. Busy sessions get 409, an overloaded server
+503 with ``Retry-After``.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import re
+import sys
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from udemy_common import get_circuit_breaker_stats, get_rate_limiter_stats
+from udemy_gpt.config import settings
+from udemy_gpt.core import SessionManager, UdemyGPT
+from udemy_gpt.exceptions import ServerBusyError, SessionBusyError, SessionNotFoundError
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+_SESSION_PATH = re.compile(r"^/sessions/([A-Za-z0-9_-]+)(/messages)?$")
+
+# Seconds a client waits for a request line or headers before we hang up
+_HEADER_TIMEOUT = 30.0
+
+
+class HTTPError(Exception):
+    """An error answered with an HTTP status and JSON message."""
+
+    def __init__(self, status: HTTPStatus, message: str, headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+        super().__init__(message)
+
+
+# =============================================================================
+# HTTP Plumbing
+# =============================================================================
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+    max_body_bytes: int,
+) -> Tuple[str, str, Dict[str, str], bytes]:
+    """Read one HTTP request.
+
+    Args:
+        reader: Client stream
+        max_body_bytes: Largest accepted request body
+
+    Returns:
+        Tuple of (method, path, lower-cased headers, body)
+
+    Raises:
+        HTTPError: If the request is malformed or too large
+        asyncio.IncompleteReadError: If the client disconnects
+    """
+    request_line = await asyncio.wait_for(reader.readline(), _HEADER_TIMEOUT)
+    if not request_line:
+        raise asyncio.IncompleteReadError(b"", None)
+    try:
+        method, target, _version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = await asyncio.wait_for(reader.readline(), _HEADER_TIMEOUT)
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+    if length > max_body_bytes:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body exceeds {max_body_bytes} bytes")
+    body = await reader.readexactly(length) if length else b""
+
+    return method.upper(), target.split("?", 1)[0], headers, body
+
+
+def _response_head(status: HTTPStatus, headers: Dict[str, str]) -> bytes:
+    """Build the status line and headers of a response."""
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    lines.append("Connection: close")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def _send_json(
+    writer: asyncio.StreamWriter,
+    status: HTTPStatus,
+    payload: Any,
+    headers: Optional[Dict[str, str]] = None,
+) -> None:
+    """Send a complete JSON response."""
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else b""
+    head = {"Content-Type": "application/json; charset=utf-8", "Content-Length": str(len(body))}
+    head.update(headers or {})
+    writer.write(_response_head(status, head) + body)
+    await writer.drain()
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+class ChatServer:
+    """HTTP front end hosting many chat sessions on one shared agent."""
+
+    def __init__(self, agent: UdemyGPT, sessions: Optional[SessionManager] = None):
+        """Initialize the server.
+
+        Args:
+            agent: Shared agent answering every session
+            sessions: Session manager (created from settings if omitted)
+        """
+        self._agent = agent
+        self._sessions = sessions if sessions is not None else SessionManager()
+        self._settings = settings.server
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: Optional[str] = None, port: Optional[int] = None) -> None:
+        """Start listening and begin session expiry.
+
+        Args:
+            host: Interface to bind (defaults to settings)
+            port: Port to bind (defaults to settings; 0 picks a free port)
+        """
+        host = host if host is not None else self._settings.host
+        port = port if port is not None else self._settings.port
+        self._sessions.start()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        bound = ", ".join(str(sock.getsockname()) for sock in self._server.sockets)
+        logger.info(f"Udemy GPT server listening on {bound}")
+
+    @property
+    def port(self) -> Optional[int]:
+        """Port the server is bound to, once started."""
+        if self._server is None or not self._server.sockets:
+            return None
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections and drop all sessions."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self._sessions.close()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one request on a client connection."""
+        try:
+            try:
+                method, path, _headers, body = await _read_request(reader, self._settings.max_body_bytes)
+                await self._dispatch(method, path, body, writer)
+            except HTTPError as e:
+                await _send_json(writer, e.status, {"error": e.message}, e.headers)
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.error(f"Error serving request: {e}", exc_info=True)
+            with contextlib.suppress(Exception):
+                await _send_json(writer, HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error"})
+        finally:
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+    async def _dispatch(self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter) -> None:
+        """Route a request to its endpoint."""
+        if path == "/health" and method == "GET":
+            await _send_json(writer, HTTPStatus.OK, self.stats())
+            return
+
+        if path == "/sessions" and method == "POST":
+            try:
+                session = self._sessions.create()
+            except ServerBusyError as e:
+                raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, str(e), {"Retry-After": "5"})
+            await _send_json(writer, HTTPStatus.CREATED, {"session_id": session.session_id})
+            return
+
+        match = _SESSION_PATH.match(path)
+        if match is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No route for {path}")
+        session_id, messages = match.group(1), match.group(2)
+
+        try:
+            if messages and method == "POST":
+                await self._chat(session_id, body, writer)
+            elif not messages and method == "GET":
+                state = self._sessions.get(session_id).state
+                await _send_json(writer, HTTPStatus.OK, self._agent.get_session_stats(state))
+            elif not messages and method == "DELETE":
+                if not self._sessions.delete(session_id):
+                    raise SessionNotFoundError(session_id)
+                await _send_json(writer, HTTPStatus.NO_CONTENT, None)
+            else:
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed on {path}")
+        except SessionNotFoundError as e:
+            raise HTTPError(HTTPStatus.NOT_FOUND, str(e))
+        except SessionBusyError as e:
+            raise HTTPError(HTTPStatus.CONFLICT, str(e))
+        except ServerBusyError as e:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, str(e), {"Retry-After": "2"})
+
+    async def _chat(self, session_id: str, body: bytes, writer: asyncio.StreamWriter) -> None:
+        """Run a chat turn, streaming the reply if requested."""
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be JSON")
+        message = str(request.get("message", "")).strip() if isinstance(request, dict) else ""
+        if not message:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Field 'message' is required")
+        if len(message) > self._settings.max_message_chars:
+            raise HTTPError(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"Message exceeds {self._settings.max_message_chars} characters",
+            )
+
+        async with self._sessions.turn(session_id) as state:
+            if not request.get("stream", True):
+                response = await self._agent.chat(message, state)
+                await _send_json(writer, HTTPStatus.OK, {"response": response})
+                return
+
+            writer.write(_response_head(HTTPStatus.OK, {
+                "Content-Type": "text/plain; charset=utf-8",
+                "Transfer-Encoding": "chunked",
+                "Cache-Control": "no-cache",
+            }))
+            # Closing the stream records the partial reply if the client
+            # disconnects; drain() applies backpressure from slow clients
+            async with contextlib.aclosing(self._agent.chat_stream(message, state)) as chunks:
+                async for chunk in chunks:
+                    data = chunk.encode("utf-8")
+                    if data:
+                        writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+                        await writer.drain()
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get server health and load statistics.
+
+        Returns:
+            Dictionary with session stats and shared LLM limiter/circuit state
+        """
+        return {
+            "status": "ok",
+            "sessions": self._sessions.stats(),
+            "rate_limiters": get_rate_limiter_stats(),
+            "circuit_breakers": get_circuit_breaker_stats(),
+        }
+
+
+# =============================================================================
+# Entry Point
+# =============================================================================
+
+async def run_server(host: Optional[str] = None, port: Optional[int] = None) -> None:
+    """Create the shared agent and serve until interrupted.
+
+    Args:
+        host: Interface to bind (defaults to settings)
+        port: Port to bind (defaults to settings)
+    """
+    agent = UdemyGPT()
+    server = ChatServer(agent)
+    try:
+        await server.start(host, port)
+        await server.serve_forever()
+    finally:
+        await server.close()
+        await agent.close()
+
+
+def main() -> None:
+    """Entry point for the server."""
+    parser = argparse.ArgumentParser(description="Udemy GPT multi-session HTTP server")
+    parser.add_argument("--host", default=None, help=f"Interface to bind (default: {settings.server.host})")
+    parser.add_argument("--port", type=int, default=None, help=f"Port to bind (default: {settings.server.port})")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=getattr(logging, settings.logging.level, logging.INFO),
+        format=settings.logging.format,
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+
+    if not os.getenv("GROQ_API_KEY"):
+        print("ERROR: GROQ_API_KEY not found in environment.")
+        sys.exit(1)
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(run_server(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,38 +4,66 @@ This module provides business logic services:
 - LLM service for AI text generation
 - Browser service for live course fetching
 - Course service for search, filter, rank
-- Intent service for query classification
+- Intent service for query classification (rule-based fast path + LLM)
 """
 
-from udemy_gpt.services.llm_service import LLMService, get_client, reset_client
+from udemy_gpt.services.llm_service import (
+    LLMService,
+    get_client,
+    get_llm_circuit_breaker,
+    get_llm_rate_limiter,
+    get_response_cache,
+    reset_client,
+)
+from udemy_gpt.services.response_cache import ResponseCache, make_cache_key
 from udemy_gpt.services.browser_service import (
     fetch_course_details,
+    fetch_many_course_details,
     close_browser,
     get_browser_context,
+    get_detail_cache,
+    get_page_pool,
+    get_resource_blocker,
     STEALTH_AVAILABLE,
 )
+from udemy_gpt.services.page_pool import PagePool
 from udemy_gpt.services.course_service import (
     filter_courses,
+    filter_mask,
+    filter_indices,
     rank_courses,
     get_topic_stats,
     compare_topics,
     search_courses,
     get_top_courses_global,
 )
+from udemy_gpt.services.intent_rules import RULE_CONFIDENCE_THRESHOLD, classify_by_rules
 from udemy_gpt.services.intent_service import IntentService
 
 __all__ = [
     # LLM Service
     "LLMService",
     "get_client",
+    "get_llm_circuit_breaker",
+    "get_llm_rate_limiter",
+    "get_response_cache",
     "reset_client",
+    "ResponseCache",
+    "make_cache_key",
     # Browser Service
     "fetch_course_details",
+    "fetch_many_course_details",
     "close_browser",
     "get_browser_context",
+    "get_detail_cache",
+    "get_page_pool",
+    "get_resource_blocker",
+    "PagePool",
     "STEALTH_AVAILABLE",
     # Course Service
     "filter_courses",
+    "filter_mask",
+    "filter_indices",
     "rank_courses",
     "get_topic_stats",
     "compare_topics",
@@ -43,4 +71,6 @@ __all__ = [
     "get_top_courses_global",
     # Intent Service
     "IntentService",
+    "classify_by_rules",
+    "RULE_CONFIDENCE_THRESHOLD",
 ]
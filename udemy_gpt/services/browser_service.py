@@ -1,41 +1,97 @@
 """Browser service for fetching live course details from Udemy.
 
 This module provides Playwright-based browser automation with
-stealth mode, Cloudflare handling, and LLM-based extraction.
+stealth mode, Cloudflare handling, and LLM-based extraction. Playwright
+is imported on the first browser fetch, not at import time. Fetches
+borrow pages from a bounded pool of warm, pre-stealthed pages, so
+concurrent fetches share at most ``BROWSER_PAGE_POOL_SIZE`` tabs.
+Images, media, fonts and third-party requests are blocked, since only
+the page text is read. Page loading waits on page events (sections
+appearing, network and DOM going quiet) rather than fixed sleeps, unless
+``BROWSER_HUMAN_PACING`` asks for human-like pauses. Course fields are
+read from the page structure (JSON-LD, ``data-purpose`` elements, page
+state); the LLM is asked only for fields that extraction missed.
+Fetched details are cached by URL (see ``get_detail_cache``), so repeat
+requests skip the browser entirely.
 """
 
 import asyncio
 import json
 import logging
 import random
-from typing import Optional
-
-from langsmith import traceable
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, List, Optional, Sequence, TypeVar
 
+from udemy_common import traceable
+from udemy_common.browser import STEALTH_AVAILABLE, ResourceBlocker, apply_stealth
+from udemy_common.course_page import extract_course_page, merge_course_fields, missing_course_fields
+from udemy_common.detail_cache import CourseDetailCache
 from udemy_gpt.config import settings
 from udemy_gpt.models import CourseDetails
+from udemy_gpt.services.page_pool import PagePool
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Browser instance globals
-_browser: Optional[Browser] = None
+_browser: Optional["Browser"] = None
 _playwright = None
-_context: Optional[BrowserContext] = None
-
-# Stealth mode setup
-try:
-    from playwright_stealth import Stealth
-    _stealth_instance = Stealth()
-    STEALTH_AVAILABLE = True
-except ImportError:
-    try:
-        from playwright_stealth import stealth_async
-        _stealth_instance = None
-        STEALTH_AVAILABLE = True
-    except ImportError:
-        STEALTH_AVAILABLE = False
-        _stealth_instance = None
+_context: Optional["BrowserContext"] = None
+# Serializes browser startup when several sessions fetch at once
+_launch_lock: Optional[asyncio.Lock] = None
+# Warm pages shared by all fetches
+_page_pool: Optional[PagePool] = None
+# Request blocking policy for pooled pages (None when disabled)
+_resource_blocker: Optional[ResourceBlocker] = None
+# Fetched course details, keyed by URL
+_detail_cache: Optional[CourseDetailCache] = None
+
+# Lazily rendered sections the extraction needs
+_SECTION_SELECTORS = [
+    'h2:has-text("Course content"), [data-purpose="curriculum-section-container"]',
+    '[data-purpose="instructor-bio"], h2:has-text("Instructor")',
+]
+
+# Milliseconds without DOM mutations that count as settled
+_DOM_QUIET_MS = 400
+
+# Resolves true once the DOM has not changed for quietMs, false at timeoutMs
+_DOM_QUIET_SCRIPT = """
+    ([quietMs, timeoutMs]) => new Promise((resolve) => {
+        let quiet, limit;
+        const observer = new MutationObserver(() => {
+            clearTimeout(quiet);
+            quiet = setTimeout(() => done(true), quietMs);
+        });
+        const done = (settled) => {
+            observer.disconnect();
+            clearTimeout(quiet);
+            clearTimeout(limit);
+            resolve(settled);
+        };
+        observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+        quiet = setTimeout(() => done(true), quietMs);
+        limit = setTimeout(() => done(false), timeoutMs);
+    })
+"""
+
+# Scrolls through the page one viewport per animation frame pair, so
+# lazily loaded sections enter the viewport without timed pauses
+_SCROLL_THROUGH_SCRIPT = """
+    async () => {
+        const frame = () => new Promise((r) => requestAnimationFrame(() => requestAnimationFrame(r)));
+        for (let y = 0; y < document.body.scrollHeight; y += window.innerHeight) {
+            window.scrollTo(0, y);
+            await frame();
+        }
+        window.scrollTo(0, document.body.scrollHeight);
+        await frame();
+    }
+"""
 
 # LLM prompt for course detail extraction
 COURSE_DETAIL_SYSTEM_PROMPT = """You are an expert at extracting detailed course information from Udemy course pages.
@@ -127,17 +183,31 @@ Page Text:
 
 Return a JSON object with all course details."""
 
+COURSE_DETAIL_MISSING_FIELDS = """
+
+The other fields are already known. Only extract these fields: {fields}"""
 
-async def get_browser_context() -> BrowserContext:
-    """Get or create browser context.
+
+async def get_browser_context() -> "BrowserContext":
+    """Get or create the browser context shared by all sessions.
 
     Returns:
         Playwright browser context
     """
-    global _browser, _playwright, _context
+    global _browser, _playwright, _context, _launch_lock
+
+    if _context is not None:
+        return _context
+
+    if _launch_lock is None:
+        _launch_lock = asyncio.Lock()
+    async with _launch_lock:
+        if _browser is not None:
+            return _context
 
-    if _browser is None:
         browser_settings = settings.browser
+        from playwright.async_api import async_playwright
+
         _playwright = await async_playwright().start()
         _browser = await _playwright.chromium.launch(
             headless=browser_settings.headless,
@@ -163,10 +233,78 @@ async def get_browser_context() -> BrowserContext:
     return _context
 
 
+def get_resource_blocker() -> Optional[ResourceBlocker]:
+    """Get the request blocking policy from settings.
+
+    Returns:
+        Shared ResourceBlocker, or None if resource blocking is disabled
+    """
+    global _resource_blocker
+
+    if _resource_blocker is None:
+        _resource_blocker = ResourceBlocker.from_settings(settings.browser)
+    return _resource_blocker
+
+
+async def _prepare_page(page: "Page") -> None:
+    """Apply stealth mode and request blocking to a new pooled page."""
+    await apply_stealth(page)
+    blocker = get_resource_blocker()
+    if blocker is not None:
+        await blocker.attach(page)
+
+
+def get_page_pool() -> PagePool:
+    """Get or create the page pool shared by all fetches.
+
+    Returns:
+        Page pool on the shared browser context
+    """
+    global _page_pool
+
+    if _page_pool is None:
+        _page_pool = PagePool(
+            get_browser_context,
+            size=settings.browser.page_pool_size,
+            max_uses=settings.browser.page_max_uses,
+            prepare=_prepare_page,
+        )
+    return _page_pool
+
+
+def get_detail_cache() -> Optional[CourseDetailCache]:
+    """Get the course detail cache shared by all fetches.
+
+    Returns:
+        CourseDetailCache, or None if detail caching is disabled
+    """
+    global _detail_cache
+
+    cache_settings = settings.detail_cache
+    if not cache_settings.enabled:
+        return None
+
+    if _detail_cache is None:
+        db_path = None
+        if cache_settings.persist:
+            db_path = cache_settings.db_path or settings.paths.data_dir / "cache" / "course_details.sqlite3"
+        _detail_cache = CourseDetailCache(
+            ttl=cache_settings.ttl,
+            max_stale=cache_settings.max_stale,
+            max_entries=cache_settings.max_entries,
+            db_path=db_path,
+            namespace="udemy_gpt",
+        )
+    return _detail_cache
+
+
 async def close_browser() -> None:
     """Close browser resources."""
-    global _browser, _playwright, _context
+    global _browser, _playwright, _context, _page_pool
 
+    if _page_pool:
+        await _page_pool.close()
+        _page_pool = None
     if _context:
         await _context.close()
     if _browser:
@@ -180,7 +318,7 @@ async def close_browser() -> None:
     logger.info("Browser closed")
 
 
-async def _wait_for_cloudflare(page: Page, max_wait: Optional[int] = None) -> bool:
+async def _wait_for_cloudflare(page: "Page", max_wait: Optional[int] = None) -> bool:
     """Wait for Cloudflare challenge to complete.
 
     Args:
@@ -190,45 +328,112 @@ async def _wait_for_cloudflare(page: Page, max_wait: Optional[int] = None) -> bo
     Returns:
         True if challenge passed, False if timeout
     """
-    import time
-
     max_wait = max_wait or settings.browser.cloudflare_wait
-    start = time.time()
 
     cloudflare_indicators = [
         "just a moment", "checking your browser", "please wait",
         "verifying you are human"
     ]
 
-    while time.time() - start < max_wait:
-        title = await page.title()
-        title_lower = title.lower()
+    try:
+        await page.wait_for_function(
+            "(indicators) => !indicators.some((i) => document.title.toLowerCase().includes(i))",
+            arg=cloudflare_indicators,
+            timeout=max_wait * 1000,
+            polling=250,
+        )
+        return True
+    except Exception:
+        return False
 
-        is_cloudflare = any(ind in title_lower for ind in cloudflare_indicators)
 
-        if not is_cloudflare:
-            return True
-        await asyncio.sleep(2)
+class _LoadTimer:
+    """Splits page load time into waiting on the page and working on it."""
 
-    return False
+    def __init__(self):
+        self.started = time.monotonic()
+        self.waited = 0.0
+
+    async def wait(self, awaitable: Awaitable[T]) -> T:
+        """Await something counted as waiting time."""
+        start = time.monotonic()
+        try:
+            return await awaitable
+        finally:
+            self.waited += time.monotonic() - start
 
+    async def pause(self, min_sec: float, max_sec: float) -> None:
+        """Sleep a random human-like interval, only in human pacing mode."""
+        if settings.browser.human_pacing:
+            await self.wait(asyncio.sleep(random.uniform(min_sec, max_sec)))
 
-async def _apply_stealth(page: Page) -> None:
-    """Apply stealth mode to page if available."""
-    if not STEALTH_AVAILABLE:
-        return
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the load started."""
+        return time.monotonic() - self.started
 
+
+async def _wait_for_dom_quiet(page: "Page", timeout: Optional[int] = None) -> bool:
+    """Wait until the DOM stops changing.
+
+    Args:
+        page: Playwright page
+        timeout: Maximum wait in milliseconds
+
+    Returns:
+        True if the DOM settled, False if it was still changing at timeout
+    """
+    timeout = timeout or settings.browser.settle_timeout
     try:
-        if _stealth_instance:
-            await _stealth_instance.apply_stealth_async(page)
-        else:
-            from playwright_stealth import stealth_async
-            await stealth_async(page)
+        return bool(await page.evaluate(_DOM_QUIET_SCRIPT, [_DOM_QUIET_MS, timeout]))
     except Exception as e:
-        logger.debug(f"Stealth application failed: {e}")
+        logger.debug(f"DOM quiescence check failed: {e}")
+        return False
+
+
+async def _wait_for_network_idle(page: "Page", timeout: Optional[int] = None) -> bool:
+    """Wait for a window with no network requests in flight.
+
+    Args:
+        page: Playwright page
+        timeout: Maximum wait in milliseconds
+
+    Returns:
+        True if the network went idle before timeout
+    """
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout or settings.browser.settle_timeout)
+        return True
+    except Exception:
+        return False
+
+
+async def _wait_for_sections(page: "Page", timeout: Optional[int] = None) -> int:
+    """Wait for the lazily rendered sections the extraction needs.
+
+    Args:
+        page: Playwright page
+        timeout: Maximum wait per section in milliseconds
+
+    Returns:
+        Number of sections found
+    """
+    timeout = timeout or settings.browser.settle_timeout
+
+    async def wait_for(selector: str) -> bool:
+        try:
+            await page.wait_for_selector(selector, state="attached", timeout=timeout)
+            return True
+        except Exception:
+            return False
 
+    found = await asyncio.gather(*(wait_for(selector) for selector in _SECTION_SELECTORS))
+    if not all(found):
+        logger.debug(f"Found {sum(found)}/{len(found)} course page sections")
+    return sum(found)
 
-async def _extract_page_text(page: Page) -> str:
+
+async def _extract_page_text(page: "Page") -> str:
     """Extract all visible text from page using DOM tree walker.
 
     Args:
@@ -261,11 +466,12 @@ async def _extract_page_text(page: Page) -> str:
     """)
 
 
-async def _click_expand_buttons(page: Page) -> int:
+async def _click_expand_buttons(page: "Page", pause: float = 0.0) -> int:
     """Click expand/show more buttons to reveal full content.
 
     Args:
         page: Playwright page
+        pause: Seconds to pause after each click (human pacing)
 
     Returns:
         Number of buttons clicked
@@ -293,7 +499,8 @@ async def _click_expand_buttons(page: Page) -> int:
                     if await btn.is_visible(timeout=1000):
                         await btn.click()
                         clicked += 1
-                        await asyncio.sleep(0.5)
+                        if pause:
+                            await asyncio.sleep(pause)
                 except Exception:
                     pass
         except Exception:
@@ -339,100 +546,132 @@ def _parse_llm_response(response_text: str) -> Optional[dict]:
         return None
 
 
-@traceable(name="browser_fetch_course_details", run_type="chain")
-async def fetch_course_details(course_url: str) -> Optional[CourseDetails]:
-    """Fetch detailed course information from Udemy URL using LLM extraction.
+async def _load_course_page(page: "Page", course_url: str) -> Optional[str]:
+    """Open a course page, reveal lazy and collapsed content, and read its text.
+
+    Each step waits for the page to react (sections attached, network
+    idle, DOM quiet) instead of sleeping a fixed time; human pacing mode
+    adds random pauses between steps.
 
     Args:
+        page: Pooled Playwright page
         course_url: Full Udemy course URL
 
     Returns:
-        CourseDetails object or None if fetch fails
+        Visible page text, or None if the Cloudflare challenge did not clear
     """
-    if not course_url:
+    timer = _LoadTimer()
+    pause = 0.5 if settings.browser.human_pacing else 0.0
+
+    # Navigate to course page
+    logger.info(f"Navigating to: {course_url}")
+    await timer.wait(page.goto(
+        course_url,
+        wait_until="domcontentloaded",
+        timeout=settings.browser.timeout
+    ))
+    await timer.pause(3, 5)
+
+    # Wait for Cloudflare
+    if not await timer.wait(_wait_for_cloudflare(page)):
+        logger.warning("Cloudflare challenge not resolved")
         return None
+    await timer.wait(_wait_for_network_idle(page))
 
-    # Import LLM service here to avoid circular imports
-    from udemy_gpt.services.llm_service import LLMService
+    # Scroll through the page to trigger lazy loading (the instructor
+    # section is at the bottom), then wait for the sections to render
+    await timer.wait(page.evaluate(_SCROLL_THROUGH_SCRIPT))
+    await timer.pause(1, 2)
+    await timer.wait(_wait_for_sections(page))
+    await timer.wait(_wait_for_dom_quiet(page))
 
-    ctx = await get_browser_context()
-    page = await ctx.new_page()
-    llm = LLMService()
+    # Click "Expand all sections" and "Show more" buttons (curriculum,
+    # description, instructor bio), waiting for each round to render
+    for _ in range(2):
+        if not await _click_expand_buttons(page, pause):
+            break
+        await timer.wait(_wait_for_dom_quiet(page))
+        await timer.pause(0.5, 1)
 
-    try:
-        await _apply_stealth(page)
-
-        # Navigate to course page
-        logger.info(f"Navigating to: {course_url}")
-        await page.goto(
-            course_url,
-            wait_until="domcontentloaded",
-            timeout=settings.browser.timeout
-        )
-        await asyncio.sleep(random.uniform(3, 5))
+    # Scroll back to top before extraction
+    await page.evaluate("window.scrollTo(0, 0)")
 
-        # Wait for Cloudflare
-        if not await _wait_for_cloudflare(page):
-            logger.warning("Cloudflare challenge not resolved")
-            return None
+    # Extract all page text
+    page_text = await _extract_page_text(page)
+    logger.info(
+        f"Extracted {len(page_text)} characters of page text in {timer.elapsed:.1f}s "
+        f"({timer.waited:.1f}s waiting, {timer.elapsed - timer.waited:.1f}s working)"
+    )
 
-        # Scroll to bottom to load all lazy content (instructor section is at bottom)
-        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await asyncio.sleep(2)
+    return page_text
 
-        # Scroll back to top
-        await page.evaluate("window.scrollTo(0, 0)")
-        await asyncio.sleep(1)
 
-        # Click "Expand all sections" first (for course content)
-        await _click_expand_buttons(page)
-        await asyncio.sleep(1)
+async def _extract_with_llm(course_url: str, page_text: str, fields: List[str]) -> dict:
+    """Ask the LLM for course fields that structured extraction missed.
 
-        # Scroll through the entire page slowly to trigger lazy loading
-        for _ in range(8):
-            await page.evaluate("window.scrollBy(0, window.innerHeight)")
-            await asyncio.sleep(random.uniform(0.4, 0.6))
+    Args:
+        course_url: Full Udemy course URL
+        page_text: Visible page text
+        fields: Field names to extract
 
-        # Click all "Show more" buttons (description, instructor bio, etc.)
-        await _click_expand_buttons(page)
-        await asyncio.sleep(1)
+    Returns:
+        Extracted fields, or an empty dict if the LLM call or parse fails
+    """
+    # Import LLM service here to avoid circular imports
+    from udemy_gpt.services.llm_service import LLMService
 
-        # Scroll to very bottom again to ensure instructor section is loaded
-        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await asyncio.sleep(2)
+    user_prompt = COURSE_DETAIL_USER_PROMPT.format(
+        url=course_url,
+        page_text=page_text[:50000]
+    ) + COURSE_DETAIL_MISSING_FIELDS.format(fields=", ".join(fields))
 
-        # Click any remaining expand buttons
-        await _click_expand_buttons(page)
-        await asyncio.sleep(0.5)
+    logger.info(f"Sending page text to LLM for {len(fields)} missing fields...")
+    try:
+        response = await LLMService().call(
+            COURSE_DETAIL_SYSTEM_PROMPT,
+            user_prompt,
+            temperature=0.1
+        )
+    except Exception as e:
+        logger.warning(f"LLM extraction failed, keeping structured fields: {e}")
+        return {}
 
-        # Scroll back to top before extraction
-        await page.evaluate("window.scrollTo(0, 0)")
-        await asyncio.sleep(1)
+    data = _parse_llm_response(response)
+    if not data:
+        logger.error("Failed to parse LLM response")
+        return {}
+    return data
 
-        # Extract all page text
-        page_text = await _extract_page_text(page)
-        logger.info(f"Extracted {len(page_text)} characters of page text")
 
-        # Limit page text for LLM
-        page_text = page_text[:50000]
+async def _fetch_live_course_details(course_url: str) -> Optional[CourseDetails]:
+    """Fetch detailed course information from a Udemy course page.
 
-        # Use LLM to extract structured data
-        user_prompt = COURSE_DETAIL_USER_PROMPT.format(
-            url=course_url,
-            page_text=page_text
-        )
+    Fields are extracted from the page structure; the LLM only fills
+    essential fields that extraction could not find.
 
-        logger.info("Sending page text to LLM for extraction...")
-        response = await llm.call(
-            COURSE_DETAIL_SYSTEM_PROMPT,
-            user_prompt,
-            temperature=0.1
-        )
+    Args:
+        course_url: Full Udemy course URL
 
-        # Parse LLM response
-        data = _parse_llm_response(response)
-        if not data:
-            logger.error("Failed to parse LLM response")
+    Returns:
+        CourseDetails object or None if fetch fails
+    """
+    try:
+        # Release the page before the LLM call so other fetches can use it
+        async with get_page_pool().page() as page:
+            page_text = await _load_course_page(page, course_url)
+            if page_text is None:
+                return None
+            data = await extract_course_page(page, page_text)
+
+        missing = missing_course_fields(data)
+        if missing:
+            logger.info(f"Structured extraction missed: {', '.join(missing)}")
+            data = merge_course_fields(data, await _extract_with_llm(course_url, page_text, missing))
+        else:
+            logger.info("Structured extraction complete, skipping LLM")
+
+        if not data.get("title"):
+            logger.error("Could not extract course details")
             return None
 
         logger.info(f"Extracted course: {data.get('title', 'Unknown')[:50]}")
@@ -489,5 +728,62 @@ async def fetch_course_details(course_url: str) -> Optional[CourseDetails]:
         logger.error(f"Browser error fetching course details: {e}")
         return None
 
-    finally:
-        await page.close()
+
+@traceable(name="browser_fetch_course_details", run_type="chain")
+async def fetch_course_details(
+    course_url: str,
+    listing_price: Optional[str] = None,
+    refresh: bool = False,
+) -> Optional[CourseDetails]:
+    """Fetch detailed course information from a Udemy URL.
+
+    Cached details are returned immediately; stale ones are refreshed in
+    the background. A listing price that differs from the cached price
+    drops the cached entry first.
+
+    Args:
+        course_url: Full Udemy course URL
+        listing_price: Current price from a live listing scrape, if known.
+            Knowledge-base prices are dataset snapshots and must not be
+            passed here.
+        refresh: Skip the cache and fetch live
+
+    Returns:
+        CourseDetails object or None if fetch fails
+    """
+    if not course_url:
+        return None
+
+    detail_cache = get_detail_cache()
+    if detail_cache is None:
+        return await _fetch_live_course_details(course_url)
+
+    if listing_price:
+        detail_cache.invalidate_if_price_changed(course_url, listing_price)
+
+    async def fetch() -> Optional[Dict[str, Any]]:
+        details = await _fetch_live_course_details(course_url)
+        return details.model_dump() if details else None
+
+    data = await detail_cache.get_or_fetch(course_url, fetch, refresh=refresh)
+    if data is None:
+        return None
+    try:
+        return CourseDetails(**data)
+    except ValueError as e:
+        # Entry written by an older CourseDetails schema
+        logger.warning(f"Dropping unreadable cached details for {course_url}: {e}")
+        detail_cache.invalidate(course_url)
+        return await _fetch_live_course_details(course_url)
+
+
+async def fetch_many_course_details(course_urls: Sequence[str]) -> List[Optional[CourseDetails]]:
+    """Fetch several courses concurrently, bounded by the page pool.
+
+    Args:
+        course_urls: Full Udemy course URLs
+
+    Returns:
+        CourseDetails (or None on failure) for each URL, in order
+    """
+    return list(await asyncio.gather(*(fetch_course_details(url) for url in course_urls)))
@@ -4,16 +4,21 @@ This module provides the business logic for course operations including
 filtering, ranking, statistics, and comparison.
 """
 
+import heapq
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from langsmith import traceable
+import numpy as np
 
+from udemy_common import traceable
 from udemy_gpt.data import (
+    CourseStore,
+    LEVELS,
+    get_course_text_index,
     get_index,
+    get_topic_stats_table,
     load_multiple_topics,
     load_all_courses,
-    load_topic_courses,
     search_topics,
     parse_rating,
     parse_price,
@@ -29,9 +34,73 @@ logger = logging.getLogger(__name__)
 # Filtering
 # =============================================================================
 
+def filter_mask(
+    store: CourseStore,
+    min_rating: Optional[float] = None,
+    max_price: Optional[float] = None,
+    level: Optional[str] = None,
+    is_free: Optional[bool] = None,
+    min_duration: Optional[float] = None,
+    max_duration: Optional[float] = None,
+    bestseller_only: bool = False,
+) -> np.ndarray:
+    """Evaluate filter criteria as a combined boolean mask.
+
+    Each predicate is applied to a whole typed column at once. Thresholds
+    are cast to float32 so comparisons match the values the row-by-row
+    path sees after parsing.
+
+    Args:
+        store: Course store to evaluate
+        min_rating: Minimum rating threshold
+        max_price: Maximum price threshold
+        level: Required level (substring match, case-insensitive)
+        is_free: If True, only free courses; if False, only paid
+        min_duration: Minimum duration in hours
+        max_duration: Maximum duration in hours
+        bestseller_only: If True, only bestseller courses
+
+    Returns:
+        Boolean array, True for rows matching every criterion
+    """
+    mask = np.ones(len(store), dtype=bool)
+
+    if min_rating:
+        mask &= store.rating >= np.float32(min_rating)
+    if max_price is not None:
+        mask &= store.price <= np.float32(max_price)
+    if is_free is not None:
+        mask &= (store.price == 0) if is_free else (store.price != 0)
+    if level:
+        level_lower = level.lower()
+        codes = LEVELS.codes_where(lambda value: level_lower in value)
+        mask &= np.isin(store.level_code, codes)
+    if min_duration:
+        mask &= store.hours >= np.float32(min_duration)
+    if max_duration:
+        mask &= store.hours <= np.float32(max_duration)
+    if bestseller_only:
+        mask &= store.bestseller
+
+    return mask
+
+
+def filter_indices(store: CourseStore, **criteria: Any) -> np.ndarray:
+    """Get positions of rows matching filter criteria.
+
+    Args:
+        store: Course store to evaluate
+        **criteria: Keyword arguments accepted by ``filter_mask``
+
+    Returns:
+        Array of matching row positions, in store order
+    """
+    return np.flatnonzero(filter_mask(store, **criteria))
+
+
 @traceable(name="filter_courses", run_type="tool")
 def filter_courses(
-    courses: List[Dict],
+    courses: Sequence[Dict],
     min_rating: Optional[float] = None,
     max_price: Optional[float] = None,
     level: Optional[str] = None,
@@ -53,8 +122,20 @@ def filter_courses(
         bestseller_only: If True, only bestseller courses
 
     Returns:
-        Filtered list of courses
+        Filtered list of courses (a CourseStore when given one)
     """
+    if isinstance(courses, CourseStore):
+        return courses.take(filter_indices(
+            courses,
+            min_rating=min_rating,
+            max_price=max_price,
+            level=level,
+            is_free=is_free,
+            min_duration=min_duration,
+            max_duration=max_duration,
+            bestseller_only=bestseller_only,
+        ))
+
     filtered = []
 
     for course in courses:
@@ -102,9 +183,19 @@ def filter_courses(
 # Ranking
 # =============================================================================
 
+def _rank_store(store: CourseStore, sort_by: str, limit: int) -> CourseStore:
+    """Rank a CourseStore using its precomputed ranking keys.
+
+    Only the top ``limit`` rows are selected (see ``CourseStore.top_k``);
+    ties keep their original order exactly like ``sorted(..., reverse=True)``
+    does on the row dictionaries.
+    """
+    return store.take(store.top_k(sort_by, limit))
+
+
 @traceable(name="rank_courses", run_type="tool")
 def rank_courses(
-    courses: List[Dict],
+    courses: Sequence[Dict],
     sort_by: str = "rating",
     limit: int = 10
 ) -> List[Dict]:
@@ -112,56 +203,48 @@ def rank_courses(
 
     Args:
         courses: List of course dictionaries
-        sort_by: Sort criterion (rating, reviews, price, price_desc, duration)
+        sort_by: Sort criterion (rating, reviews, price, price_desc, duration,
+            duration_asc)
         limit: Maximum number of courses to return
 
     Returns:
-        Sorted and limited list of courses
+        Sorted and limited list of courses (a CourseStore when given one)
     """
-    if sort_by == "rating":
-        sorted_courses = sorted(
-            courses,
-            key=lambda x: (
-                parse_rating(x.get("rating", "0")),
-                parse_number(x.get("reviews_count", "0"))
-            ),
-            reverse=True
-        )
-    elif sort_by == "reviews":
-        sorted_courses = sorted(
-            courses,
-            key=lambda x: parse_number(x.get("reviews_count", "0")),
-            reverse=True
+    if isinstance(courses, CourseStore):
+        return _rank_store(courses, sort_by, limit)
+
+    # heapq.nlargest/nsmallest are equivalent to sorted(...)[:limit], ties
+    # included, but only keep ``limit`` items around while scanning
+    if sort_by == "reviews":
+        return heapq.nlargest(
+            limit, courses, key=lambda x: parse_number(x.get("reviews_count", "0"))
         )
-    elif sort_by == "price":
-        sorted_courses = sorted(
-            courses,
-            key=lambda x: parse_price(x.get("price", "$99"))
+    if sort_by == "price":
+        return heapq.nsmallest(
+            limit, courses, key=lambda x: parse_price(x.get("price", "$99"))
         )
-    elif sort_by == "price_desc":
-        sorted_courses = sorted(
-            courses,
-            key=lambda x: parse_price(x.get("price", "$99")),
-            reverse=True
+    if sort_by == "price_desc":
+        return heapq.nlargest(
+            limit, courses, key=lambda x: parse_price(x.get("price", "$99"))
         )
-    elif sort_by == "duration":
-        sorted_courses = sorted(
-            courses,
-            key=lambda x: parse_duration(x.get("duration", "0")),
-            reverse=True
+    if sort_by == "duration":
+        return heapq.nlargest(
+            limit, courses, key=lambda x: parse_duration(x.get("duration", "0"))
         )
-    else:
-        # Default to rating
-        sorted_courses = sorted(
-            courses,
-            key=lambda x: (
-                parse_rating(x.get("rating", "0")),
-                parse_number(x.get("reviews_count", "0"))
-            ),
-            reverse=True
+    if sort_by == "duration_asc":
+        return heapq.nsmallest(
+            limit, courses, key=lambda x: parse_duration(x.get("duration", "0"))
         )
 
-    return sorted_courses[:limit]
+    # Default to rating, tie-broken by reviews
+    return heapq.nlargest(
+        limit,
+        courses,
+        key=lambda x: (
+            parse_rating(x.get("rating", "0")),
+            parse_number(x.get("reviews_count", "0"))
+        ),
+    )
 
 
 # =============================================================================
@@ -172,47 +255,30 @@ def rank_courses(
 def get_topic_stats(topic_slug: str) -> TopicStats:
     """Get statistics for a topic.
 
+    Statistics are precomputed when the topic index is built (and
+    persisted with it), so this is a lookup rather than a pass over the
+    topic's courses.
+
     Args:
         topic_slug: Topic identifier
 
     Returns:
         TopicStats object with aggregated statistics
     """
-    index = get_index()
-    topic_info = index.get(topic_slug, {})
-    courses = load_topic_courses(topic_slug, topic_info)
-
-    if not courses:
+    stats = get_topic_stats_table().get(topic_slug)
+    if not stats or not stats["course_count"]:
         return TopicStats(topic=topic_slug)
 
-    ratings = [parse_rating(c.get("rating", "0")) for c in courses]
-    prices = [parse_price(c.get("price", "$0")) for c in courses]
-    reviews = [parse_number(c.get("reviews_count", "0")) for c in courses]
-
-    # Find top course by rating and reviews
-    top = max(
-        courses,
-        key=lambda x: (
-            parse_rating(x.get("rating", "0")),
-            parse_number(x.get("reviews_count", "0"))
-        )
-    )
-
+    top = stats["top_course"]
     return TopicStats(
         topic=topic_slug,
-        course_count=len(courses),
-        avg_rating=sum(ratings) / len(ratings) if ratings else 0,
-        avg_price=sum(prices) / len(prices) if prices else 0,
-        total_reviews=sum(reviews),
-        free_courses=len([c for c in courses if parse_price(c.get("price", "$99")) == 0]),
-        beginner_courses=len([c for c in courses if "beginner" in c.get("level", "").lower()]),
-        top_course=Course(
-            title=top.get("title", ""),
-            url=top.get("url", ""),
-            rating=parse_rating(top.get("rating", "0")),
-            reviews_count=parse_number(top.get("reviews_count", "0")),
-            price=top.get("price", ""),
-        ),
+        course_count=stats["course_count"],
+        avg_rating=stats["avg_rating"],
+        avg_price=stats["avg_price"],
+        total_reviews=stats["total_reviews"],
+        free_courses=stats["free_courses"],
+        beginner_courses=stats["beginner_courses"],
+        top_course=Course(**top) if top else None,
     )
 
 
@@ -270,17 +336,23 @@ def search_courses(
     matching_topics = search_topics(query)
 
     if not matching_topics:
-        # Fallback to title/instructor search
-        all_courses = load_all_courses(index)
-        query_lower = query.lower()
-        matching = [
-            c for c in all_courses
-            if query_lower in c.get("title", "").lower()
-            or query_lower in c.get("instructor", "").lower()
-        ]
-        if matching:
-            return rank_courses(matching, "rating", limit), []
-        return [], []
+        # Fallback to BM25 full-text search over title, subtitle and
+        # instructor, blended with rating
+        text_index = get_course_text_index(index)
+        mask = None
+        if filters:
+            mask = filter_mask(
+                text_index.store,
+                min_rating=filters.get("min_rating"),
+                max_price=filters.get("max_price"),
+                level=filters.get("level"),
+                is_free=filters.get("is_free"),
+                min_duration=filters.get("min_duration"),
+                max_duration=filters.get("max_duration"),
+                bestseller_only=filters.get("bestseller_only", False),
+            )
+        doc_ids = text_index.search(query, limit, mask=mask)
+        return text_index.store.take(doc_ids), []
 
     courses = load_multiple_topics(matching_topics, index)
 
@@ -0,0 +1,188 @@
+"""Rule-based fast-path intent classification.
+
+Classifies messages whose intent is evident from their wording (course
+numbers, "X vs Y", "top 10 free python courses", greetings) without an
+LLM call. Topics come from the topic slugs and alias table, filters from
+regular expressions. Every result carries a confidence score; the intent
+service only trusts results at or above its threshold and asks the LLM
+otherwise.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from udemy_gpt.data import find_topics_in_text
+from udemy_gpt.models import IntentClassification
+from udemy_gpt.utils import extract_filters_from_text
+
+# Minimum confidence for a rule-based result to skip the LLM
+RULE_CONFIDENCE_THRESHOLD = 0.8
+
+# Confidence for matches whose wording the rules cannot fully express
+_UNSURE_CONFIDENCE = 0.6
+
+_GREETING_RE = re.compile(
+    r"^\s*(?:hi|hello|hey|thanks|thank\s+you|thx|good\s+(?:morning|afternoon|evening)|bye|goodbye)"
+    r"(?:\s+there)?[\s!.,]*$",
+    re.IGNORECASE,
+)
+_COURSE_NUMBER_RE = re.compile(r"\bcourses?\s*#?\s*(\d+)\b", re.IGNORECASE)
+_COMPARE_NUMBERS_RE = re.compile(
+    r"\bcompare\b.*?\b(\d+)\b.*?\b(?:and|with|to|vs\.?|versus)\s+(?:course\s*#?\s*)?(\d+)\b",
+    re.IGNORECASE,
+)
+_COMPARE_WORD_RE = re.compile(r"\b(?:compare|comparison|vs\.?|versus|difference)\b", re.IGNORECASE)
+_VERSUS_RE = re.compile(r"^(.+?)\s+(?:vs\.?|versus|or)\s+(.+)$", re.IGNORECASE)
+_COMPARE_TOPICS_RE = re.compile(r"\bcompare\s+(.+?)\s+(?:and|with|to)\s+(.+)$", re.IGNORECASE)
+_DETAILS_RE = re.compile(
+    r"\b(?:details?|more\s+(?:info|about)|tell\s+me\s+(?:more\s+)?about|info(?:rmation)?\s+(?:on|about)"
+    r"|describe|syllabus|curriculum|what(?:'s|\s+is)\s+in)\b",
+    re.IGNORECASE,
+)
+_LIVE_RE = re.compile(r"\b(?:live|current|latest|up[\s-]to[\s-]date|right\s+now|today)\b", re.IGNORECASE)
+_STATS_RE = re.compile(
+    r"\bhow\s+many\s+courses\b|\bnumber\s+of\s+courses\b|\bstat(?:s|istics)\s+(?:for|on|about|of)\b",
+    re.IGNORECASE,
+)
+_LEARNING_PATH_RE = re.compile(
+    r"\b(?:learning\s+path|roadmap|road\s+map|become\s+an?|career\s+(?:in|as|change))\b",
+    re.IGNORECASE,
+)
+_SEARCH_RE = re.compile(
+    r"\b(?:courses?|class(?:es)?|tutorials?|learn|find|show|search|looking\s+for|recommend|suggest|top|best)\b",
+    re.IGNORECASE,
+)
+_RECOMMEND_RE = re.compile(r"\b(?:recommend|suggest)", re.IGNORECASE)
+_TOP_RE = re.compile(
+    r"\b(?:top|best|most\s+(?:valuable|popular)|highest[\s-]rated)\b.*\bcourses?\b",
+    re.IGNORECASE,
+)
+_NEGATION_RE = re.compile(
+    r"\b(?:not|no|never|other\s+than|except|excluding|without|instead\s+of|rather\s+than|besides"
+    r"|apart\s+from|avoid)\b|n't\b",
+    re.IGNORECASE,
+)
+_SORT_REQUEST_RE = re.compile(
+    r"\b(?:sort(?:ed|ing)?|order(?:ed|ing)?|rank(?:ed|ing)?)\s+(?:them\s+)?by\b"
+    r"|\b(?:cheapest|priciest|shortest|quickest|longest|newest|oldest|latest|most\s+recent"
+    r"|most\s+(?:popular|reviewed|expensive|affordable)|least\s+\w+)\b",
+    re.IGNORECASE,
+)
+_ALTERNATIVES_RE = re.compile(r"\bor\b", re.IGNORECASE)
+
+
+def _result(intent: str, confidence: float, **fields: Any) -> IntentClassification:
+    """Build a classification tagged with its confidence."""
+    return IntentClassification(intent=intent, confidence=confidence, **fields)
+
+
+def _compare_topics(message: str) -> Optional[List[str]]:
+    """Get topics on both sides of an "X vs Y" / "compare X and Y" message."""
+    for pattern in (_COMPARE_TOPICS_RE, _VERSUS_RE):
+        match = pattern.search(message.strip().rstrip("?.!"))
+        if not match:
+            continue
+        left = find_topics_in_text(match.group(1))
+        right = [t for t in find_topics_in_text(match.group(2)) if t not in left]
+        if left and right:
+            return left + right
+    return None
+
+
+def _beyond_rules(message: str, topics: List[str], filters: Dict[str, Any]) -> bool:
+    """Check for wording a rule-based search result would silently drop.
+
+    Negations ("other than python"), sort orders the filters did not
+    capture ("newest") and alternatives with only one recognized topic
+    ("react or vue") would otherwise turn into a plain search for the
+    wrong courses.
+    """
+    if _NEGATION_RE.search(message):
+        return True
+    if _SORT_REQUEST_RE.search(message) and "sort_by" not in filters:
+        return True
+    return bool(_ALTERNATIVES_RE.search(message)) and len(topics) < 2
+
+
+def classify_by_rules(
+    user_message: str,
+    previous_results: Optional[List[Dict[str, Any]]] = None,
+) -> IntentClassification:
+    """Classify a message with deterministic rules.
+
+    Args:
+        user_message: User's query text
+        previous_results: Previous search results, if any (course number
+            references are only certain when there is something to refer to)
+
+    Returns:
+        IntentClassification whose ``confidence`` says how far the rules
+        can be trusted (0.0 when nothing matched)
+    """
+    message = user_message.strip()
+    if not message:
+        return _result("chat", 0.0)
+
+    if _GREETING_RE.match(message):
+        return _result("chat", 0.95)
+
+    has_results = bool(previous_results)
+    course_numbers = [int(n) for n in _COURSE_NUMBER_RE.findall(message)]
+
+    # "compare course 1 and 2", "course 1 vs course 3"
+    compare_numbers = _COMPARE_NUMBERS_RE.search(message)
+    if compare_numbers and len(course_numbers) < 2:
+        course_numbers = [int(compare_numbers.group(1)), int(compare_numbers.group(2))]
+    if len(course_numbers) >= 2 and (compare_numbers or _COMPARE_WORD_RE.search(message)):
+        return _result(
+            "compare",
+            0.95 if has_results else 0.85,
+            course_reference=course_numbers[0],
+        )
+
+    # "details of course 3", "get current details for course 2"
+    if len(course_numbers) == 1 and _DETAILS_RE.search(message):
+        return _result(
+            "details",
+            0.9 if has_results else 0.8,
+            course_reference=course_numbers[0],
+            needs_browser=bool(_LIVE_RE.search(message)),
+        )
+
+    # Career goals need the LLM to pick related topics and phrase the goal
+    if _LEARNING_PATH_RE.search(message):
+        return _result("learning_path", 0.4, topics=find_topics_in_text(message))
+
+    # "python vs javascript", "compare react and angular"
+    if _COMPARE_WORD_RE.search(message) or re.search(r"\bor\b", message, re.IGNORECASE):
+        topics = _compare_topics(message)
+        if topics:
+            confidence = 0.9 if _COMPARE_WORD_RE.search(message) else 0.6
+            return _result("compare_topics", confidence, topics=topics)
+
+    topics = find_topics_in_text(message)
+
+    if _STATS_RE.search(message):
+        return _result("stats", 0.85, topics=topics)
+
+    # Course references by name are resolved by the details handler
+    if _DETAILS_RE.search(message):
+        return _result("details", 0.5, topics=topics, course_reference=1)
+
+    filters = extract_filters_from_text(message)
+
+    confidence = _UNSURE_CONFIDENCE if _beyond_rules(message, topics, filters) else 0.85
+
+    # "top 10 free python courses", "recommend beginner excel courses"
+    if topics and _SEARCH_RE.search(message):
+        intent = "recommend" if _RECOMMEND_RE.search(message) else "search"
+        return _result(intent, confidence, topics=topics, filters=filters)
+
+    # "best free courses", "most valuable courses"
+    if not topics and _TOP_RE.search(message):
+        return _result("top_valuable", confidence, filters=filters)
+
+    if topics:
+        return _result("search", 0.6, topics=topics, filters=filters)
+
+    return _result("chat", 0.3)
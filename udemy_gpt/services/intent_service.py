@@ -2,18 +2,19 @@
 
 This module handles user intent classification using LLM,
 extracting topics, filters, and determining the appropriate
-action for user queries.
+action for user queries. Messages the rule-based classifier handles
+with enough confidence skip the LLM.
 """
 
 import json
 import logging
 from typing import Any, Dict, List, Optional
 
-from langsmith import traceable
-
-from udemy_gpt.data import get_topic_list_for_llm, validate_topics
+from udemy_common import current_run_tree, traceable
+from udemy_gpt.data import get_topic_list_for_llm, shortlist_topics, validate_topics
 from udemy_gpt.models import IntentClassification
 from udemy_gpt.prompts import get_intent_prompt
+from udemy_gpt.services.intent_rules import RULE_CONFIDENCE_THRESHOLD, classify_by_rules
 from udemy_gpt.services.llm_service import LLMService
 from udemy_gpt.utils import extract_json, parse_filters
 
@@ -23,20 +24,28 @@ logger = logging.getLogger(__name__)
 class IntentService:
     """Service for classifying user intents.
 
-    Uses LLM to analyze user queries and extract:
+    Tries the rule-based classifier first and uses the LLM for messages
+    it cannot classify confidently. Extracts:
     - Intent type (search, compare, details, etc.)
     - Relevant topics
     - Search filters
     - Course references
     """
 
-    def __init__(self, llm_service: Optional[LLMService] = None):
+    def __init__(
+        self,
+        llm_service: Optional[LLMService] = None,
+        rule_threshold: float = RULE_CONFIDENCE_THRESHOLD,
+    ):
         """Initialize intent service.
 
         Args:
             llm_service: Optional LLM service instance (creates one if not provided)
+            rule_threshold: Minimum rule-based confidence to skip the LLM
+                (above 1.0 always uses the LLM)
         """
         self._llm = llm_service or LLMService()
+        self._rule_threshold = rule_threshold
 
     @traceable(name="classify_intent", run_type="chain")
     async def classify(
@@ -53,7 +62,19 @@ class IntentService:
         Returns:
             IntentClassification with extracted intent and parameters
         """
-        topic_list = get_topic_list_for_llm()
+        ruled = classify_by_rules(user_message, previous_results)
+        fast_path = ruled.confidence is not None and ruled.confidence >= self._rule_threshold
+        run = current_run_tree()
+        if run is not None:
+            run.add_metadata({"intent_source": "rules" if fast_path else "llm", "rule_confidence": ruled.confidence})
+        if fast_path:
+            logger.info(
+                f"Intent (rules, {ruled.confidence:.2f}): {ruled.intent}, Topics: {ruled.topics}"
+            )
+            return ruled
+
+        # Offer the LLM only the topics relevant to this message
+        topic_list = get_topic_list_for_llm(shortlist_topics(user_message))
 
         # Build context from previous results
         context = ""
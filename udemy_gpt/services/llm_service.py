@@ -1,27 +1,47 @@
 """LLM service for AI-powered text generation.
 
-This module provides the LLM client with rate limiting, retry logic,
-and conversation history support.
+This module provides the LLM client with rate limiting, retries with
+backoff, circuit breaking, conversation history support, a response
+cache for identical requests, and token streaming. ``langchain_openai``
+is imported when the client is first created, not at import time.
 """
 
 import asyncio
 import logging
-import time
-from typing import Optional
-
-from langchain_openai import ChatOpenAI
-from langsmith import traceable
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Tuple
 
+from udemy_common import (
+    AsyncRateLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimitQueueFull,
+    RatePermit,
+    RetryPolicy,
+    estimate_message_tokens,
+    get_circuit_breaker,
+    get_rate_limiter,
+    current_run_tree,
+    limiter_key,
+    traceable,
+    usage_tokens,
+)
 from udemy_gpt.config import settings
 from udemy_gpt.exceptions import LLMError
+from udemy_gpt.services.response_cache import ResponseCache, make_cache_key
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 logger = logging.getLogger(__name__)
 
 # Global client instance
-_llm_client: Optional[ChatOpenAI] = None
+_llm_client: Optional["ChatOpenAI"] = None
+
+# Process-wide response cache shared by all LLMService instances
+_response_cache: Optional[ResponseCache] = None
 
 
-def get_client() -> ChatOpenAI:
+def get_client() -> "ChatOpenAI":
     """Get or create LLM client singleton.
 
     Returns:
@@ -40,35 +60,165 @@ def get_client() -> ChatOpenAI:
         except ValueError as e:
             raise LLMError(str(e))
 
+        from langchain_openai import ChatOpenAI
+
         _llm_client = ChatOpenAI(
             base_url=llm_settings.base_url,
             api_key=api_key,
             model=llm_settings.model,
+            stream_usage=True,
+            timeout=llm_settings.request_timeout,
+            # Retries are handled by LLMService's retry policy
+            max_retries=0,
         )
         logger.info(f"LLM client initialized: {llm_settings.model}")
 
     return _llm_client
 
 
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get or create the shared LLM response cache.
+
+    Returns:
+        ResponseCache instance, or None if caching is disabled
+    """
+    global _response_cache
+
+    llm_settings = settings.llm
+    if not llm_settings.cache_enabled:
+        return None
+
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            max_entries=llm_settings.cache_max_entries,
+            ttl=llm_settings.cache_ttl,
+            db_path=llm_settings.cache_db_path,
+        )
+    return _response_cache
+
+
+def get_llm_rate_limiter() -> AsyncRateLimiter:
+    """Get the process-wide rate limiter for the configured model.
+
+    The limiter is shared with every other LLM caller in the process
+    using the same endpoint and model (including ``udemy_agent``).
+
+    Returns:
+        Shared AsyncRateLimiter
+    """
+    llm_settings = settings.llm
+    return get_rate_limiter(
+        limiter_key(llm_settings.base_url, llm_settings.model),
+        requests_per_minute=llm_settings.requests_per_minute,
+        tokens_per_minute=llm_settings.tokens_per_minute,
+        max_queue=llm_settings.rate_limit_queue,
+    )
+
+
+def get_llm_circuit_breaker() -> CircuitBreaker:
+    """Get the process-wide circuit breaker for the configured model.
+
+    Returns:
+        Shared CircuitBreaker
+    """
+    llm_settings = settings.llm
+    return get_circuit_breaker(
+        limiter_key(llm_settings.base_url, llm_settings.model),
+        failure_threshold=llm_settings.circuit_failure_threshold,
+        reset_timeout=llm_settings.circuit_reset_timeout,
+    )
+
+
+def _record_cache_metadata(cache_hit: bool, cache_key: Optional[str]) -> None:
+    """Attach cache outcome to the current trace run, if tracing."""
+    run = current_run_tree()
+    if run is not None:
+        run.add_metadata({"cache_hit": cache_hit, "cache_key": cache_key})
+
+
 class LLMService:
-    """LLM service with rate limiting and retry logic.
+    """LLM service with rate limiting, retry logic and response caching.
 
     Provides a high-level interface for making LLM calls with
-    automatic rate limiting and retry on failures.
+    automatic rate limiting and retry on failures. Every attempt goes
+    through the process-wide rate limiter, so concurrent calls and
+    separate service instances share one request/token budget. Only
+    retryable errors (429, 5xx, timeouts) are retried, with jittered
+    backoff or the provider's Retry-After, and a shared circuit breaker
+    fails calls immediately while the provider is down. Identical
+    requests are answered from the response cache without touching the
+    rate limiter or the remote model.
     """
 
-    def __init__(self):
-        """Initialize the LLM service."""
-        self._last_call: float = 0
+    def __init__(self, cache: Optional[ResponseCache] = None):
+        """Initialize the LLM service.
+
+        Args:
+            cache: Response cache to use (defaults to the shared cache)
+        """
         self._llm_settings = settings.llm
+        self._cache = cache if cache is not None else get_response_cache()
+        self._limiter = get_llm_rate_limiter()
+        self._breaker = get_llm_circuit_breaker()
+        self._retry = RetryPolicy(
+            max_attempts=self._llm_settings.max_retries,
+            base_delay=self._llm_settings.retry_delay,
+            max_delay=self._llm_settings.retry_max_delay,
+        )
+
+    async def _rate_limit(self, messages: List[Dict[str, str]]) -> RatePermit:
+        """Wait until the shared rate limiter admits a request.
+
+        Args:
+            messages: Messages of the request (for the token estimate)
+
+        Returns:
+            Permit to settle with the real token usage
+
+        Raises:
+            LLMError: If too many calls are already waiting
+        """
+        tokens = estimate_message_tokens(messages) + self._llm_settings.completion_token_reserve
+        try:
+            return await self._limiter.acquire(tokens)
+        except RateLimitQueueFull as e:
+            raise LLMError(str(e))
+
+    def _build_messages(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        conversation_history: Optional[str],
+    ) -> List[Dict[str, str]]:
+        """Assemble the chat messages for a call."""
+        messages = [{"role": "system", "content": system_prompt}]
+
+        if conversation_history and settings.conversation.include_history_in_prompt:
+            messages.append({
+                "role": "system",
+                "content": f"Previous conversation:\n{conversation_history}"
+            })
+
+        messages.append({"role": "user", "content": user_prompt})
+        return messages
+
+    def _cache_lookup(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        use_cache: bool,
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Look up a request in the response cache.
 
-    async def _rate_limit(self) -> None:
-        """Apply rate limiting between calls."""
-        elapsed = time.time() - self._last_call
-        delay = self._llm_settings.rate_limit_delay
-        if elapsed < delay:
-            await asyncio.sleep(delay - elapsed)
-        self._last_call = time.time()
+        Returns:
+            Tuple of (cache key or None if not caching, cached response or None)
+        """
+        if not use_cache or self._cache is None:
+            return None, None
+        cache_key = make_cache_key(messages, model=self._llm_settings.model, temperature=temperature)
+        cached = self._cache.get(cache_key)
+        _record_cache_metadata(cached is not None, cache_key)
+        return cache_key, cached
 
     @traceable(name="llm_call", run_type="llm")
     async def call(
@@ -77,6 +227,7 @@ class LLMService:
         user_prompt: str,
         temperature: Optional[float] = None,
         conversation_history: Optional[str] = None,
+        use_cache: bool = True,
     ) -> str:
         """Make an LLM call with retry logic.
 
@@ -85,47 +236,133 @@ class LLMService:
             user_prompt: User message/query
             temperature: Sampling temperature (0-2)
             conversation_history: Optional previous conversation
+            use_cache: Whether to answer from and store in the response cache
 
         Returns:
             LLM response text
 
         Raises:
-            LLMError: If all retries fail
+            LLMError: If the call fails after retries, is not retryable,
+                or the circuit is open
         """
-        await self._rate_limit()
+        temp = temperature if temperature is not None else self._llm_settings.default_temperature
+        messages = self._build_messages(system_prompt, user_prompt, conversation_history)
+
+        cache_key, cached = self._cache_lookup(messages, temp, use_cache)
+        if cached is not None:
+            logger.debug("LLM response served from cache")
+            return cached
 
         llm = get_client()
+
+        async def attempt() -> str:
+            permit = await self._rate_limit(messages)
+            response = await llm.ainvoke(messages, temperature=temp)
+            permit.settle(usage_tokens(response))
+            return response.content
+
+        try:
+            content = await self._retry.call(attempt, self._breaker)
+        except CircuitOpenError as e:
+            logger.warning(f"LLM call skipped: {e}")
+            raise LLMError(f"LLM unavailable: {e}")
+        except LLMError:
+            raise
+        except Exception as e:
+            logger.error(f"LLM call failed: {e}")
+            raise LLMError(f"LLM call failed: {e}")
+
+        if cache_key is not None:
+            self._cache.put(cache_key, content)
+        return content
+
+    @traceable(name="llm_stream", run_type="llm", reduce_fn="".join)
+    async def astream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        conversation_history: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """Stream an LLM response as it is generated.
+
+        Retries only happen before the first chunk arrives; once text has
+        been yielded a failure is raised, since retrying would repeat it.
+        A cached response is yielded as a single chunk, and a completed
+        stream is stored in the cache like ``call`` does.
+
+        Args:
+            system_prompt: System message setting context
+            user_prompt: User message/query
+            temperature: Sampling temperature (0-2)
+            conversation_history: Optional previous conversation
+            use_cache: Whether to answer from and store in the response cache
+
+        Yields:
+            Response text chunks
+
+        Raises:
+            LLMError: If the call fails after retries, is not retryable,
+                the circuit is open, or the stream breaks mid-response
+        """
         temp = temperature if temperature is not None else self._llm_settings.default_temperature
+        messages = self._build_messages(system_prompt, user_prompt, conversation_history)
 
-        messages = [{"role": "system", "content": system_prompt}]
+        cache_key, cached = self._cache_lookup(messages, temp, use_cache)
+        if cached is not None:
+            logger.debug("LLM response served from cache")
+            yield cached
+            return
 
-        if conversation_history and settings.conversation.include_history_in_prompt:
-            messages.append({
-                "role": "system",
-                "content": f"Previous conversation:\n{conversation_history}"
-            })
+        llm = get_client()
 
-        messages.append({"role": "user", "content": user_prompt})
+        attempt = 0
+        delay = 0.0
+        while True:
+            try:
+                self._breaker.before_call()
+            except CircuitOpenError as e:
+                logger.warning(f"LLM stream skipped: {e}")
+                raise LLMError(f"LLM unavailable: {e}")
 
-        last_error = None
-        for attempt in range(self._llm_settings.max_retries):
             try:
-                response = await llm.ainvoke(messages, temperature=temp)
-                return response.content
+                permit = await self._rate_limit(messages)
+            except LLMError as e:
+                self._breaker.record_failure(e)
+                raise
+            parts: List[str] = []
+            used = None
+            try:
+                async for chunk in llm.astream(messages, temperature=temp):
+                    used = usage_tokens(chunk) or used
+                    if chunk.content:
+                        parts.append(chunk.content)
+                        yield chunk.content
             except Exception as e:
-                last_error = e
-                logger.warning(f"LLM call failed (attempt {attempt + 1}): {e}")
-                if attempt < self._llm_settings.max_retries - 1:
-                    await asyncio.sleep(
-                        self._llm_settings.retry_delay * (attempt + 1)
-                    )
+                self._breaker.record_failure(e)
+                if parts:
+                    logger.error(f"LLM stream failed mid-response: {e}")
+                    raise LLMError(f"LLM stream failed mid-response: {e}")
+                if not self._retry.should_retry(e, attempt):
+                    logger.error(f"LLM stream failed: {e}")
+                    raise LLMError(f"LLM call failed: {e}")
+                delay = self._retry.next_delay(e, delay)
+                logger.warning(f"LLM stream failed (attempt {attempt + 1}): {e}; retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
 
-        logger.error(f"All LLM retries failed: {last_error}")
-        raise LLMError(f"LLM call failed after {self._llm_settings.max_retries} attempts: {last_error}")
+            self._breaker.record_success()
+            permit.settle(used)
+            if cache_key is not None:
+                self._cache.put(cache_key, "".join(parts))
+            return
 
 
 def reset_client() -> None:
-    """Reset the LLM client (for testing or reconfiguration)."""
-    global _llm_client
+    """Reset the LLM client and response cache (for testing or reconfiguration)."""
+    global _llm_client, _response_cache
     _llm_client = None
+    _response_cache = None
     logger.info("LLM client reset")
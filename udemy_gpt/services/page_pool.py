@@ -0,0 +1,231 @@
+"""Bounded pool of warm browser pages.
+
+Opening a tab and applying stealth mode costs a few hundred milliseconds
+per fetch, and unbounded concurrent fetches open unbounded tabs. The pool
+keeps up to ``size`` pages: stealth is applied once when a page is
+created, idle pages are health-checked before reuse and reset to a blank
+document after use, and pages are recycled after ``max_uses``
+navigations so long-lived pages do not accumulate memory. At most
+``size`` pages are in use at once; further callers wait their turn.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
+
+logger = logging.getLogger(__name__)
+
+# Seconds an idle page gets to answer its health check
+_HEALTH_CHECK_TIMEOUT = 2.0
+
+
+class _PooledPage:
+    """A pooled page and its usage count."""
+
+    __slots__ = ("page", "uses", "created")
+
+    def __init__(self, page: "Page"):
+        self.page = page
+        self.uses = 0
+        self.created = time.monotonic()
+
+
+class PagePool:
+    """Pool of pre-stealthed pages on one browser context.
+
+    Example:
+        ```python
+        pool = PagePool(get_browser_context, size=3)
+        async with pool.page() as page:
+            await page.goto(url)
+        ```
+    """
+
+    def __init__(
+        self,
+        context_factory: Callable[[], Awaitable["BrowserContext"]],
+        size: int = 3,
+        max_uses: int = 20,
+        prepare: Optional[Callable[["Page"], Awaitable[Any]]] = None,
+    ):
+        """Initialize an empty pool.
+
+        Args:
+            context_factory: Coroutine returning the browser context pages
+                are opened in
+            size: Maximum pages (and concurrent users)
+            max_uses: Uses after which a page is closed and replaced
+                (0 = never)
+            prepare: Coroutine run once on each new page (e.g. stealth)
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self._context_factory = context_factory
+        self._prepare = prepare
+        self._idle: Deque[_PooledPage] = deque()
+        self._slots = asyncio.Semaphore(size)
+        self._closed = False
+
+        self.in_use = 0
+        self.waiting = 0
+        self.acquired = 0
+        self.created = 0
+        self.recycled = 0
+        self.discarded = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_hold = 0.0
+
+    async def _new_page(self) -> _PooledPage:
+        """Open and prepare a new page."""
+        context = await self._context_factory()
+        page = await context.new_page()
+        if self._prepare is not None:
+            await self._prepare(page)
+        self.created += 1
+        return _PooledPage(page)
+
+    async def _healthy(self, pooled: _PooledPage) -> bool:
+        """Check that an idle page is still usable."""
+        if pooled.page.is_closed():
+            return False
+        try:
+            await asyncio.wait_for(pooled.page.evaluate("1"), _HEALTH_CHECK_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+    async def _close_page(self, pooled: _PooledPage) -> None:
+        """Close a page, ignoring errors from a dead browser."""
+        with contextlib.suppress(Exception):
+            await pooled.page.close()
+
+    async def _checkout(self) -> _PooledPage:
+        """Get a healthy idle page or open a new one."""
+        while self._idle:
+            pooled = self._idle.popleft()
+            if await self._healthy(pooled):
+                return pooled
+            self.discarded += 1
+            logger.debug("Discarded unhealthy pooled page")
+            await self._close_page(pooled)
+        return await self._new_page()
+
+    async def _checkin(self, pooled: _PooledPage, failed: bool) -> None:
+        """Return a page to the pool, or close it if it is spent or broken."""
+        pooled.uses += 1
+        if self._closed or failed:
+            self.discarded += 1
+            await self._close_page(pooled)
+            return
+        if self.max_uses and pooled.uses >= self.max_uses:
+            self.recycled += 1
+            logger.debug(f"Recycling page after {pooled.uses} uses")
+            await self._close_page(pooled)
+            return
+        try:
+            # Drop the previous document so idle pages hold no page state
+            await pooled.page.goto("about:blank")
+        except Exception:
+            self.discarded += 1
+            await self._close_page(pooled)
+            return
+        self._idle.append(pooled)
+
+    @contextlib.asynccontextmanager
+    async def page(self) -> AsyncIterator["Page"]:
+        """Borrow a page for the duration of the context.
+
+        A page whose user raised an exception is closed rather than
+        returned to the pool.
+
+        Yields:
+            Ready-to-use page with stealth applied
+
+        Raises:
+            RuntimeError: If the pool is closed
+        """
+        if self._closed:
+            raise RuntimeError("Page pool is closed")
+
+        start = time.monotonic()
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        waited = time.monotonic() - start
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        if waited > 0.1:
+            logger.debug(f"Waited {waited:.2f}s for a browser page")
+
+        try:
+            pooled = await self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self.in_use += 1
+        self.acquired += 1
+        borrowed = time.monotonic()
+        failed = True
+        try:
+            yield pooled.page
+            failed = False
+        finally:
+            self.in_use -= 1
+            self.total_hold += time.monotonic() - borrowed
+            try:
+                await self._checkin(pooled, failed)
+            finally:
+                self._slots.release()
+
+    async def warm(self, count: Optional[int] = None) -> int:
+        """Open idle pages ahead of demand.
+
+        Args:
+            count: Pages to have idle (defaults to the pool size)
+
+        Returns:
+            Number of pages opened
+        """
+        target = min(self.size, count if count is not None else self.size)
+        opened = 0
+        while not self._closed and len(self._idle) + self.in_use < target:
+            self._idle.append(await self._new_page())
+            opened += 1
+        return opened
+
+    async def close(self) -> None:
+        """Close idle pages; pages in use are closed when returned."""
+        self._closed = True
+        while self._idle:
+            await self._close_page(self._idle.popleft())
+
+    def stats(self) -> Dict[str, Any]:
+        """Get pool occupancy and acquire/release metrics.
+
+        Returns:
+            Dictionary with page counts, page lifecycle counters and wait
+            and hold times
+        """
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "created": self.created,
+            "recycled": self.recycled,
+            "discarded": self.discarded,
+            "avg_wait": self.total_wait / self.acquired if self.acquired else 0.0,
+            "max_wait": self.max_wait,
+            "avg_hold": self.total_hold / self.acquired if self.acquired else 0.0,
+        }
@@ -0,0 +1,165 @@
+"""Content-addressed cache of LLM responses.
+
+Responses are keyed on a hash of the full message list and the call
+parameters (model, temperature). An in-memory LRU answers repeated calls
+within a process; an optional SQLite tier keeps responses across restarts
+and between processes. Entries older than the TTL are ignored and dropped.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(messages: List[Dict[str, str]], **params: Any) -> str:
+    """Compute the cache key for an LLM request.
+
+    Args:
+        messages: Full message list sent to the model
+        **params: Call parameters affecting the response (model, temperature)
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON request
+    """
+    payload = json.dumps({"messages": messages, "params": params}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """LRU response cache with TTL and an optional SQLite tier."""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl: float = 3600.0,
+        db_path: Optional[Path] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum responses kept in memory
+            ttl: Seconds a response stays valid (0 = no expiry)
+            db_path: Optional SQLite file for the persistent tier
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            try:
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key TEXT PRIMARY KEY, created REAL NOT NULL, response TEXT NOT NULL)"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM response cache disk tier disabled ({db_path}): {e}")
+                self._db = None
+
+    def _expired(self, created: float) -> bool:
+        """Check whether an entry created at ``created`` is past its TTL."""
+        return self.ttl > 0 and time.time() - created > self.ttl
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from ``make_cache_key``
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._memory[key]
+
+            if self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT created, response FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        if not self._expired(row[0]):
+                            self._remember(key, row[0], row[1])
+                            self.hits += 1
+                            self.disk_hits += 1
+                            return row[1]
+                        self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                        self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"LLM response cache read failed: {e}")
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from ``make_cache_key``
+            response: Response text
+        """
+        created = time.time()
+        with self._lock:
+            self._remember(key, created, response)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO responses (key, created, response) VALUES (?, ?, ?)",
+                        (key, created, response),
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"LLM response cache write failed: {e}")
+
+    def _remember(self, key: str, created: float, response: str) -> None:
+        """Insert into the memory tier, evicting the least recently used."""
+        self._memory[key] = (created, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM responses")
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"LLM response cache clear failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache occupancy and counters.
+
+        Returns:
+            Dictionary with in-memory entry count and hit/miss counters
+        """
+        return {
+            "entries": len(self._memory),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
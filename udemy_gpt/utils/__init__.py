@@ -5,13 +5,18 @@ Provides parsing and formatting utilities used throughout the application.
 
 from udemy_gpt.utils.parsers import (
     extract_json,
+    extract_filters_from_text,
     parse_filters,
     parse_rating,
     parse_duration,
 )
 from udemy_gpt.utils.formatters import (
+    COURSE_CONTEXT_COLUMNS,
+    build_course_context,
     describe_filters,
+    estimate_tokens,
     format_conversation_context,
+    format_course_row,
     format_courses_for_llm,
     format_live_details,
     format_kb_details,
@@ -21,12 +26,17 @@ from udemy_gpt.utils.formatters import (
 __all__ = [
     # Parsers
     "extract_json",
+    "extract_filters_from_text",
     "parse_filters",
     "parse_rating",
     "parse_duration",
     # Formatters
+    "COURSE_CONTEXT_COLUMNS",
+    "build_course_context",
     "describe_filters",
+    "estimate_tokens",
     "format_conversation_context",
+    "format_course_row",
     "format_courses_for_llm",
     "format_live_details",
     "format_kb_details",
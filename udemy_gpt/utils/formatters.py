@@ -3,11 +3,31 @@
 Provides functions to format course data for LLM context and user display.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from udemy_gpt.utils.parsers import parse_rating, parse_duration
+from udemy_gpt.data import repository, searchable_text
 from udemy_gpt.models import CourseDetails
 
+# Columns of the compact course table used as LLM context
+COURSE_CONTEXT_COLUMNS = (
+    "rank", "title", "url", "instructor", "rating", "reviews",
+    "price", "hours", "level", "bestseller", "topic",
+)
+
+# How each ranking criterion is described to the model and the user
+SORT_DESCRIPTIONS = {
+    "rating": "rating and reviews",
+    "reviews": "number of reviews",
+    "price": "lowest price",
+    "price_desc": "highest price",
+    "duration": "longest duration",
+    "duration_asc": "shortest duration",
+}
+
+# Titles longer than this are cut in the compact table
+_CONTEXT_TITLE_CHARS = 120
+
 
 def describe_filters(filters: Dict) -> str:
     """Create human-readable filter description.
@@ -36,6 +56,8 @@ def describe_filters(filters: Dict) -> str:
         parts.append("free only")
     if filters.get("limit"):
         parts.append(f"top {filters['limit']}")
+    if filters.get("sort_by"):
+        parts.append(f"sorted by {SORT_DESCRIPTIONS.get(filters['sort_by'], filters['sort_by'])}")
 
     return ", ".join(parts) if parts else "None"
 
@@ -106,6 +128,103 @@ def format_courses_for_llm(courses: List[Dict]) -> str:
     return text
 
 
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a prompt fragment.
+
+    Uses the usual four-characters-per-token approximation, which is
+    close enough for budgeting and needs no tokenizer.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Estimated token count
+    """
+    return (len(text) + 3) // 4
+
+
+def format_course_row(course: Dict, rank: int) -> str:
+    """Format a course as one tab-separated line.
+
+    Fields follow ``COURSE_CONTEXT_COLUMNS``. The listing card text
+    glued onto scraped titles is dropped and long titles are cut.
+
+    Args:
+        course: Course dictionary
+        rank: 1-based position of the course
+
+    Returns:
+        Tab-separated course line
+    """
+    title = searchable_text(str(course.get("title", "Unknown"))).strip()
+    if len(title) > _CONTEXT_TITLE_CHARS:
+        title = title[:_CONTEXT_TITLE_CHARS].rstrip() + "..."
+    price = repository.parse_price(str(course.get("price", "")))
+    bestseller = str(course.get("bestseller", "")).lower() in ("true", "yes", "1")
+
+    fields = [
+        str(rank),
+        title,
+        course.get("url", ""),
+        searchable_text(str(course.get("instructor", ""))).strip(),
+        f"{repository.parse_rating(str(course.get('rating', ''))):.1f}",
+        str(repository.parse_number(str(course.get("reviews_count", "0")))),
+        "free" if price == 0 else f"${price:.2f}",
+        f"{repository.parse_duration(str(course.get('duration', ''))):g}",
+        course.get("level", ""),
+        "yes" if bestseller else "no",
+        course.get("topic", ""),
+    ]
+    return "\t".join(" ".join(str(field).split()) for field in fields)
+
+
+def build_course_context(
+    courses: Sequence[Dict],
+    token_budget: int,
+    total: Optional[int] = None,
+    sort_by: str = "rating",
+) -> Tuple[str, int]:
+    """Pack ranked courses into a compact table within a token budget.
+
+    Courses must already be ranked best first. Rows are added in order
+    until the next one would exceed the budget (the first row is always
+    included), and a closing note tells the model how many matching
+    courses were left out.
+
+    Args:
+        courses: Ranked course dictionaries
+        token_budget: Maximum estimated tokens for the table
+        total: Number of matching courses before ranking (defaults to
+            ``len(courses)``)
+        sort_by: Criterion the courses were ranked by, named in the note
+
+    Returns:
+        Tuple of (context text, number of courses included)
+    """
+    total = len(courses) if total is None else total
+    if not courses:
+        return "No courses found.", 0
+
+    lines = ["\t".join(COURSE_CONTEXT_COLUMNS)]
+    used = estimate_tokens(lines[0])
+    for rank, course in enumerate(courses, 1):
+        row = format_course_row(course, rank)
+        cost = estimate_tokens(row) + 1
+        if rank > 1 and used + cost > token_budget:
+            break
+        lines.append(row)
+        used += cost
+
+    shown = len(lines) - 1
+    if shown < total:
+        lines.append(
+            f"(Showing the top {shown} of {total} matching courses, "
+            f"ranked by {SORT_DESCRIPTIONS.get(sort_by, SORT_DESCRIPTIONS['rating'])}; "
+            f"{total - shown} not listed.)"
+        )
+    return "\n".join(lines), shown
+
+
 def format_live_details(details: CourseDetails) -> str:
     """Format live course details in markdown.
 
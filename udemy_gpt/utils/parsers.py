@@ -1,7 +1,40 @@
 """Parsing utilities for LLM responses and user input."""
 
+import re
 from typing import Any, Dict
 
+from udemy_gpt.data.course_store import SORT_KEYS
+
+# Filter phrases recognized directly in user messages
+_RATING_RE = re.compile(
+    r"(?:rat(?:ing|ed)\s*(?:of\s*|above\s*|over\s*|at\s+least\s*)?(\d(?:\.\d)?)\s*\+?)"
+    r"|(?:(\d\.\d)\s*\+|(\d(?:\.\d)?)\s*\+?\s*stars?)"
+)
+_MAX_PRICE_RE = re.compile(
+    r"(?:under|below|less\s+than|cheaper\s+than|up\s+to|max(?:imum)?|within)\s*\$\s*(\d+(?:\.\d+)?)"
+    r"|\$\s*(\d+(?:\.\d+)?)\s*(?:or\s+less|max)"
+)
+_MAX_DURATION_RE = re.compile(
+    r"(?:under|below|less\s+than|up\s+to|max(?:imum)?|within|shorter\s+than)\s*"
+    r"(\d+(?:\.\d+)?)\s*(?:h|hrs?|hours?)\b"
+)
+_MIN_DURATION_RE = re.compile(
+    r"(?:over|above|more\s+than|at\s+least|min(?:imum)?|longer\s+than)\s*"
+    r"(\d+(?:\.\d+)?)\s*(?:h|hrs?|hours?)\b"
+)
+_LIMIT_RE = re.compile(r"\b(?:top|best|first)\s+(\d{1,3})\b|\b(\d{1,3})\s+(?:best\s+|top\s+|good\s+)?courses\b")
+_LEVEL_RE = re.compile(r"\b(beginners?|intermediate|advanced|all\s+levels)\b")
+_SORT_BY = r"\b(?:sort(?:ed)?|order(?:ed)?|rank(?:ed)?)\s+(?:them\s+)?by\s+(?:the\s+)?"
+# Sort phrases mapped to ranking criteria, most specific first
+_SORT_PHRASES = (
+    ("price_desc", re.compile(r"\b(?:most\s+expensive|priciest|highest[\s-]price)|" + _SORT_BY + r"highest\s+price")),
+    ("price", re.compile(r"\b(?:cheapest|least\s+expensive|most\s+affordable|lowest[\s-]price)|" + _SORT_BY + r"(?:lowest\s+)?(?:price|cost)")),
+    ("reviews", re.compile(r"\b(?:most\s+(?:popular|reviewed|reviews|students))|" + _SORT_BY + r"(?:popularity|reviews|students)")),
+    ("duration_asc", re.compile(r"\b(?:shortest|quickest)\b|" + _SORT_BY + r"shortest")),
+    ("duration", re.compile(r"\b(?:longest|most\s+hours)\b|" + _SORT_BY + r"(?:duration|length|hours)")),
+    ("rating", re.compile(_SORT_BY + r"(?:rating|ratings|stars)")),
+)
+
 
 def extract_json(response: str) -> str:
     """Extract JSON from LLM response.
@@ -58,9 +91,69 @@ def parse_filters(raw_filters: Dict) -> Dict[str, Any]:
     if raw_filters.get("is_free") is not None:
         filters["is_free"] = bool(raw_filters["is_free"])
 
+    # Ranking criterion
+    sort_by = str(raw_filters.get("sort_by") or "").lower()
+    if sort_by in SORT_KEYS:
+        filters["sort_by"] = sort_by
+
     return filters
 
 
+def extract_filters_from_text(message: str) -> Dict[str, Any]:
+    """Extract search filters stated directly in a user message.
+
+    Recognizes the phrasings listed in the intent prompt ("4.5+",
+    "under $50", "free", "under 5h", "short", "beginner", "top 10",
+    "cheapest", "most popular") and validates the result with
+    ``parse_filters``.
+
+    Args:
+        message: User message
+
+    Returns:
+        Validated filter dictionary
+    """
+    text = message.lower()
+    raw: Dict[str, Any] = {}
+
+    match = _RATING_RE.search(text)
+    if match:
+        raw["min_rating"] = next(group for group in match.groups() if group)
+    elif re.search(r"\b(?:highly|top)[\s-]rated\b", text):
+        raw["min_rating"] = 4.5
+
+    match = _MAX_PRICE_RE.search(text)
+    if match:
+        raw["max_price"] = next(group for group in match.groups() if group)
+    if re.search(r"\bfree\b", text) and not re.search(r"\bfree\s+(?:time|of)\b", text):
+        raw["is_free"] = True
+
+    match = _MAX_DURATION_RE.search(text)
+    if match:
+        raw["max_duration"] = match.group(1)
+    elif re.search(r"\bshort\b", text):
+        raw["max_duration"] = 5
+    match = _MIN_DURATION_RE.search(text)
+    if match:
+        raw["min_duration"] = match.group(1)
+
+    match = _LEVEL_RE.search(text)
+    if match:
+        level = match.group(1)
+        raw["level"] = "all levels" if level.startswith("all") else level.rstrip("s")
+
+    match = _LIMIT_RE.search(text)
+    if match:
+        raw["limit"] = next(group for group in match.groups() if group)
+
+    for sort_by, pattern in _SORT_PHRASES:
+        if pattern.search(text):
+            raw["sort_by"] = sort_by
+            break
+
+    return parse_filters(raw)
+
+
 def parse_rating(value: str) -> float:
     """Parse rating string to float.
 
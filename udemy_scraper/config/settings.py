@@ -62,6 +62,9 @@ class BrowserSettings(BaseSettings):
     )
     viewport_width: int = Field(default=1920, ge=800)
     viewport_height: int = Field(default=1080, ge=600)
+    block_resources: bool = Field(default=True)
+    blocked_resource_types: str = Field(default="image,media,font")
+    allowed_hosts: str = Field(default="udemy.com,udemycdn.com,cloudflare.com")
 
     class Config:
         env_prefix = "BROWSER_"
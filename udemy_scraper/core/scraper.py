@@ -1,9 +1,7 @@
 """Main scraper orchestrator."""
 
 import asyncio
-from typing import List
-
-from playwright.async_api import Page
+from typing import TYPE_CHECKING, List
 
 from udemy_scraper.config import get_scraper_settings
 from udemy_scraper.data import CourseWriter, TopicRepository
@@ -11,6 +9,9 @@ from udemy_scraper.exceptions import CloudflareBlockedError
 from udemy_scraper.models import ScrapedCourse, ScrapeResult, ScrapeSummary, Topic
 from udemy_scraper.services import BrowserService, ExtractionService
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class UdemyScraper:
     """Orchestrates scraping of Udemy course listings."""
@@ -28,7 +29,7 @@ class UdemyScraper:
         self._extractor = extraction_service or ExtractionService()
         self._scraper_settings = get_scraper_settings()
 
-    async def scrape_topic(self, page: Page, topic: Topic) -> ScrapeResult:
+    async def scrape_topic(self, page: "Page", topic: Topic) -> ScrapeResult:
         """Scrape courses from a single topic.
 
         Args:
@@ -1,27 +1,19 @@
-"""Browser automation service for Udemy scraping."""
+"""Browser automation service for Udemy scraping.
+
+Playwright is imported when the browser is first started, not at
+import time.
+"""
 
 import asyncio
 import random
-from typing import Optional
-
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from typing import TYPE_CHECKING, Optional
 
 from udemy_scraper.config import get_browser_settings, get_scraper_settings
 from udemy_scraper.exceptions import BrowserError, CloudflareBlockedError
+from udemy_common.browser import ResourceBlocker, apply_stealth
 
-# Stealth mode detection
-try:
-    from playwright_stealth import Stealth
-    _stealth_instance = Stealth()
-    STEALTH_AVAILABLE = True
-except ImportError:
-    try:
-        from playwright_stealth import stealth_async
-        _stealth_instance = None
-        STEALTH_AVAILABLE = True
-    except ImportError:
-        STEALTH_AVAILABLE = False
-        _stealth_instance = None
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
 
 
 class BrowserService:
@@ -29,16 +21,19 @@ class BrowserService:
 
     def __init__(self):
         self._playwright = None
-        self._browser: Optional[Browser] = None
-        self._context: Optional[BrowserContext] = None
+        self._browser: Optional["Browser"] = None
+        self._context: Optional["BrowserContext"] = None
         self._browser_settings = get_browser_settings()
         self._scraper_settings = get_scraper_settings()
+        self._blocker = ResourceBlocker.from_settings(self._browser_settings)
 
-    async def start(self) -> BrowserContext:
+    async def start(self) -> "BrowserContext":
         """Start browser and create context."""
         if self._browser is not None:
             return self._context
 
+        from playwright.async_api import async_playwright
+
         self._playwright = await async_playwright().start()
         self._browser = await self._playwright.chromium.launch(
             headless=self._browser_settings.headless,
@@ -69,29 +64,23 @@ class BrowserService:
         self._browser = None
         self._playwright = None
 
-    async def new_page(self) -> Page:
-        """Create a new page with stealth mode applied."""
+    @property
+    def resource_blocker(self) -> Optional[ResourceBlocker]:
+        """Request blocking policy applied to new pages (None if disabled)."""
+        return self._blocker
+
+    async def new_page(self) -> "Page":
+        """Create a new page with stealth mode and request blocking applied."""
         if self._context is None:
             await self.start()
 
         page = await self._context.new_page()
-        await self._apply_stealth(page)
+        await apply_stealth(page)
+        if self._blocker is not None:
+            await self._blocker.attach(page)
         return page
 
-    async def _apply_stealth(self, page: Page):
-        """Apply stealth mode to page if available."""
-        if not STEALTH_AVAILABLE:
-            return
-
-        try:
-            if _stealth_instance:
-                await _stealth_instance.apply_stealth_async(page)
-            else:
-                await stealth_async(page)
-        except Exception:
-            pass
-
-    async def wait_cloudflare(self, page: Page, max_wait: Optional[int] = None) -> bool:
+    async def wait_cloudflare(self, page: "Page", max_wait: Optional[int] = None) -> bool:
         """Wait for Cloudflare challenge to resolve.
 
         Args:
@@ -122,7 +111,7 @@ class BrowserService:
 
     async def scroll_page(
         self,
-        page: Page,
+        page: "Page",
         iterations: Optional[int] = None,
         scroll_amount: Optional[int] = None
     ):
@@ -140,7 +129,7 @@ class BrowserService:
         await page.evaluate("window.scrollBy(0, -300)")
         await asyncio.sleep(0.5)
 
-    async def navigate(self, page: Page, url: str, wait_until: str = "domcontentloaded"):
+    async def navigate(self, page: "Page", url: str, wait_until: str = "domcontentloaded"):
         """Navigate to URL with timeout handling."""
         try:
             await page.goto(
@@ -151,7 +140,7 @@ class BrowserService:
         except Exception as e:
             raise BrowserError(f"Navigation failed: {e}")
 
-    async def scroll_to_pagination(self, page: Page):
+    async def scroll_to_pagination(self, page: "Page"):
         """Scroll pagination element into view."""
         await page.evaluate("""
             () => {
@@ -164,7 +153,7 @@ class BrowserService:
         """)
         await asyncio.sleep(1)
 
-    async def click_page_2(self, page: Page, topic_url: str) -> bool:
+    async def click_page_2(self, page: "Page", topic_url: str) -> bool:
         """Navigate to page 2 of results.
 
         Returns:
@@ -1,11 +1,11 @@
 """Course extraction service for scraping page content."""
 
-from typing import List, Dict
-
-from playwright.async_api import Page
+from typing import TYPE_CHECKING, Dict, List
 
 from udemy_scraper.models import ScrapedCourse
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 # JavaScript extraction code
 EXTRACTION_JS = """
@@ -102,7 +102,7 @@ EXTRACTION_JS = """
 class ExtractionService:
     """Extracts course data from page DOM."""
 
-    async def extract_courses(self, page: Page) -> List[ScrapedCourse]:
+    async def extract_courses(self, page: "Page") -> List[ScrapedCourse]:
         """Extract course data directly from page DOM.
 
         Args: